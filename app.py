@@ -5,9 +5,11 @@ Main Streamlit Application
 
 import streamlit as st
 import os
+import gc
+import logging
+import asyncio
+import hashlib
 from dotenv import load_dotenv
-import pandas as pd
-import plotly.graph_objects as go
 from datetime import datetime
 
 # Load environment variables
@@ -17,9 +19,13 @@ load_dotenv()
 from config.settings import Config
 from core.gpt5_client import GPT5Client
 from modules.file_processor import FileProcessor
-from research.literature_review import LiteratureReviewGenerator
-from research.citation_manager import CitationManager
-from ui.visualizations import ResearchVisualizations
+from utils.helpers import Helpers
+
+# Logging is configured by the app, not by the library modules it imports;
+# keep the SDK's per-request chatter out of the logs
+logging.basicConfig(level=logging.DEBUG if Config.DEBUG_MODE else logging.INFO)
+logging.getLogger("openai").setLevel(logging.WARNING)
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
 # Page configuration
 st.set_page_config(
@@ -29,64 +35,191 @@ st.set_page_config(
     initial_sidebar_state=Config.INITIAL_SIDEBAR_STATE
 )
 
+@st.cache_resource
+def load_custom_css() -> str:
+    """Read the custom stylesheet once per process instead of on every rerun"""
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "ui", "styles.css"), encoding="utf-8") as f:
+        return f"<style>\n{f.read()}</style>"
+
 # Custom CSS for better UI
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 3rem;
-        font-weight: bold;
-        color: #1E3A8A;
-        text-align: center;
-        margin-bottom: 1rem;
-    }
-    .sub-header {
-        font-size: 1.2rem;
-        color: #64748B;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .feature-card {
-        background-color: #F8FAFC;
-        padding: 1.5rem;
-        border-radius: 0.5rem;
-        border: 1px solid #E2E8F0;
-        margin-bottom: 1rem;
-    }
-    .success-box {
-        background-color: #10B981;
-        color: white;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 1rem 0;
-    }
-    .info-box {
-        background-color: #3B82F6;
-        color: white;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 1rem 0;
+st.markdown(load_custom_css(), unsafe_allow_html=True)
+
+# Fields a source needs before a citation can be generated
+REQUIRED_CITATION_FIELDS = ("authors", "title", "year")
+
+# Static help text for the citation management sidebar column
+_CITATION_HELP_MD = """
+### Citation Operations
+
+- **Extract Citations**: Find citations in academic text
+- **Format Bibliography**: Generate formatted reference lists
+- **Generate Citations**: Create proper citations for sources
+- **Citation Analysis**: Analyze citation patterns and networks
+
+### Supported Formats
+
+- **APA 7th**: American Psychological Association
+- **MLA 9th**: Modern Language Association
+- **Chicago 17th**: Chicago Manual of Style
+- **IEEE**: Institute of Electrical and Electronics Engineers
+- **Harvard**: Harvard referencing system
+"""
+
+# Static footer markup
+_FOOTER_HTML = """
+<div style="text-align: center; color: #64748B; padding: 2rem;">
+    <p>🚀 Powered by Advanced AI Technology | Built for Researchers & Academics</p>
+    <p>© 2025 IntelliDoc Research Pro | Version 1.0.0</p>
+</div>
+"""
+
+@st.cache_resource
+def get_visualizations():
+    """Import the plotting stack only when the visualizations tab needs it"""
+    from ui.visualizations import ResearchVisualizations
+    return ResearchVisualizations()
+
+@st.cache_resource
+def get_review_generator(api_key: str, _client: GPT5Client):
+    """Build one LiteratureReviewGenerator per API key; the client itself is not hashed"""
+    from research.literature_review import LiteratureReviewGenerator
+    return LiteratureReviewGenerator(_client)
+
+@st.cache_resource
+def get_gap_finder(api_key: str, _client: GPT5Client):
+    """Build one ResearchGapFinder per API key; the client itself is not hashed"""
+    from research.research_gap_finder import ResearchGapFinder
+    return ResearchGapFinder(_client)
+
+@st.cache_resource
+def get_citation_manager():
+    """Share a single CitationManager across reruns and sessions"""
+    from research.citation_manager import CitationManager
+    return CitationManager()
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def get_review_figures(review_key: str) -> dict:
+    """
+    Build the literature review figures once per review and share the objects across reruns
+
+    Kept as go.Figure rather than dicts: st.plotly_chart re-validates a dict
+    spec through a new go.Figure on every render, while an already-built
+    figure is only serialized. st.plotly_chart does not mutate the figures.
+    """
+    viz = get_visualizations()
+    return {
+        "themes": viz.create_theme_distribution({}),
+        "timeline": viz.create_research_timeline([]),
+        "citations": viz.create_citation_network([])
     }
-</style>
-""", unsafe_allow_html=True)
+
+@st.cache_resource
+def get_gpt5_client(api_key: str) -> GPT5Client:
+    """Build one GPT5Client per API key and reuse it across reruns"""
+    return GPT5Client(api_key)
 
 # Initialize session state
-if 'gpt5_client' not in st.session_state:
-    api_key = os.getenv('COMET_API_KEY', '')
-    if not api_key:
-        # Fallback to AI/ML API if available
-        api_key = os.getenv('AIMLAPI_KEY', '')
-
-    if api_key:
-        st.session_state.gpt5_client = GPT5Client(api_key)
-    else:
-        st.session_state.gpt5_client = None
+# Keys are resolved once when Config is imported, not on every rerun;
+# fall back to AI/ML API if no Comet key is set
+api_key = Config.COMET_API_KEY or Config.AIMLAPI_KEY
+
+try:
+    _CONFIG_VALIDATED = Config.validate()
+except ValueError:
+    _CONFIG_VALIDATED = False
+
+# The client is a process-wide cached resource, so every session and rerun
+# shares one connection pool per API key
+gpt5_client = get_gpt5_client(api_key) if _CONFIG_VALIDATED else None
 
 if 'processed_files' not in st.session_state:
     st.session_state.processed_files = []
 
+# File ids each uploader last processed, so reruns do not parse the same uploads again
+if 'upload_ids' not in st.session_state:
+    st.session_state.upload_ids = {}
+
 if 'analysis_results' not in st.session_state:
     st.session_state.analysis_results = {}
 
+@st.cache_data(show_spinner=False, ttl=3600)
+def _prune_text_store(storage_dir: str) -> int:
+    """Delete stale extracted texts; the cache TTL runs this at most hourly per process"""
+    return FileProcessor.prune_text_store(storage_dir, Config.TEXT_STORE_TTL)
+
+def _persist_processed(processed: dict) -> dict:
+    """Write a processed file's text to the shared text store and return its metadata"""
+    os.makedirs(Config.TEXT_STORE_PATH, exist_ok=True)
+    _prune_text_store(Config.TEXT_STORE_PATH)
+    return FileProcessor.persist_processed(processed, Config.TEXT_STORE_PATH)
+
+def _uploads_changed(uploaded_files: list, uploader: str) -> bool:
+    """Return whether an uploader holds files it has not processed yet, and mark them processed"""
+    file_ids = [f.file_id for f in uploaded_files]
+    if st.session_state.upload_ids.get(uploader) == file_ids:
+        return False
+    st.session_state.upload_ids[uploader] = file_ids
+    return True
+
+def _retain_processed_files():
+    """Keep this session's texts in the text store, forgetting any that were pruned while it was idle"""
+    retained = FileProcessor.retain_persisted(st.session_state.processed_files)
+    expired = len(st.session_state.processed_files) - len(retained)
+    if expired:
+        st.session_state.processed_files = retained
+        # Uploaders still holding the files process them again
+        st.session_state.upload_ids = {}
+        st.warning(f"⚠️ {expired} processed files expired from the text store; please upload them again")
+
+def _store_result(name: str, result: dict, drop: tuple = ("success",)):
+    """Keep an analysis result in session state without redundant fields"""
+    st.session_state.analysis_results[name] = {k: v for k, v in result.items() if k not in drop}
+
+def _load_papers(processed_files: list) -> list:
+    """Rehydrate processed file metadata with its text for an LLM call"""
+    return [{**p, "content": FileProcessor.load_content(p)} for p in processed_files]
+
+def _render_review(review_gen, papers: list, research_question: str, review_settings: dict):
+    """Stream a literature review over (summarized) papers and store the result"""
+    # Stream the review so text appears as soon as the first tokens arrive
+    st.markdown("### Generated Literature Review")
+    try:
+        review_text = st.write_stream(review_gen.stream_review(
+            papers=papers,
+            research_question=research_question,
+            review_settings=review_settings
+        ))
+        result = review_gen.build_review_result(
+            review_text,
+            papers,
+            research_question,
+            review_settings
+        )
+    except Exception as e:
+        result = {"success": False, "error": str(e)}
+
+    if result["success"]:
+        # Sections are re-derivable from full_review, so only the text is kept
+        _store_result("literature_review", result, drop=("success", "sections"))
+        gc.collect()
+        st.success("✅ Literature review generated successfully!")
+
+        # Show metadata
+        st.info(f"📊 Analyzed {result['paper_count']} papers | "
+               f"Word count: {result['metadata']['total_words']}")
+    else:
+        st.error(f"Error: {result.get('error', 'Unknown error')}")
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_analyze_citations(paper_hashes: tuple, api_key: str, _client: GPT5Client, _papers: list) -> dict:
+    """Analyze citations once per set of paper contents; failures are not cached"""
+    # Pull each paper's reference list concurrently, then analyze them together
+    references = asyncio.run(_client.aextract_references(list(FileProcessor.iter_contents(_papers))))
+    result = _client.analyze_citations(papers=references)
+    if not result["success"]:
+        raise RuntimeError(result.get("error", "Unknown error"))
+    return result
+
 # Header
 st.markdown('<p class="main-header">🔬 IntelliDoc Research Pro</p>', unsafe_allow_html=True)
 st.markdown('<p class="sub-header">AI-Powered Document Intelligence Platform with GPT-5-nano</p>', unsafe_allow_html=True)
@@ -131,12 +264,13 @@ with st.sidebar:
     # Quick Actions
     st.subheader("Quick Actions")
     if st.button("🔄 Clear All Data", type="secondary"):
-        st.session_state.processed_files = []
-        st.session_state.analysis_results = {}
+        st.session_state.update({"processed_files": [], "upload_ids": {}, "analysis_results": {}, "review_batch": None})
         st.rerun()
 
+_retain_processed_files()
+
 # Main Content Area
-if not st.session_state.gpt5_client:
+if not gpt5_client:
     st.divider()
     st.subheader("🎯 Key Features")
 
@@ -180,20 +314,26 @@ else:
             uploaded_files = st.file_uploader(
                 "Select PDF files",
                 type=['pdf', 'txt', 'docx'],
+                max_upload_size=Config.MAX_FILE_SIZE_MB,
                 accept_multiple_files=True,
                 help="Upload research papers for literature review"
             )
 
             if uploaded_files:
-                with st.spinner("Processing files..."):
-                    processed = FileProcessor.process_uploaded_files(uploaded_files)
-                    st.session_state.processed_files = processed
+                if _uploads_changed(uploaded_files, "review"):
+                    with st.spinner("Processing files..."):
+                        processed = [_persist_processed(p) for p in FileProcessor.process_uploaded_files(uploaded_files)]
+                        st.session_state.processed_files = processed
+                        # Free the parsing buffers once per new upload, not on every rerun
+                        gc.collect()
+                processed = st.session_state.processed_files
 
                 st.success(f"✅ Processed {len(processed)} files successfully")
 
                 # Show file info
                 for file in processed:
-                    st.write(f"📄 **{file['filename']}** ({file['size']:.2f} MB)")
+                    st.write(f"📄 **{file['filename']}** ({file['size']:.2f} MB, "
+                             f"{file.get('word_count', 0):,} words, ~{file.get('token_count', 0):,} tokens)")
 
         with tab2:
             st.subheader("Generate Literature Review")
@@ -211,42 +351,76 @@ else:
                 with col2:
                     include_future = st.checkbox("Suggest Future Research", value=True)
 
-                if st.button("🚀 Generate Literature Review", type="primary"):
-                    if research_question:
-                        with st.spinner("Generating comprehensive literature review with GPT-5..."):
-                            # Create review generator
-                            review_gen = LiteratureReviewGenerator(st.session_state.gpt5_client)
+                # Large reviews can trade latency for cost by summarizing through the Batch API
+                run_as_batch = len(st.session_state.processed_files) > 5 and st.checkbox(
+                    "Run as batch (50% cheaper, up to 24h)",
+                    help="Paper summaries are submitted as a batch job; check back later to write the review"
+                )
 
-                            # Generate review
-                            result = review_gen.generate_review(
-                                papers=st.session_state.processed_files,
-                                research_question=research_question,
-                                review_settings={
+                if st.button("🚀 Generate Literature Review", type="primary"):
+                    if research_question and run_as_batch:
+                        papers = _load_papers(st.session_state.processed_files)
+                        submission = gpt5_client.submit_summary_batch(
+                            [p['content'] for p in papers],
+                            focus=research_question
+                        )
+                        if submission["success"]:
+                            st.session_state.review_batch = {
+                                "id": submission["batch_id"],
+                                "files": list(st.session_state.processed_files),
+                                "research_question": research_question,
+                                "review_settings": {
                                     "depth": analysis_depth,
                                     "include_gaps": include_gaps,
                                     "include_future": include_future
                                 }
+                            }
+                        else:
+                            st.error(f"Error: {submission.get('error', 'Unknown error')}")
+                    elif research_question:
+                        # Create review generator
+                        review_gen = get_review_generator(api_key, gpt5_client)
+                        review_settings = {
+                            "depth": analysis_depth,
+                            "include_gaps": include_gaps,
+                            "include_future": include_future
+                        }
+
+                        with st.status("Generating comprehensive literature review with GPT-5...") as status:
+                            # Summarize papers in parallel chunks, then review the summaries
+                            status.update(label=f"Summarizing {len(st.session_state.processed_files)} papers...")
+                            papers = _load_papers(st.session_state.processed_files)
+                            summaries = gpt5_client.summarize_papers(
+                                [p['content'] for p in papers],
+                                focus=research_question
                             )
+                            papers = [{**p, "content": summary} for p, summary in zip(papers, summaries)]
+                            status.update(label="Papers summarized", state="complete")
 
-                            if result["success"]:
-                                st.session_state.analysis_results["literature_review"] = result
-                                st.success("✅ Literature review generated successfully!")
-
-                                # Display review
-                                st.markdown("### Generated Literature Review")
-                                review_text = result.get("full_review", "")
-                                if review_text:
-                                    st.markdown(review_text)
-                                else:
-                                    st.warning("The literature review returned empty. Please try again.")
-
-                                # Show metadata
-                                st.info(f"📊 Analyzed {result['paper_count']} papers | "
-                                       f"Word count: {result['metadata']['total_words']}")
-                            else:
-                                st.error(f"Error: {result.get('error', 'Unknown error')}")
+                        _render_review(review_gen, papers, research_question, review_settings)
                     else:
                         st.warning("Please enter a research question")
+
+                batch = st.session_state.get("review_batch")
+                if batch:
+                    st.info(f"⏳ Summary batch `{batch['id']}` submitted for {len(batch['files'])} papers")
+                    if st.button("🔄 Check Batch Status"):
+                        papers = _load_papers(batch["files"])
+                        collected = gpt5_client.collect_summary_batch(batch["id"], [p['content'] for p in papers])
+                        if not collected["success"]:
+                            st.error(f"Error: {collected.get('error', 'Unknown error')}")
+                            st.session_state.review_batch = None
+                        elif collected["summaries"] is None:
+                            st.info(f"Batch status: {collected['status']}. Check back later.")
+                        else:
+                            st.session_state.review_batch = None
+                            papers = [{**p, "content": summary} for p, summary in zip(papers, collected["summaries"])]
+                            _render_review(
+                                get_review_generator(api_key, gpt5_client),
+                                papers,
+                                batch["research_question"],
+                                batch["review_settings"]
+                            )
             else:
                 st.info("Please upload research papers in the 'Upload Papers' tab")
 
@@ -254,25 +428,24 @@ else:
             st.subheader("Research Visualizations")
 
             if st.session_state.analysis_results.get("literature_review"):
-                # Create visualizations
-                viz = ResearchVisualizations()
+                # Figures are memoized on the review text, so reruns skip rebuilding them
+                review = st.session_state.analysis_results["literature_review"]
+                review_key = hashlib.sha1(str(review.get("full_review", "")).encode()).hexdigest()
+                figures = get_review_figures(review_key)
 
                 col1, col2 = st.columns(2)
 
                 with col1:
                     # Theme distribution
-                    fig1 = viz.create_theme_distribution({})
-                    st.plotly_chart(fig1, use_container_width=True)
+                    st.plotly_chart(figures["themes"], use_container_width=True)
 
                 with col2:
                     # Research timeline
-                    fig2 = viz.create_research_timeline([])
-                    st.plotly_chart(fig2, use_container_width=True)
+                    st.plotly_chart(figures["timeline"], use_container_width=True)
 
                 # Citation network
                 st.subheader("Citation Network")
-                fig3 = viz.create_citation_network([])
-                st.plotly_chart(fig3, use_container_width=True)
+                st.plotly_chart(figures["citations"], use_container_width=True)
             else:
                 st.info("Generate a literature review first to see visualizations")
 
@@ -299,7 +472,8 @@ else:
         with col1:
             uploaded_file = st.file_uploader(
                 "Upload Document",
-                type=['pdf', 'txt', 'docx', 'jpg', 'png']
+                type=['pdf', 'txt', 'docx', 'jpg', 'png'],
+                max_upload_size=Config.MAX_FILE_SIZE_MB
             )
 
             if uploaded_file:
@@ -315,22 +489,18 @@ else:
                     )
 
                     if st.button("🔍 Analyze Document", type="primary"):
-                        with st.spinner(f"Analyzing with GPT-5 ({reasoning_level} reasoning)..."):
-                            result = st.session_state.gpt5_client.analyze_document(
+                        # Stream the analysis so text appears as soon as the first tokens arrive
+                        st.markdown("### Analysis Results")
+                        try:
+                            analysis_text = st.write_stream(gpt5_client.analyze_document_stream(
                                 content=processed['content'],
                                 analysis_type=analysis_type,
                                 reasoning_level=reasoning_level
-                            )
-
-                            if result["success"]:
-                                st.markdown("### Analysis Results")
-                                analysis_text = result.get("analysis", "")
-                                if analysis_text:
-                                    st.markdown(analysis_text)
-                                else:
-                                    st.warning("The analysis returned empty. Please try again.")
-                            else:
-                                st.error(f"Error: {result.get('error', 'Unknown error')}")
+                            ))
+                            if not analysis_text:
+                                st.warning("The analysis returned empty. Please try again.")
+                        except Exception as e:
+                            st.error(f"Error: {str(e)}")
 
         with col2:
             st.markdown("""
@@ -363,7 +533,7 @@ else:
         if st.button("💡 Generate Hypotheses", type="primary"):
             if research_area and literature_summary:
                 with st.spinner("Generating research hypotheses with GPT-5..."):
-                    result = st.session_state.gpt5_client.generate_hypotheses(
+                    result = gpt5_client.generate_hypotheses(
                         research_area=research_area,
                         literature_summary=literature_summary,
                         num_hypotheses=num_hypotheses
@@ -396,16 +566,22 @@ else:
             uploaded_files = st.file_uploader(
                 "Upload Studies for Meta-Analysis",
                 type=['pdf', 'txt', 'docx'],
+                max_upload_size=Config.MAX_FILE_SIZE_MB,
                 accept_multiple_files=True,
                 help="Upload research papers/studies for meta-analysis"
             )
 
             if uploaded_files:
-                with st.spinner("Processing uploaded studies..."):
-                    for file in uploaded_files:
-                        processed = FileProcessor.process_single_file(file)
-                        if processed:
-                            st.session_state.processed_files.append(processed)
+                if _uploads_changed(uploaded_files, "meta_analysis"):
+                    with st.status("Processing uploaded studies...") as status:
+                        processed = FileProcessor.process_uploaded_files(
+                            uploaded_files,
+                            on_progress=lambda done, total: status.update(label=f"Processed {done}/{total} studies...")
+                        )
+                        st.session_state.processed_files = st.session_state.processed_files + [_persist_processed(p) for p in processed]
+                        # Free the parsing buffers once per new upload, not on every rerun
+                        gc.collect()
+                        status.update(label=f"Processed {len(processed)} studies", state="complete")
 
                 st.success(f"✅ {len(uploaded_files)} studies processed for meta-analysis")
 
@@ -435,11 +611,20 @@ else:
 
                 if st.button("📊 Conduct Meta-Analysis", type="primary"):
                     if research_question:
-                        with st.spinner("Conducting meta-analysis with GPT-5..."):
-                            # Prepare papers for meta-analysis
-                            papers_content = [f"Study {i+1}: {p['content']}" for i, p in enumerate(st.session_state.processed_files)]
+                        with st.status("Conducting meta-analysis with GPT-5...") as status:
+                            # Summarize only the studies the meta-analysis reads, then analyze the summaries
+                            studies = Helpers.unique_papers(
+                                st.session_state.processed_files
+                            )[:GPT5Client.MAX_META_ANALYSIS_STUDIES]
+                            status.update(label=f"Summarizing {len(studies)} studies...")
+                            summaries = gpt5_client.summarize_papers(
+                                list(FileProcessor.iter_contents(studies)),
+                                focus=research_question
+                            )
+                            papers_content = (f"Study {i+1}: {s}" for i, s in enumerate(summaries))
 
-                            result = st.session_state.gpt5_client.conduct_meta_analysis(
+                            status.update(label="Running meta-analysis...")
+                            result = gpt5_client.conduct_meta_analysis(
                                 papers=papers_content,
                                 research_question=research_question,
                                 analysis_type=analysis_type,
@@ -447,24 +632,26 @@ else:
                                 include_forest_plot=include_forest_plot,
                                 include_heterogeneity=include_heterogeneity
                             )
-
-                            if result["success"]:
-                                st.session_state.analysis_results["meta_analysis"] = result
-                                st.success("✅ Meta-analysis completed successfully!")
-
-                                st.markdown("### Meta-Analysis Results")
-                                analysis_text = result.get("analysis", "")
-                                if analysis_text:
-                                    st.markdown(analysis_text)
-
-                                    # Show analysis metadata
-                                    st.info(f"📊 Studies analyzed: {result.get('study_count', 0)} | "
-                                           f"Method: {statistical_method} | "
-                                           f"Type: {analysis_type}")
-                                else:
-                                    st.warning("Meta-analysis completed but no content was returned.")
+                            status.update(label="Meta-analysis finished", state="complete" if result["success"] else "error")
+
+                        if result["success"]:
+                            _store_result("meta_analysis", result)
+                            gc.collect()
+                            st.success("✅ Meta-analysis completed successfully!")
+
+                            st.markdown("### Meta-Analysis Results")
+                            analysis_text = result.get("analysis", "")
+                            if analysis_text:
+                                st.markdown(analysis_text)
+
+                                # Show analysis metadata
+                                st.info(f"📊 Studies analyzed: {result.get('study_count', 0)} | "
+                                       f"Method: {statistical_method} | "
+                                       f"Type: {analysis_type}")
                             else:
-                                st.error(f"Error: {result.get('error', 'Unknown error')}")
+                                st.warning("Meta-analysis completed but no content was returned.")
+                        else:
+                            st.error(f"Error: {result.get('error', 'Unknown error')}")
                     else:
                         st.warning("Please enter a research question")
 
@@ -500,16 +687,20 @@ else:
                 uploaded_files = st.file_uploader(
                     "Upload Research Papers",
                     type=['pdf', 'txt', 'docx'],
+                    max_upload_size=Config.MAX_FILE_SIZE_MB,
                     accept_multiple_files=True,
                     help="Upload papers for research synthesis"
                 )
 
                 if uploaded_files:
-                    with st.spinner("Processing papers..."):
-                        for file in uploaded_files:
-                            processed = FileProcessor.process_single_file(file)
-                            if processed:
-                                st.session_state.processed_files.append(processed)
+                    with st.status("Processing papers...") as status:
+                        processed = FileProcessor.process_uploaded_files(
+                            uploaded_files,
+                            on_progress=lambda done, total: status.update(label=f"Processed {done}/{total} papers...")
+                        )
+                        st.session_state.processed_files = st.session_state.processed_files + [_persist_processed(p) for p in processed]
+                        gc.collect()
+                        status.update(label=f"Processed {len(processed)} papers", state="complete")
 
                     st.success(f"✅ {len(uploaded_files)} papers processed")
 
@@ -538,68 +729,86 @@ else:
 
                 if st.button("🔬 Generate Research Synthesis", type="primary"):
                     if research_focus:
-                        with st.spinner(f"Generating {synthesis_type.lower()}..."):
+                        with st.status(f"Generating {synthesis_type.lower()}...") as status:
+                            if synthesis_type in ("Thematic Analysis", "Synthesis Matrix"):
+                                # These extract their aspects from each paper in one map step
+                                # of their own, so summarizing first would only add calls
+                                synthesis_papers = _load_papers(st.session_state.processed_files)
+                            else:
+                                # Summarize papers concurrently so the synthesis works on compact
+                                # inputs; gap analysis and the synthesis read no more than this
+                                selected_files = st.session_state.processed_files[:GPT5Client.MAX_SYNTHESIS_PAPERS]
+                                status.update(label=f"Summarizing {len(selected_files)} papers...")
+                                summaries = gpt5_client.summarize_papers(
+                                    list(FileProcessor.iter_contents(selected_files)),
+                                    focus=research_focus
+                                )
+                                synthesis_papers = [
+                                    {**p, "content": summary}
+                                    for p, summary in zip(selected_files, summaries)
+                                ]
+
+                            status.update(label=f"Generating {synthesis_type.lower()}...")
                             if synthesis_type == "Thematic Analysis":
-                                from research.literature_review import LiteratureReviewGenerator
-                                review_gen = LiteratureReviewGenerator(st.session_state.gpt5_client)
+                                review_gen = get_review_generator(api_key, gpt5_client)
 
                                 result = review_gen.generate_thematic_analysis(
-                                    papers=st.session_state.processed_files,
+                                    papers=synthesis_papers,
                                     num_themes=num_themes
                                 )
 
                             elif synthesis_type == "Synthesis Matrix":
-                                from research.literature_review import LiteratureReviewGenerator
-                                review_gen = LiteratureReviewGenerator(st.session_state.gpt5_client)
+                                review_gen = get_review_generator(api_key, gpt5_client)
 
                                 result = review_gen.create_synthesis_matrix(
-                                    papers=st.session_state.processed_files,
+                                    papers=synthesis_papers,
                                     categories=comparison_categories
                                 )
 
                             elif synthesis_type == "Gap Analysis":
-                                from research.research_gap_finder import ResearchGapFinder
-                                gap_finder = ResearchGapFinder(st.session_state.gpt5_client)
+                                gap_finder = get_gap_finder(api_key, gpt5_client)
 
                                 result = gap_finder.identify_gaps(
-                                    papers=st.session_state.processed_files,
+                                    papers=synthesis_papers,
                                     research_area=research_focus
                                 )
 
                             else:
                                 # For other synthesis types, use general synthesis
-                                result = st.session_state.gpt5_client.generate_research_synthesis(
-                                    papers=[p['content'] for p in st.session_state.processed_files],
+                                result = gpt5_client.generate_research_synthesis(
+                                    papers=[p['content'] for p in synthesis_papers],
                                     synthesis_type=synthesis_type,
                                     research_focus=research_focus
                                 )
+                            status.update(label=f"{synthesis_type} finished", state="complete" if result["success"] else "error")
 
-                            if result["success"]:
-                                st.session_state.analysis_results["research_synthesis"] = result
-                                st.success(f"✅ {synthesis_type} completed successfully!")
-
-                                st.markdown(f"### {synthesis_type} Results")
-
-                                # Display results based on synthesis type
-                                if synthesis_type == "Thematic Analysis":
-                                    content = result.get("themes", "")
-                                elif synthesis_type == "Synthesis Matrix":
-                                    content = result.get("matrix", "")
-                                elif synthesis_type == "Gap Analysis":
-                                    content = result.get("gaps", "")
-                                else:
-                                    content = result.get("synthesis", "")
+                        if result["success"]:
+                            _store_result("research_synthesis", result)
+                            gc.collect()
+                            st.success(f"✅ {synthesis_type} completed successfully!")
 
-                                if content:
-                                    st.markdown(content)
+                            st.markdown(f"### {synthesis_type} Results")
 
-                                    # Show metadata
-                                    papers_count = len(st.session_state.processed_files)
-                                    st.info(f"📊 Papers analyzed: {papers_count} | Type: {synthesis_type}")
-                                else:
-                                    st.warning("Synthesis completed but no content was returned.")
+                            # Display results based on synthesis type
+                            if synthesis_type == "Thematic Analysis":
+                                content = result.get("themes", "")
+                            elif synthesis_type == "Synthesis Matrix":
+                                content = result.get("matrix", "")
+                            elif synthesis_type == "Gap Analysis":
+                                content = result.get("gaps", "")
                             else:
-                                st.error(f"Error: {result.get('error', 'Unknown error')}")
+                                content = result.get("synthesis", "")
+
+                            if content:
+                                st.markdown(content)
+
+                                # Show metadata
+                                papers_count = len(st.session_state.processed_files)
+                                st.info(f"📊 Papers analyzed: {papers_count} | Type: {synthesis_type}")
+                            else:
+                                st.warning("Synthesis completed but no content was returned.")
+                        else:
+                            st.error(f"Error: {result.get('error', 'Unknown error')}")
                     else:
                         st.warning("Please provide a research focus or question")
 
@@ -625,6 +834,9 @@ else:
         col1, col2 = st.columns([2, 1])
 
         with col1:
+            # Bind once; each session_state attribute read goes through Streamlit's proxy
+            processed_files = st.session_state.processed_files
+
             # Citation operation selection
             citation_operation = st.selectbox(
                 "Citation Operation",
@@ -641,8 +853,7 @@ else:
 
                 if st.button("🔍 Extract Citations", type="primary"):
                     if text_input:
-                        from research.citation_manager import CitationManager
-                        citation_manager = CitationManager()
+                        citation_manager = get_citation_manager()
 
                         with st.spinner("Extracting citations..."):
                             citations = citation_manager.extract_citations(text_input)
@@ -665,7 +876,7 @@ else:
                         st.warning("Please provide text to extract citations from")
 
             elif citation_operation == "Format Bibliography":
-                if st.session_state.processed_files:
+                if processed_files:
                     st.markdown("### Generate Bibliography from Uploaded Papers")
 
                     format_style = st.selectbox(
@@ -674,111 +885,180 @@ else:
                     )
 
                     if st.button("📚 Generate Bibliography", type="primary"):
-                        with st.spinner("Generating bibliography..."):
-                            result = st.session_state.gpt5_client.generate_bibliography(
-                                papers=st.session_state.processed_files,
+                        st.markdown("### Generated Bibliography")
+                        try:
+                            # Stream so entries appear as they are generated; repeat clicks on
+                            # unchanged papers are served from the client's persistent cache
+                            bibliography = st.write_stream(gpt5_client.generate_bibliography_stream(
+                                papers=_load_papers(processed_files),
                                 format_style=format_style
-                            )
-
-                            if result["success"]:
-                                st.markdown("### Generated Bibliography")
-                                bibliography = result.get("bibliography", "")
-                                if bibliography:
-                                    st.markdown(bibliography)
-                                    st.info(f"📚 Format: {format_style} | Papers: {len(st.session_state.processed_files)}")
-                                else:
-                                    st.warning("Bibliography generated but no content returned.")
+                            ))
+                            if bibliography:
+                                st.info(f"📚 Format: {format_style} | Papers: {len(processed_files)}")
                             else:
-                                st.error(f"Error: {result.get('error', 'Unknown error')}")
+                                st.warning("Bibliography generated but no content returned.")
+                        except Exception as e:
+                            st.error(f"Error: {str(e)}")
                 else:
                     st.info("Upload research papers first to generate bibliography")
 
             elif citation_operation == "Generate Citations":
                 st.markdown("### Generate Citation for a Source")
 
-                source_type = st.selectbox(
-                    "Source Type",
-                    ["Journal Article", "Book", "Conference Paper", "Website", "Thesis/Dissertation"]
-                )
+                batch_mode = st.toggle("Format several sources in one request")
+
+                if batch_mode:
+                    import pandas as pd
+
+                    # One row per source; every row is sent in a single LLM request
+                    sources_df = st.data_editor(
+                        pd.DataFrame(columns=["type", "authors", "title", "journal", "publisher", "year", "volume", "pages"]),
+                        num_rows="dynamic",
+                        use_container_width=True,
+                        column_config={
+                            "type": st.column_config.SelectboxColumn(
+                                "Source Type",
+                                options=["Journal Article", "Book", "Conference Paper", "Website", "Thesis/Dissertation"],
+                                default="Journal Article"
+                            )
+                        },
+                        key="citation_sources"
+                    )
 
-                # Dynamic form based on source type
-                if source_type == "Journal Article":
-                    authors = st.text_input("Authors", placeholder="Smith, J., & Doe, A.")
-                    title = st.text_input("Article Title")
-                    journal = st.text_input("Journal Name")
-                    year = st.text_input("Year", placeholder="2025")
-                    volume = st.text_input("Volume (optional)")
-                    pages = st.text_input("Pages (optional)", placeholder="123-145")
-
-                    source_info = {
-                        "type": source_type,
-                        "authors": authors,
-                        "title": title,
-                        "journal": journal,
-                        "year": year,
-                        "volume": volume,
-                        "pages": pages
-                    }
-
-                elif source_type == "Book":
-                    authors = st.text_input("Authors", placeholder="Smith, J.")
-                    title = st.text_input("Book Title")
-                    publisher = st.text_input("Publisher")
-                    year = st.text_input("Year", placeholder="2025")
-                    edition = st.text_input("Edition (optional)")
-
-                    source_info = {
-                        "type": source_type,
-                        "authors": authors,
-                        "title": title,
-                        "publisher": publisher,
-                        "year": year,
-                        "edition": edition
-                    }
-
-                format_style = st.selectbox(
-                    "Citation Format",
-                    ["APA 7th", "MLA 9th", "Chicago 17th", "IEEE", "Harvard"],
-                    key="citation_format"
-                )
+                    format_style = st.selectbox(
+                        "Citation Format",
+                        ["APA 7th", "MLA 9th", "Chicago 17th", "IEEE", "Harvard"],
+                        key="batch_citation_format"
+                    )
 
-                if st.button("📝 Generate Citation", type="primary"):
-                    if all(source_info[key] for key in ["authors", "title", "year"]):
-                        with st.spinner("Generating citation..."):
-                            result = st.session_state.gpt5_client.format_citation(
-                                source_info=source_info,
-                                format_style=format_style
-                            )
+                    if st.button("📝 Generate Citations", type="primary"):
+                        sources = [
+                            {key: str(value).strip() for key, value in row.items() if pd.notna(value) and str(value).strip()}
+                            for row in sources_df.to_dict("records")
+                        ]
+                        sources = [source for source in sources if all(source.get(key) for key in REQUIRED_CITATION_FIELDS)]
+
+                        if sources:
+                            with st.spinner(f"Generating {len(sources)} citations..."):
+                                result = gpt5_client.format_citations_batch(
+                                    sources=sources,
+                                    format_style=format_style
+                                )
 
-                            if result["success"]:
-                                st.markdown("### Generated Citation")
-                                citation = result.get("citation", "")
+                                if result["success"]:
+                                    st.markdown("### Generated Citations")
+                                    for citation in result["citations"]:
+                                        st.code(citation)
+                                    st.info(f"📝 Format: {format_style} | Sources: {len(sources)}")
+                                else:
+                                    st.error(f"Error: {result.get('error', 'Unknown error')}")
+                        else:
+                            st.warning("Please fill in authors, title and year for at least one source")
+
+                else:
+                    source_type = st.selectbox(
+                        "Source Type",
+                        ["Journal Article", "Book", "Conference Paper", "Website", "Thesis/Dissertation"]
+                    )
+
+                    # Batch the inputs in a form so typing does not rerun the page per keystroke
+                    with st.form("gen_citation_form"):
+                        # Dynamic form based on source type
+                        if source_type == "Journal Article":
+                            authors = st.text_input("Authors", placeholder="Smith, J., & Doe, A.")
+                            title = st.text_input("Article Title")
+                            journal = st.text_input("Journal Name")
+                            year = st.text_input("Year", placeholder="2025")
+                            volume = st.text_input("Volume (optional)")
+                            pages = st.text_input("Pages (optional)", placeholder="123-145")
+
+                            source_info = {
+                                "type": source_type,
+                                "authors": authors,
+                                "title": title,
+                                "journal": journal,
+                                "year": year,
+                                "volume": volume,
+                                "pages": pages
+                            }
+
+                        elif source_type == "Book":
+                            authors = st.text_input("Authors", placeholder="Smith, J.")
+                            title = st.text_input("Book Title")
+                            publisher = st.text_input("Publisher")
+                            year = st.text_input("Year", placeholder="2025")
+                            edition = st.text_input("Edition (optional)")
+
+                            source_info = {
+                                "type": source_type,
+                                "authors": authors,
+                                "title": title,
+                                "publisher": publisher,
+                                "year": year,
+                                "edition": edition
+                            }
+
+                        else:
+                            authors = st.text_input("Authors", placeholder="Smith, J.")
+                            title = st.text_input("Title")
+                            venue = st.text_input("Publisher / Venue / URL")
+                            year = st.text_input("Year", placeholder="2025")
+
+                            source_info = {
+                                "type": source_type,
+                                "authors": authors,
+                                "title": title,
+                                "venue": venue,
+                                "year": year
+                            }
+
+                        format_style = st.selectbox(
+                            "Citation Format",
+                            ["APA 7th", "MLA 9th", "Chicago 17th", "IEEE", "Harvard"],
+                            key="citation_format"
+                        )
+
+                        submitted = st.form_submit_button("📝 Generate Citation", type="primary")
+
+                    if submitted:
+                        if all(source_info.get(key, "").strip() for key in REQUIRED_CITATION_FIELDS):
+                            st.markdown("### Generated Citation")
+                            try:
+                                # Stream so the citation appears as soon as the first tokens arrive
+                                citation = st.write_stream(gpt5_client.format_citation_stream(
+                                    source_info=source_info,
+                                    format_style=format_style
+                                ))
                                 if citation:
-                                    st.code(citation)
                                     st.info(f"📝 Format: {format_style}")
                                 else:
                                     st.warning("Citation generated but no content returned.")
-                            else:
-                                st.error(f"Error: {result.get('error', 'Unknown error')}")
-                    else:
-                        st.warning("Please fill in the required fields (authors, title, year)")
+                            except Exception as e:
+                                st.error(f"Error: {str(e)}")
+                        else:
+                            st.warning("Please fill in the required fields (authors, title, year)")
 
             elif citation_operation == "Citation Analysis":
-                if st.session_state.processed_files:
+                if processed_files:
                     if st.button("📊 Analyze Citations", type="primary"):
                         with st.spinner("Analyzing citation patterns..."):
-                            papers_content = [p['content'] for p in st.session_state.processed_files]
-
-                            result = st.session_state.gpt5_client.analyze_citations(
-                                papers=papers_content
-                            )
+                            # Keyed on content hashes, so repeat clicks on unchanged papers skip the API
+                            try:
+                                result = _cached_analyze_citations(
+                                    tuple(p["sha1"] for p in processed_files),
+                                    api_key,
+                                    gpt5_client,
+                                    processed_files
+                                )
+                            except RuntimeError as e:
+                                result = {"success": False, "error": str(e)}
 
                             if result["success"]:
                                 st.markdown("### Citation Analysis Results")
                                 analysis = result.get("analysis", "")
                                 if analysis:
                                     st.markdown(analysis)
-                                    st.info(f"📊 Papers analyzed: {len(st.session_state.processed_files)}")
+                                    st.info(f"📊 Papers analyzed: {len(processed_files)}")
                                 else:
                                     st.warning("Citation analysis completed but no content returned.")
                             else:
@@ -787,28 +1067,8 @@ else:
                     st.info("Upload research papers first to analyze citations")
 
         with col2:
-            st.markdown("""
-            ### Citation Operations
-
-            - **Extract Citations**: Find citations in academic text
-            - **Format Bibliography**: Generate formatted reference lists
-            - **Generate Citations**: Create proper citations for sources
-            - **Citation Analysis**: Analyze citation patterns and networks
-
-            ### Supported Formats
-
-            - **APA 7th**: American Psychological Association
-            - **MLA 9th**: Modern Language Association
-            - **Chicago 17th**: Chicago Manual of Style
-            - **IEEE**: Institute of Electrical and Electronics Engineers
-            - **Harvard**: Harvard referencing system
-            """)
+            st.markdown(_CITATION_HELP_MD)
 
 # Footer
 st.divider()
-st.markdown("""
-<div style="text-align: center; color: #64748B; padding: 2rem;">
-    <p>🚀 Powered by Advanced AI Technology | Built for Researchers & Academics</p>
-    <p>© 2025 IntelliDoc Research Pro | Version 1.0.0</p>
-</div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
\ No newline at end of file
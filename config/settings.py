@@ -1,6 +1,8 @@
 """Configuration settings for IntelliDoc Research Pro"""
 
 import os
+import re
+import tempfile
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -30,13 +32,64 @@ class Config:
     # Rate Limiting
     MAX_REQUESTS_PER_MINUTE = int(os.getenv('MAX_REQUESTS_PER_MINUTE', 60))
     MAX_TOKENS_PER_REQUEST = int(os.getenv('MAX_TOKENS_PER_REQUEST', 4000))
+    # In-flight API requests per process, across all sessions
+    LLM_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', 8))
+
+    # Retries (exponential backoff with jitter, capped at LLM_BACKOFF_MAX seconds)
+    LLM_MAX_RETRIES = int(os.getenv('LLM_MAX_RETRIES', 5))
+    LLM_BACKOFF_BASE = float(os.getenv('LLM_BACKOFF_BASE', 1.0))
+    LLM_BACKOFF_MAX = float(os.getenv('LLM_BACKOFF_MAX', 30.0))
+
+    # Ask for JSON mode (response_format) on requests whose output is parsed as JSON.
+    # Off by default: the Comet and AI/ML gateways do not document response_format,
+    # and a gateway that rejects it fails the whole request
+    LLM_JSON_MODE = os.getenv('LLM_JSON_MODE', 'False').lower() == 'true'
+
+    # Research questions about the same context arriving within this window share
+    # one request (0 disables coalescing). Off by default: the first question
+    # always waits out the window, and coalesced questions skip the semantic cache
+    QUESTION_BATCH_WINDOW_MS = int(os.getenv('QUESTION_BATCH_WINDOW_MS', 0))
+    QUESTION_BATCH_MAX = int(os.getenv('QUESTION_BATCH_MAX', 8))
+
+    # Response Cache
+    LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'True').lower() == 'true'
+    LLM_CACHE_TTL = int(os.getenv('LLM_CACHE_TTL', 3600))
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', 256))
+    # Also cache sampled (temperature > 0) responses; off so repeated calls
+    # return fresh samples (every current call samples)
+    LLM_CACHE_SAMPLED = os.getenv('LLM_CACHE_SAMPLED', 'False').lower() == 'true'
+    # Reuse answers to paraphrased research questions (needs sentence-transformers)
+    SEMANTIC_CACHE_ENABLED = os.getenv('SEMANTIC_CACHE_ENABLED', 'False').lower() == 'true'
+    SEMANTIC_CACHE_MODEL = os.getenv('SEMANTIC_CACHE_MODEL', 'sentence-transformers/all-MiniLM-L6-v2')
+    SEMANTIC_CACHE_THRESHOLD = float(os.getenv('SEMANTIC_CACHE_THRESHOLD', 0.92))
 
     # File Processing
     MAX_FILE_SIZE_MB = int(os.getenv('MAX_FILE_SIZE_MB', 50))
-    ALLOWED_FILE_TYPES = os.getenv('ALLOWED_FILE_TYPES', 'pdf,txt,docx,jpg,png').split(',')
+    MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
+    ALLOWED_FILE_TYPES = frozenset(re.findall(r'[a-z0-9]+', os.getenv('ALLOWED_FILE_TYPES', 'pdf,txt,docx,jpg,png').lower()))
+    STREAM_THRESHOLD_MB = int(os.getenv('STREAM_THRESHOLD_MB', 8))
+    STREAM_THRESHOLD_BYTES = STREAM_THRESHOLD_MB * 1024 * 1024
+    # Worker processes that parse uploads below the stream threshold (0 parses in-thread)
+    PARSE_PROCESSES = int(os.getenv('PARSE_PROCESSES', min(os.cpu_count() or 1, 4)))
+    # PDFs with at least this many pages have their pages split across the workers
+    PDF_PARALLEL_MIN_PAGES = int(os.getenv('PDF_PARALLEL_MIN_PAGES', 8))
+    # Images larger than this (in pixels, either side) are downscaled before analysis
+    IMAGE_MAX_DIMENSION = int(os.getenv('IMAGE_MAX_DIMENSION', 1536))
 
     # Export Settings
     EXPORT_PATH = os.getenv('EXPORT_PATH', './exports')
+    # Formatted citations, bibliographies and citation analyses persist here across restarts
+    CITATION_CACHE_ENABLED = os.getenv('CITATION_CACHE_ENABLED', 'True').lower() == 'true'
+    CITATION_CACHE_PATH = os.getenv('CITATION_CACHE_PATH', os.path.join(EXPORT_PATH, '.citecache'))
+    CITATION_CACHE_TTL = int(os.getenv('CITATION_CACHE_TTL', 7 * 24 * 3600))
+    # Extracted text of uploads, shared by all sessions and stored by content hash;
+    # files unused for TEXT_STORE_TTL seconds are deleted
+    TEXT_STORE_PATH = os.getenv('TEXT_STORE_PATH', os.path.join(tempfile.gettempdir(), 'intellidoc_text'))
+    TEXT_STORE_TTL = int(os.getenv('TEXT_STORE_TTL', 24 * 3600))
+    # Extracted PDF text persists here by content hash across restarts
+    PARSE_CACHE_ENABLED = os.getenv('PARSE_CACHE_ENABLED', 'True').lower() == 'true'
+    PARSE_CACHE_PATH = os.getenv('PARSE_CACHE_PATH', os.path.join(EXPORT_PATH, '.parsecache'))
+    PARSE_CACHE_TTL = int(os.getenv('PARSE_CACHE_TTL', 7 * 24 * 3600))
 
     # Research Settings
     CITATION_STYLES = ['APA 7th', 'MLA 9th', 'Chicago 17th', 'IEEE', 'Harvard']
@@ -51,6 +104,6 @@ class Config:
     @classmethod
     def validate(cls):
         """Validate configuration"""
-        if not cls.COMET_API_KEY:
-            raise ValueError("COMET_API_KEY is required. Please set it in your .env file")
+        if not (cls.COMET_API_KEY or cls.AIMLAPI_KEY):
+            raise ValueError("COMET_API_KEY (or AIMLAPI_KEY) is required. Please set it in your .env file")
         return True
\ No newline at end of file
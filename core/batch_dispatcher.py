@@ -0,0 +1,99 @@
+"""Coalescing of concurrent GPT-5 requests into shared calls"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List
+
+
+class _PendingBatch:
+    """Items collected for one group while its window is open"""
+
+    def __init__(self, payload: Any):
+        self.payload = payload
+        self.items: List[Any] = []
+        self.futures: List[Future] = []
+        self.closed = threading.Event()
+
+
+class BatchDispatcher:
+    """
+    Collect items submitted for the same group within a short window and
+    dispatch them together
+
+    Streamlit runs each session's script in its own thread, so concurrent
+    users call the client from different threads. The first submitter of a
+    group waits up to window_ms for others to join (or until max_batch items
+    are queued), then sends the whole batch with one send_batch call while
+    the other submitters block on their results.
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[Any, List[Any]], List[Any]],
+        window_ms: float = 50,
+        max_batch: int = 8
+    ):
+        """
+        Args:
+            send_batch: Called as send_batch(payload, items); must return one
+                result per item, in order
+            window_ms: How long the first item of a group waits for company
+            max_batch: Dispatch as soon as this many items are queued
+        """
+        self.send_batch = send_batch
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._pending: Dict[str, _PendingBatch] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key: str, payload: Any, item: Any) -> Any:
+        """
+        Queue item in group key and block until its result is available
+
+        Args:
+            key: Group identifier; only items with equal keys share a call
+            payload: Data shared by the whole group (taken from the first item)
+            item: The per-item input
+
+        Returns:
+            The result send_batch produced for item
+
+        Raises:
+            Exception: Whatever send_batch raised for the batch
+        """
+        future: Future = Future()
+        with self._lock:
+            batch = self._pending.get(key)
+            leader = batch is None
+            if leader:
+                batch = _PendingBatch(payload)
+                self._pending[key] = batch
+            batch.items.append(item)
+            batch.futures.append(future)
+            if len(batch.items) >= self.max_batch:
+                # Full: later submitters start a new batch
+                del self._pending[key]
+                batch.closed.set()
+
+        if leader:
+            batch.closed.wait(self.window)
+            with self._lock:
+                if self._pending.get(key) is batch:
+                    del self._pending[key]
+            self._dispatch(batch)
+
+        return future.result()
+
+    def _dispatch(self, batch: _PendingBatch):
+        """Send a closed batch and resolve its futures"""
+        try:
+            results = self.send_batch(batch.payload, batch.items)
+            if len(results) != len(batch.items):
+                raise RuntimeError(f"Expected {len(batch.items)} results, got {len(results)}")
+        except Exception as e:
+            for future in batch.futures:
+                future.set_exception(e)
+            return
+
+        for future, result in zip(batch.futures, results):
+            future.set_result(result)
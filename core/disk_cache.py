@@ -0,0 +1,59 @@
+"""Persistent response cache for GPT-5 results that outlive a process"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import logging
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """
+    Thread-safe key/value cache stored in a SQLite file, with a per-entry TTL
+
+    Values must be JSON-serializable. Used for results that are expensive to
+    regenerate and stable for a given input, such as formatted citations, so
+    they survive app restarts unlike the in-memory caches.
+    """
+
+    def __init__(self, directory: str, ttl_seconds: float = 7 * 24 * 3600):
+        self.ttl_seconds = ttl_seconds
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(os.path.join(directory, "cache.db"), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, expires REAL, value TEXT)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        with self._lock:
+            row = self._conn.execute("SELECT expires, value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if time.time() >= row[0]:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+        return json.loads(row[1])
+
+    def set(self, key: str, value: Any):
+        """Store value under key"""
+        payload = json.dumps(value, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, expires, value) VALUES (?, ?, ?)",
+                (key, time.time() + self.ttl_seconds, payload)
+            )
+            self._conn.commit()
+
+    def clear(self):
+        """Drop all entries"""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
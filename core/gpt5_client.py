@@ -1,20 +1,228 @@
 """GPT-5 Comet API Client Integration"""
 
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI, APIConnectionError, InternalServerError, RateLimitError
+import asyncio
+import atexit
+import httpx
 import json
-from typing import Dict, List, Optional, Any
+import random
+import weakref
+from collections import OrderedDict
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Awaitable, Callable, Iterable, Iterator, Tuple
 from config.settings import Config
+from core.gpt5_cache import LLMCache
+from core.semantic_cache import SemanticCache
+from core.rate_limiter import get_rate_limiter
+from core.batch_dispatcher import BatchDispatcher
+from core.single_flight import SingleFlight
+from core.disk_cache import DiskCache
+from core import tokens
+from utils.helpers import Helpers
 import streamlit as st
 import time
+import threading
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 support in httpx)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+# System prompts are fixed strings so every request starts with a byte-identical
+# prefix that the provider's prompt cache can reuse; anything that varies per
+# request (questions, papers, citation style) belongs in the user message
+SYSTEM_PROMPTS = MappingProxyType({
+    "literature_review": "You are an expert academic researcher specializing in systematic literature reviews. Provide comprehensive, well-structured reviews with clear sections and evidence-based insights.",
+    "document_comparison": "You are an expert document analyst.",
+    "research_question": "You are a research assistant. Provide accurate, evidence-based answers.",
+    "hypotheses": "You are an expert research methodologist specializing in hypothesis generation. Generate clear, testable hypotheses with detailed rationale and methodology.",
+    "meta_analysis": "You are an expert biostatistician and meta-analysis researcher. Provide rigorous statistical analysis with appropriate caveats about data limitations. Focus on effect sizes, confidence intervals, and heterogeneity assessment.",
+    "research_synthesis": "You are an expert research synthesist. Create comprehensive syntheses that reveal patterns, relationships, and insights across multiple studies. Focus on theoretical connections and methodological innovations.",
+    "bibliography": (
+        "You are an expert academic librarian specializing in academic citation styles. Generate accurate, properly formatted bibliographies following official style guidelines.\n\n"
+        "For each paper, extract or infer the following information where possible:\n"
+        "- Author(s)\n"
+        "- Title\n"
+        "- Publication year\n"
+        "- Journal/Publisher\n"
+        "- Volume/Issue (if applicable)\n"
+        "- Page numbers (if applicable)\n"
+        "- DOI or URL (if available)\n\n"
+        "Format each entry according to the requested style's guidelines. If information is missing, "
+        "indicate this clearly and provide the best possible citation with available information.\n\n"
+        "Please provide:\n"
+        "1. Complete bibliography in the requested format\n"
+        "2. Notes about any missing information\n"
+        "3. Formatting guidelines used"
+    ),
+    "citation": "You are an expert in academic citation styles. Generate precise, properly formatted citations following official guidelines.",
+    "citation_analysis": "You are an expert bibliometrician and citation analyst. Provide comprehensive analysis of citation patterns, networks, and trends. Focus on actionable insights for researchers.",
+    "paper_summary": "You are an expert research analyst. Summarize the study's design, sample, methods, key quantitative results and conclusions concisely.",
+    "aspect_extraction": "You are an expert document analyst. Extract each requested aspect of the document and respond with only a JSON object mapping each aspect name to a concise description.",
+    "reference_extraction": "You are an expert bibliometrician. List the works a paper cites, one per line, as: authors; year; title; venue. Omit commentary."
+})
+
+ANALYSIS_SYSTEM_PROMPTS = MappingProxyType({
+    "comprehensive": "You are an expert document analyst. Provide comprehensive analysis including summary, key points, insights, and recommendations.",
+    "summary": "You are an expert at summarizing documents. Provide clear, concise summaries.",
+    "research": "You are an academic researcher. Analyze documents from a research perspective.",
+    "legal": "You are a legal document analyst. Focus on legal implications and key terms.",
+    "medical": "You are a medical document analyst. Focus on clinical findings and medical insights.",
+    "financial": "You are a financial analyst. Focus on financial metrics and implications."
+})
+
+# Sections of a structured (JSON mode) literature review, in order, with their headings
+REVIEW_SECTIONS = MappingProxyType({
+    "executive_summary": "Executive Summary",
+    "key_themes": "Key Themes and Findings",
+    "methodologies": "Methodological Approaches",
+    "theoretical_frameworks": "Theoretical Frameworks",
+    "research_gaps": "Research Gaps",
+    "future_directions": "Future Research Directions",
+    "conclusion": "Conclusion"
+})
+
+def _section_markdown(value: Any) -> str:
+    """Render a structured review section as markdown; lists become bullets, objects labelled lines"""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return "\n".join(f"- {_section_markdown(item)}" for item in value)
+    if isinstance(value, dict):
+        return "\n".join(f"**{key}**: {_section_markdown(item)}" for key, item in value.items())
+    return str(value)
+
+# Connection pool settings shared by the sync and async HTTP clients
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0)
+_HTTP_TIMEOUT = httpx.Timeout(connect=5.0, read=120.0, write=30.0, pool=5.0)
+
+_shared_http_client: Optional[httpx.Client] = None
+_shared_http_lock = threading.Lock()
+
+
+def _get_shared_http_client() -> httpx.Client:
+    """Return the process-wide pooled HTTP client, creating it on first use"""
+    global _shared_http_client
+    with _shared_http_lock:
+        if _shared_http_client is None or _shared_http_client.is_closed:
+            _shared_http_client = httpx.Client(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT, http2=_HTTP2_AVAILABLE)
+        return _shared_http_client
+
+
+@atexit.register
+def _close_shared_http_client():
+    """Close the pooled HTTP connections at interpreter exit"""
+    if _shared_http_client is not None and not _shared_http_client.is_closed:
+        _shared_http_client.close()
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Return the Retry-After seconds an API error carries, if any"""
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(retry_after) if retry_after else None
+    except ValueError:
+        return None  # HTTP-date form is not used by the providers
+
+
+def _backoff_delay(attempt: int, error: Exception, base: float = 1.0) -> float:
+    """
+    Seconds to wait before retrying after a failed attempt
+
+    Honors the provider's Retry-After header when the error carries one,
+    otherwise uses exponential backoff with up to 1s of jitter. Both are
+    capped at Config.LLM_BACKOFF_MAX.
+
+    Args:
+        attempt: Zero-based index of the attempt that failed
+        error: Exception the attempt raised
+        base: Delay before the first retry, doubled on each further retry
+
+    Returns:
+        Delay in seconds
+    """
+    retry_after = _retry_after(error)
+    if retry_after is not None:
+        return min(retry_after, Config.LLM_BACKOFF_MAX)
+    return min(base * (2 ** attempt) + random.uniform(0, 1), Config.LLM_BACKOFF_MAX)
+
+
+# Failures worth retrying: rate limits, connection errors and timeouts, and 5xx
+# responses. Anything else (bad request, auth, ...) would fail the same way again.
+_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
+# Process-wide cap on in-flight blocking requests, across all sessions
+_CONCURRENCY = threading.BoundedSemaphore(Config.LLM_MAX_CONCURRENCY)
+
+
+def _retry(fn: Callable[[], Any], attempts: int = 3, base: float = 1.0) -> Any:
+    """Call fn(), retrying transient failures with the delays of _backoff_delay; sync counterpart of _aretry"""
+    for attempt in range(attempts):
+        try:
+            return fn()
+        except _RETRYABLE_ERRORS as e:
+            if attempt == attempts - 1:
+                raise
+            delay = _backoff_delay(attempt, e, base)
+            logger.warning(f"API call attempt {attempt + 1} failed, retrying in {delay:.1f}s: {e}")
+            time.sleep(delay)
+
+
+# Worker threads for fanning out blocking API calls; the SDK releases the GIL
+# during network I/O, and all threads share the pooled HTTP client
+_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="gpt5")
+
+
+async def _aretry(coro_factory: Callable[[], Awaitable[Any]], attempts: int = 3, base: float = 1.0) -> Any:
+    """
+    Await coro_factory(), retrying transient failures with the delays of _backoff_delay
+
+    Sleeps with asyncio.sleep so other requests on the event loop keep
+    running while this one backs off.
+
+    Args:
+        coro_factory: Callable returning a fresh awaitable for each attempt
+        attempts: Maximum number of attempts
+        base: Delay before the first retry, doubled on each further retry
+
+    Returns:
+        The result of the first successful attempt
+
+    Raises:
+        Exception: Whatever the last attempt raised, or the first
+            non-retryable error
+    """
+    for attempt in range(attempts):
+        try:
+            return await coro_factory()
+        except _RETRYABLE_ERRORS as e:
+            if attempt == attempts - 1:
+                raise
+            delay = _backoff_delay(attempt, e, base)
+            logger.warning(f"Async API call attempt {attempt + 1} failed, retrying in {delay:.1f}s: {e}")
+            await asyncio.sleep(delay)
+
 class GPT5Client:
     """Client for interacting with GPT-5 via Comet API"""
 
+    # Most studies a meta-analysis and papers a research synthesis read;
+    # callers summarizing ahead of them should stop at the same count
+    MAX_META_ANALYSIS_STUDIES = 15
+    MAX_SYNTHESIS_PAPERS = 10
+
     def __init__(self, api_key: str = None):
         """Initialize GPT-5 client with Comet API"""
         self.api_key = api_key or Config.COMET_API_KEY
@@ -30,10 +238,22 @@ class GPT5Client:
             self.using_comet = True
             logger.info("Using Comet API")
 
+        self.base_url = base_url
+
+        # Only the AI/ML API accepts reasoning_effort; the endpoint never changes
+        self._supports_reasoning_effort = not self.using_comet and "aimlapi" in base_url.lower()
+
+        # Requests to one endpoint share a budget across all clients and sessions
+        self._limiter = get_rate_limiter(base_url, Config.MAX_REQUESTS_PER_MINUTE)
+
+        # All GPT5Client instances share one pooled HTTP client, so calls from
+        # every session reuse keep-alive connections instead of re-handshaking
         try:
             self.client = OpenAI(
                 base_url=base_url,
-                api_key=self.api_key
+                api_key=self.api_key,
+                http_client=_get_shared_http_client(),
+                max_retries=0  # _send retries with shared backoff and rate limiting
             )
         except Exception as e:
             logger.error(f"Failed to initialize API client: {e}")
@@ -43,8 +263,79 @@ class GPT5Client:
         self.model = Config.GPT5_MODEL  # This is gpt-5-nano from .env
         logger.info(f"Using model: {self.model} on {'Comet' if self.using_comet else 'AI/ML'} API")
 
-        self.retry_attempts = 3
-        self.retry_delay = 1
+        self.retry_attempts = Config.LLM_MAX_RETRIES
+        self.retry_delay = Config.LLM_BACKOFF_BASE
+
+        # Async client and concurrency semaphore are created lazily, one pair
+        # per event loop, so sessions running asyncio.run() at the same time
+        # on a shared client never see each other's loop-bound objects
+        self._aclients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple]" = weakref.WeakKeyDictionary()
+        self._aclients_lock = threading.Lock()
+
+        # Exact-repeat requests are answered from memory instead of the API
+        self._cache = LLMCache(max_entries=Config.LLM_CACHE_MAX_ENTRIES, ttl_seconds=Config.LLM_CACHE_TTL)
+        # ...and a repeat sent while the original is still running waits for it
+        self._in_flight = SingleFlight()
+
+        # Paraphrased questions over the same context are answered from memory too
+        self._semantic_cache = SemanticCache(
+            model_name=Config.SEMANTIC_CACHE_MODEL,
+            threshold=Config.SEMANTIC_CACHE_THRESHOLD,
+            ttl_seconds=Config.LLM_CACHE_TTL
+        ) if Config.SEMANTIC_CACHE_ENABLED else None
+
+        # Concurrent questions about the same context are coalesced into one request
+        self._question_batcher = BatchDispatcher(
+            self._answer_questions,
+            window_ms=Config.QUESTION_BATCH_WINDOW_MS,
+            max_batch=Config.QUESTION_BATCH_MAX
+        ) if Config.QUESTION_BATCH_WINDOW_MS > 0 else None
+
+        # Formatted citations keyed on (source fields, style), least recently used first
+        self._citation_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._citation_cache_size = 512
+        self._citation_cache_lock = threading.Lock()
+
+        # Citations, bibliographies and citation analyses also persist across restarts
+        self._disk_cache = None
+        if Config.CITATION_CACHE_ENABLED:
+            try:
+                self._disk_cache = DiskCache(Config.CITATION_CACHE_PATH, ttl_seconds=Config.CITATION_CACHE_TTL)
+            except Exception as e:
+                logger.warning(f"Persistent citation cache disabled: {e}")
+
+    async def _get_async_client(self) -> Tuple[AsyncOpenAI, asyncio.Semaphore]:
+        """Return the AsyncOpenAI client and concurrency semaphore of the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._aclients_lock:
+            entry = self._aclients.get(loop)
+        if entry is None:
+            # Pooled async connections cannot outlive the loop that opened them,
+            # so each asyncio.run() gets its own client
+            client = AsyncOpenAI(
+                base_url=self.base_url,
+                api_key=self.api_key,
+                http_client=httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT, http2=_HTTP2_AVAILABLE),
+                max_retries=0  # _asend retries with shared backoff and rate limiting
+            )
+            closer = self._close_at_loop_shutdown(client)
+            # Starting the generator registers it with the loop, which closes it
+            # in shutdown_asyncgens() -- asyncio.run() does so before returning
+            await closer.__anext__()
+            entry = (client, asyncio.Semaphore(Config.LLM_MAX_CONCURRENCY), closer)
+            with self._aclients_lock:
+                self._aclients[loop] = entry
+        return entry[0], entry[1]
+
+    async def _close_at_loop_shutdown(self, client: AsyncOpenAI):
+        """Suspend until the event loop shuts down, then forget and close its async client"""
+        try:
+            yield
+        finally:
+            # Looked up here rather than captured: the entry must not keep its loop alive
+            with self._aclients_lock:
+                self._aclients.pop(asyncio.get_running_loop(), None)
+            await client.close()
 
     def analyze_document(
         self,
@@ -66,97 +357,150 @@ class GPT5Client:
             Analysis results
         """
         # Input validation
-        if not content or len(content.strip()) == 0:
+        if not content or content.isspace():
             return {
                 "success": False,
                 "error": "No content provided for analysis"
             }
 
-        # Try API call with retries
-        for attempt in range(self.retry_attempts):
-            try:
-                system_prompt = self._get_system_prompt(analysis_type)
-
-                # Build request parameters - Use higher token allocation for GPT-5-nano reasoning
-                request_params = {
-                    "model": self.model,
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": f"Analyze the following document:\n\n{content}"}
-                    ],
-                    "max_tokens": max(max_tokens, 4000),  # Ensure minimum 4000 tokens for reasoning + response
-                    "temperature": 0.7
-                }
+        try:
+            request_params = self._build_analysis_request(content, analysis_type, reasoning_level, max_tokens)
 
-                # Add reasoning_effort only if supported (AI/ML API)
-                if not self.using_comet and "aimlapi" in str(self.client.base_url).lower():
-                    request_params["reasoning_effort"] = reasoning_level
-
-                logger.info(f"Making API request to: {self.client.base_url}")
-                logger.info(f"Using model: {self.model}")
-                logger.debug(f"Request params: {request_params}")
-
-                response = self.client.chat.completions.create(**request_params)
-
-                # Debug logging
-                logger.debug(f"Response object: {response}")
-                if response and response.choices:
-                    logger.debug(f"Number of choices: {len(response.choices)}")
-                    if len(response.choices) > 0:
-                        logger.debug(f"First choice: {response.choices[0]}")
-                        logger.debug(f"Message: {response.choices[0].message}")
-                        logger.debug(f"Content: {repr(response.choices[0].message.content)}")
-
-                # Check if response has content
-                if response and response.choices and len(response.choices) > 0:
-                    content = response.choices[0].message.content
-                    if content is None or content == "":
-                        logger.warning(f"Empty response content from API: {repr(content)}")
-                        logger.warning(f"Full response: {response}")
-                        content = "The API returned an empty response. This might be due to content filtering or model limitations. Please try with different content or a shorter text."
-                else:
-                    logger.error("Invalid response structure from API")
-                    logger.error(f"Full response: {response}")
-                    content = "Error: Invalid response from API. Please try again."
-
-                usage_info = None
-                if hasattr(response, 'usage'):
-                    try:
-                        if hasattr(response.usage, 'dict'):
-                            usage_info = response.usage.dict()
-                        else:
-                            usage_info = {
-                                'prompt_tokens': getattr(response.usage, 'prompt_tokens', 0),
-                                'completion_tokens': getattr(response.usage, 'completion_tokens', 0),
-                                'total_tokens': getattr(response.usage, 'total_tokens', 0)
-                            }
-                    except Exception as e:
-                        logger.warning(f"Could not extract usage info: {e}")
+            logger.info(f"Making API request to: {self.client.base_url}")
+            logger.info(f"Using model: {self.model}")
+            logger.debug("Request params: %r", request_params)
 
-                return {
-                    "success": True,
-                    "analysis": content,
-                    "usage": usage_info,
-                    "model_used": self.model,
-                    "api_used": "Comet" if self.using_comet else "AI/ML"
-                }
+            response = self._create(request_params)
+            return self._analysis_result(response)
 
-            except Exception as e:
-                logger.error(f"API call attempt {attempt + 1} failed: {e}")
-                logger.error(f"Exception type: {type(e)}")
-                logger.error(f"Exception details: {str(e)}")
+        except Exception as e:
+            logger.error(f"Document analysis failed: {e}")
+            logger.error(f"Exception type: {type(e)}")
+            return self._analysis_error(e)
 
-                if attempt < self.retry_attempts - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
-                else:
-                    return {
-                        "success": False,
-                        "error": str(e),
-                        "error_type": type(e).__name__,
-                        "message": f"API call failed after {self.retry_attempts} attempts. Please check your API key, internet connection, and try again.",
-                        "model_used": self.model,
-                        "api_used": "Comet" if self.using_comet else "AI/ML"
-                    }
+    def analyze_document_stream(
+        self,
+        content: str,
+        analysis_type: str = "comprehensive",
+        reasoning_level: str = "high",
+        max_tokens: int = 6000
+    ) -> Iterator[str]:
+        """
+        Stream a document analysis as it is generated
+
+        Args:
+            content: Document content to analyze
+            analysis_type: Type of analysis to perform
+            reasoning_level: GPT-5 reasoning effort level
+            max_tokens: Maximum tokens in response
+
+        Yields:
+            Text fragments of the analysis in order
+
+        Raises:
+            ValueError: If no content is provided
+        """
+        if not content or content.isspace():
+            raise ValueError("No content provided for analysis")
+
+        request_params = self._build_analysis_request(content, analysis_type, reasoning_level, max_tokens)
+
+        logger.info(f"Streaming document analysis using {self.model}")
+        yield from self._stream_completion(request_params)
+
+    async def aanalyze_document(
+        self,
+        content: str,
+        analysis_type: str = "comprehensive",
+        reasoning_level: str = "high",
+        max_tokens: int = 6000
+    ) -> Dict[str, Any]:
+        """
+        Analyze a document without blocking the event loop
+
+        Lets callers analyze several documents concurrently, e.g. with
+        asyncio.gather; see analyze_document for arguments and results.
+        """
+        if not content or content.isspace():
+            return {
+                "success": False,
+                "error": "No content provided for analysis"
+            }
+
+        try:
+            request_params = self._build_analysis_request(content, analysis_type, reasoning_level, max_tokens)
+            response = await self._acreate(request_params)
+            return self._analysis_result(response)
+
+        except Exception as e:
+            logger.error(f"Async document analysis failed: {e}")
+            return self._analysis_error(e)
+
+    def _build_analysis_request(
+        self,
+        content: str,
+        analysis_type: str,
+        reasoning_level: str,
+        max_tokens: int
+    ) -> Dict[str, Any]:
+        """Build the chat completion parameters for a document analysis"""
+        system_prompt = self._get_system_prompt(analysis_type)
+
+        # Build request parameters - Use higher token allocation for GPT-5-nano reasoning
+        request_params = self.build_request(
+            [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": f"Analyze the following document:\n\n{content}"}
+            ],
+            max_tokens=max(max_tokens, 4000),  # Ensure minimum 4000 tokens for reasoning + response
+            reasoning_effort=reasoning_level,
+            temperature=0.7
+        )
+
+        return request_params
+
+    def _analysis_result(self, response) -> Dict[str, Any]:
+        """Turn a document analysis response into the analysis result dict"""
+        # Debug logging - guarded so responses are only formatted when DEBUG is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response object: %r", response)
+            if response and response.choices:
+                logger.debug("Number of choices: %d", len(response.choices))
+                logger.debug("Content: %r", response.choices[0].message.content)
+
+        # Check if response has content
+        if response and response.choices and len(response.choices) > 0:
+            content = response.choices[0].message.content
+            if content is None or content == "":
+                logger.warning(f"Empty response content from API: {repr(content)}")
+                logger.debug("Full response: %r", response)
+                content = "The API returned an empty response. This might be due to content filtering or model limitations. Please try with different content or a shorter text."
+        else:
+            logger.error("Invalid response structure from API")
+            logger.debug("Full response: %r", response)
+            content = "Error: Invalid response from API. Please try again."
+
+        usage = getattr(response, 'usage', None)
+        usage_info = usage.model_dump() if usage is not None else None
+
+        return {
+            "success": True,
+            "analysis": content,
+            "usage": usage_info,
+            "model_used": self.model,
+            "api_used": "Comet" if self.using_comet else "AI/ML"
+        }
+
+    def _analysis_error(self, error: Exception) -> Dict[str, Any]:
+        """Build the failure result for a document analysis that exhausted its attempts"""
+        return {
+            "success": False,
+            "error": str(error),
+            "error_type": type(error).__name__,
+            "message": f"API call failed after {self.retry_attempts} attempts. Please check your API key, internet connection, and try again.",
+            "model_used": self.model,
+            "api_used": "Comet" if self.using_comet else "AI/ML"
+        }
 
     def generate_literature_review(
         self,
@@ -164,7 +508,9 @@ class GPT5Client:
         research_question: str,
         review_depth: str = "Comprehensive",
         include_gaps: bool = True,
-        include_future: bool = True
+        include_future: bool = True,
+        summarize_first: bool = False,
+        structured: bool = False
     ) -> Dict[str, Any]:
         """
         Generate a comprehensive literature review from multiple papers
@@ -175,6 +521,10 @@ class GPT5Client:
             review_depth: Depth of analysis
             include_gaps: Whether to identify research gaps
             include_future: Whether to suggest future research
+            summarize_first: Summarize each paper concurrently and review the
+                summaries (map-reduce) instead of truncated full texts
+            structured: Ask for the sections as a JSON object (JSON mode); the
+                result then also carries them under "sections"
 
         Returns:
             Literature review results
@@ -186,76 +536,54 @@ class GPT5Client:
                 "error": "No papers provided for literature review"
             }
 
-        if not research_question or len(research_question.strip()) == 0:
+        if not research_question or research_question.isspace():
             return {
                 "success": False,
                 "error": "No research question provided"
             }
 
         try:
-            # Combine papers for analysis - limit content to avoid token limits
-            combined_content = "\n\n---NEW PAPER---\n\n".join([
-                paper[:3000] for paper in papers[:10] if paper and len(paper.strip()) > 0
-            ])
+            if summarize_first:
+                papers = self.summarize_papers(papers[:10], focus=research_question)
 
-            if not combined_content:
+            request_params = self._build_literature_review_request(
+                papers, research_question, review_depth, include_gaps, include_future, structured
+            )
+
+            if request_params is None:
                 return {
                     "success": False,
                     "error": "No valid paper content found"
                 }
 
-            prompt = f"""
-            Generate a comprehensive literature review based on the following papers.
-
-            Research Question: {research_question}
-            Analysis Depth: {review_depth}
-
-            Please provide:
-            1. Executive Summary
-            2. Key Themes and Findings
-            3. Methodological Approaches
-            4. Theoretical Frameworks
-            {"5. Research Gaps" if include_gaps else ""}
-            {"6. Future Research Directions" if include_future else ""}
-            7. Conclusion
-
-            Papers to analyze:
-            {combined_content}
-            """
-
-            # Build request parameters - Allocate sufficient tokens for reasoning + response
-            request_params = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "You are an expert academic researcher specializing in systematic literature reviews. Provide comprehensive, well-structured reviews with clear sections and evidence-based insights."},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": 6000,  # Higher allocation for comprehensive literature reviews
-                "temperature": 0.7
-            }
-
-            # Add reasoning_effort only if supported
-            if not self.using_comet and "aimlapi" in str(self.client.base_url).lower():
-                request_params["reasoning_effort"] = "high"
-
             logger.info(f"Generating literature review using {self.model}")
             logger.info(f"Papers count: {len(papers)}, Research question: {research_question[:100]}...")
 
-            response = self.client.chat.completions.create(**request_params)
+            response = self._create(request_params)
+
+            # JSON cut off at max_tokens (or not JSON at all) cannot be split into
+            # sections; ask for the markdown review instead
+            sections = self._structured_review_sections(response) if structured else None
+            if structured and sections is None:
+                logger.warning("Structured literature review was truncated or not JSON; requesting markdown")
+                request_params = self._build_literature_review_request(
+                    papers, research_question, review_depth, include_gaps, include_future, False
+                )
+                response = self._create(request_params)
 
             # Check if response has content
             if response and response.choices and len(response.choices) > 0:
                 content = response.choices[0].message.content
-                if not content or content.strip() == "":
+                if not content or content.isspace():
                     logger.warning("Empty literature review response from API")
-                    logger.warning(f"Full response: {response}")
+                    logger.debug("Full response: %r", response)
                     content = f"Literature review generation completed but returned empty content. This may be due to content filtering or API limitations. Please try with shorter papers or a different research question. Papers analyzed: {len(papers)}"
             else:
                 logger.error("Invalid response structure for literature review")
-                logger.error(f"Full response: {response}")
+                logger.debug("Full response: %r", response)
                 content = "Error: Unable to generate literature review due to invalid API response. Please try again."
 
-            return {
+            result = {
                 "success": True,
                 "review": content,
                 "paper_count": len(papers),
@@ -263,6 +591,14 @@ class GPT5Client:
                 "api_used": "Comet" if self.using_comet else "AI/ML"
             }
 
+            # Structured reviews come back as JSON; keep the sections and show them as markdown
+            if sections is not None:
+                result["review"] = "\n\n".join(
+                    f"## {title}\n\n{sections[key]}" for key, title in REVIEW_SECTIONS.items() if sections[key]
+                )
+                result["sections"] = sections
+            return result
+
         except Exception as e:
             logger.error(f"Literature review generation failed: {e}")
             logger.error(f"Exception type: {type(e)}")
@@ -273,10 +609,381 @@ class GPT5Client:
                 "message": f"Failed to generate literature review: {str(e)}"
             }
 
+    def stream_literature_review(
+        self,
+        papers: List[str],
+        research_question: str,
+        review_depth: str = "Comprehensive",
+        include_gaps: bool = True,
+        include_future: bool = True
+    ) -> Iterator[str]:
+        """
+        Stream a literature review as it is generated
+
+        Args:
+            papers: List of paper contents
+            research_question: The research question to focus on
+            review_depth: Depth of analysis
+            include_gaps: Whether to identify research gaps
+            include_future: Whether to suggest future research
+
+        Yields:
+            Text fragments of the review in order
+
+        Raises:
+            ValueError: If no papers, research question or paper content is provided
+        """
+        if not papers:
+            raise ValueError("No papers provided for literature review")
+        if not research_question or research_question.isspace():
+            raise ValueError("No research question provided")
+
+        request_params = self._build_literature_review_request(
+            papers, research_question, review_depth, include_gaps, include_future
+        )
+        if request_params is None:
+            raise ValueError("No valid paper content found")
+
+        logger.info(f"Streaming literature review using {self.model}")
+        yield from self._stream_completion(request_params)
+
+    def build_request(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        reasoning_effort: str = "high",
+        **params
+    ) -> Dict[str, Any]:
+        """
+        Assemble chat completion parameters for this client's model
+
+        Args:
+            messages: Chat messages to send
+            max_tokens: Token budget for reasoning plus response
+            reasoning_effort: Reasoning level, sent only to APIs that support it
+            **params: Further completion parameters, e.g. temperature
+
+        Returns:
+            Request parameters for _create / _acreate
+        """
+        request_params = {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            **params
+        }
+
+        # Add reasoning_effort only if supported (AI/ML API)
+        if self._supports_reasoning_effort:
+            request_params["reasoning_effort"] = reasoning_effort
+        return request_params
+
+    def complete(
+        self,
+        request_params: Dict[str, Any],
+        result_key: str,
+        semantic: Optional[Tuple[str, str]] = None,
+        action: str = "completing request",
+        **extra
+    ) -> Dict[str, Any]:
+        """
+        Send a built request and return its content as result_key, or the error
+
+        Args:
+            request_params: Chat completion parameters, e.g. from build_request
+            result_key: Key the response content is returned under
+            semantic: Optional (scope, text) pair serving near-duplicate texts in
+                the same scope from the semantic cache
+            action: What the request does, for the error log
+            **extra: Further fields for a successful result
+
+        Returns:
+            {"success": True, result_key: content, **extra} or {"success": False, "error": ...}
+        """
+        try:
+            if semantic:
+                response = self._create_semantic(request_params, *semantic)
+            else:
+                response = self._create(request_params)
+
+            return {
+                "success": True,
+                result_key: response.choices[0].message.content,
+                **extra
+            }
+
+        except Exception as e:
+            logger.error(f"Error {action}: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+    async def acomplete(
+        self,
+        request_params: Dict[str, Any],
+        result_key: str,
+        semantic: Optional[Tuple[str, str]] = None,
+        action: str = "completing request",
+        **extra
+    ) -> Dict[str, Any]:
+        """Async counterpart of complete"""
+        try:
+            if semantic:
+                response = await self._acreate_semantic(request_params, *semantic)
+            else:
+                response = await self._acreate(request_params)
+
+            return {
+                "success": True,
+                result_key: response.choices[0].message.content,
+                **extra
+            }
+
+        except Exception as e:
+            logger.error(f"Error {action}: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+    def _create(self, request_params: Dict[str, Any]):
+        """Create a chat completion, serving exact repeats from the response cache"""
+        key = self._cache_key(request_params)
+        cached = self._cache.get(key) if key else None
+        if cached is not None:
+            logger.info("Serving response from cache")
+            return cached
+
+        if key:
+            response = self._in_flight.do(key, lambda: self._send(request_params))
+        else:
+            response = self._send(request_params)
+
+        # Report provider-side prompt caching of the stable system prefix
+        details = getattr(getattr(response, "usage", None), "prompt_tokens_details", None)
+        if details is not None and getattr(details, "cached_tokens", None):
+            logger.info(f"Provider prompt cache reused {details.cached_tokens} prompt tokens")
+
+        # Only cache responses that actually carry content
+        if key and response and response.choices and response.choices[0].message.content:
+            self._cache.set(key, response)
+        return response
+
+    def _send(self, request_params: Dict[str, Any]):
+        """
+        Send a chat completion request, retrying transient failures
+
+        Every attempt waits for the shared rate limiter and a concurrency slot;
+        the slot is released while backing off.
+        """
+        def _attempt():
+            self._limiter.acquire()
+            with _CONCURRENCY:
+                try:
+                    return self.client.chat.completions.create(**request_params)
+                except RateLimitError as e:
+                    self._limiter.cooldown(_retry_after(e) or 10.0)
+                    raise
+
+        return _retry(_attempt, attempts=self.retry_attempts, base=self.retry_delay)
+
+    async def _asend(self, request_params: Dict[str, Any]):
+        """Async counterpart of _send"""
+        async def _attempt():
+            # Client and semaphore are fetched together, so both belong to this loop
+            client, semaphore = await self._get_async_client()
+            await self._limiter.aacquire()
+            async with semaphore:
+                try:
+                    return await client.chat.completions.create(**request_params)
+                except RateLimitError as e:
+                    self._limiter.cooldown(_retry_after(e) or 10.0)
+                    raise
+
+        return await _aretry(_attempt, attempts=self.retry_attempts, base=self.retry_delay)
+
+    def _create_semantic(self, request_params: Dict[str, Any], scope: str, text: str):
+        """
+        Create a chat completion, serving near-duplicate prompts from the semantic cache
+
+        Args:
+            request_params: Chat completion parameters
+            scope: Cache key covering every input except text
+            text: Short free-form prompt part (e.g. the question) compared by similarity
+
+        Returns:
+            Chat completion response
+        """
+        if self._semantic_cache is None or self._cache_key(request_params) is None:
+            return self._create(request_params)
+
+        cached = self._semantic_cache.get(scope, text)
+        if cached is not None:
+            return cached
+
+        response = self._create(request_params)
+        if response and response.choices and response.choices[0].message.content:
+            self._semantic_cache.set(scope, text, response)
+        return response
+
+    async def _acreate_semantic(self, request_params: Dict[str, Any], scope: str, text: str):
+        """Async counterpart of _create_semantic; embedding runs off the event loop"""
+        if self._semantic_cache is None or self._cache_key(request_params) is None:
+            return await self._acreate(request_params)
+
+        cached = await asyncio.to_thread(self._semantic_cache.get, scope, text)
+        if cached is not None:
+            return cached
+
+        response = await self._acreate(request_params)
+        if response and response.choices and response.choices[0].message.content:
+            await asyncio.to_thread(self._semantic_cache.set, scope, text, response)
+        return response
+
+    async def _acreate(self, request_params: Dict[str, Any]):
+        """Async counterpart of _create, sharing the same response cache"""
+        key = self._cache_key(request_params)
+        cached = self._cache.get(key) if key else None
+        if cached is not None:
+            logger.info("Serving response from cache")
+            return cached
+
+        if key:
+            response = await self._in_flight.ado(key, lambda: self._asend(request_params))
+        else:
+            response = await self._asend(request_params)
+
+        if key and response and response.choices and response.choices[0].message.content:
+            self._cache.set(key, response)
+        return response
+
+    @staticmethod
+    def _cache_key(request_params: Dict[str, Any]) -> Optional[str]:
+        """Return the response cache key for a request, or None if it should not be cached"""
+        cacheable = Config.LLM_CACHE_ENABLED and (
+            request_params.get("temperature", 1.0) <= 0 or Config.LLM_CACHE_SAMPLED
+        )
+        return LLMCache.make_key(request_params) if cacheable else None
+
+    def _stream_completion(self, request_params: Dict[str, Any]) -> Iterator[str]:
+        """Yield the content deltas of a streamed chat completion, replaying cached text in one piece"""
+        request_params = {**request_params, "stream": True}
+        key = self._cache_key(request_params)
+        cached = self._cache.get(key) if key else None
+        if cached is not None:
+            logger.info("Serving streamed response from cache")
+            yield cached
+            return
+
+        parts = []
+        for chunk in self._send(request_params):
+            if chunk.choices and chunk.choices[0].delta and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+                yield parts[-1]
+
+        # Only completed streams reach this point; abandoned ones are not cached
+        if key and parts:
+            self._cache.set(key, "".join(parts))
+
+    def _build_literature_review_request(
+        self,
+        papers: List[str],
+        research_question: str,
+        review_depth: str,
+        include_gaps: bool,
+        include_future: bool,
+        structured: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Build chat completion parameters for a literature review, or None if no paper has content"""
+        # Combine papers for analysis - limit content to avoid token limits
+        papers = [paper for paper in papers[:10] if paper and not paper.isspace()]
+        budget = tokens.share_token_budget(7500, len(papers))
+        combined_content = "\n\n---NEW PAPER---\n\n".join([
+            tokens.truncate_tokens(paper, budget) for paper in papers
+        ])
+
+        if not combined_content:
+            return None
+
+        # Assemble line by line so skipped sections leave no blank lines and the
+        # prompt bytes only depend on the inputs
+        lines = [
+            "Generate a comprehensive literature review based on the following papers.",
+            "",
+            f"Research Question: {research_question}",
+            f"Analysis Depth: {review_depth}",
+            "",
+            "Please provide:",
+            "1. Executive Summary",
+            "2. Key Themes and Findings",
+            "3. Methodological Approaches",
+            "4. Theoretical Frameworks"
+        ]
+        if include_gaps:
+            lines.append("5. Research Gaps")
+        if include_future:
+            lines.append("6. Future Research Directions")
+        lines.append("7. Conclusion")
+        if structured:
+            keys = ", ".join(f'"{key}"' for key in REVIEW_SECTIONS)
+            lines += [
+                "",
+                f"Return only a JSON object with the keys {keys}, each holding that section as markdown "
+                "without its heading. Use an empty string for sections not requested."
+            ]
+        lines += ["", "Papers to analyze:", combined_content]
+        prompt = "\n".join(lines)
+
+        # Build request parameters - Allocate sufficient tokens for reasoning + response
+        request_params = self.build_request(
+            [
+                {"role": "system", "content": SYSTEM_PROMPTS["literature_review"]},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=6000,  # Higher allocation for comprehensive literature reviews
+            temperature=0.7
+        )
+        if structured:
+            request_params["response_format"] = {"type": "json_object"}
+
+        return request_params
+
+    @staticmethod
+    def _parse_review_json(content: str) -> Optional[Dict[str, str]]:
+        """Return the sections of a structured review, or None if content is not such a JSON object"""
+        try:
+            parsed = orjson.loads(content) if _ORJSON_AVAILABLE else json.loads(content)
+        except ValueError:
+            return None
+        if not isinstance(parsed, dict):
+            return None
+
+        sections = {key: _section_markdown(parsed.get(key)).strip() for key in REVIEW_SECTIONS}
+        return sections if any(sections.values()) else None
+
+    @classmethod
+    def _structured_review_sections(cls, response) -> Optional[Dict[str, str]]:
+        """Return the sections of a complete structured review response, or None"""
+        if not response or not response.choices:
+            return None
+        choice = response.choices[0]
+        if getattr(choice, "finish_reason", None) == "length" or not choice.message.content:
+            return None
+        return cls._parse_review_json(choice.message.content)
+
     def compare_documents(
         self,
         documents: List[str],
         comparison_aspects: List[str] = None
+    ) -> Dict[str, Any]:
+        """Synchronous facade over acompare_documents for callers without an event loop"""
+        return asyncio.run(self.acompare_documents(documents, comparison_aspects))
+
+    async def acompare_documents(
+        self,
+        documents: List[str],
+        comparison_aspects: List[str] = None
     ) -> Dict[str, Any]:
         """
         Compare multiple documents
@@ -298,29 +1005,13 @@ class GPT5Client:
             ]
 
         try:
-            prompt = f"""
-            Compare the following {len(documents)} documents across these aspects:
-            {', '.join(comparison_aspects)}
-
-            Provide a detailed comparison table and analysis.
-
-            Documents:
-            {"---DOCUMENT SEPARATOR---".join(documents)}
-            """
-
-            request_params = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "You are an expert document analyst."},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": 4000  # Increased for reasoning + response
-            }
+            # Map: extract the aspects from each document concurrently (each extraction
+            # is cached on its own), then reduce: compare the compact extractions
+            extractions = await self.aextract_aspects(documents, comparison_aspects)
 
-            if "aimlapi" in str(self.client.base_url).lower():
-                request_params["reasoning_effort"] = "high"
-
-            response = self.client.chat.completions.create(**request_params)
+            response = await self._acreate(
+                self._build_comparison_request(extractions, comparison_aspects)
+            )
 
             # Check response content
             content = ""
@@ -338,6 +1029,33 @@ class GPT5Client:
                 "error": str(e)
             }
 
+    def _build_comparison_request(
+        self,
+        extractions: List[str],
+        comparison_aspects: List[str]
+    ) -> Dict[str, Any]:
+        """Build chat completion parameters comparing per-document aspect extractions"""
+        prompt = "\n".join(
+            [
+                f"Compare the following {len(extractions)} documents across these aspects:",
+                ', '.join(comparison_aspects),
+                "",
+                "Each document is given as the aspects extracted from it.",
+                "Provide a detailed comparison table and analysis.",
+                "",
+                "Documents:"
+            ]
+            + [f"Document {i}:\n{extraction}\n" for i, extraction in enumerate(extractions, 1)]
+        )
+
+        return self.build_request(
+            [
+                {"role": "system", "content": SYSTEM_PROMPTS["document_comparison"]},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=4000  # Increased for reasoning + response
+        )
+
     def answer_research_question(
         self,
         question: str,
@@ -355,6 +1073,69 @@ class GPT5Client:
         Returns:
             Answer with optional citations
         """
+        if self._question_batcher is None:
+            return self._answer_question(question, context, provide_citations)
+
+        # Questions other sessions ask about the same context at the same moment
+        # are answered together in one request
+        key = LLMCache.make_key({"context": context, "provide_citations": provide_citations})
+        return self._question_batcher.submit(key, (context, provide_citations), question)
+
+    def _answer_questions(self, shared: tuple, questions: List[str]) -> List[Dict[str, Any]]:
+        """
+        Answer several questions about one context with a single request
+
+        Args:
+            shared: (context, provide_citations) common to all questions
+            questions: The research questions
+
+        Returns:
+            One answer result per question, in order. Falls back to one
+            request per question if the combined answer cannot be split.
+        """
+        context, provide_citations = shared
+        if len(questions) == 1:
+            return [self._answer_question(questions[0], context, provide_citations)]
+
+        try:
+            lines = [f"Based on the following context, answer each of these {len(questions)} research questions:", ""]
+            lines += [f"{i}. {question}" for i, question in enumerate(questions, 1)]
+            if provide_citations:
+                lines += ["", "Please provide specific citations from the text to support each answer."]
+            lines += [
+                "",
+                'Return only a JSON object of the form {"answers": [...]} with one answer string per question, in order.',
+                "",
+                "Context:",
+                context
+            ]
+
+            request_params = self.build_request(
+                [
+                    {"role": "system", "content": SYSTEM_PROMPTS["research_question"]},
+                    {"role": "user", "content": "\n".join(lines)}
+                ],
+                max_tokens=2000 + 500 * len(questions),  # Reasoning budget plus room per answer
+                reasoning_effort="medium"
+            )
+            if Config.LLM_JSON_MODE:
+                request_params["response_format"] = {"type": "json_object"}
+
+            logger.info(f"Answering {len(questions)} coalesced research questions in one request")
+            response = self._create(request_params)
+            content = response.choices[0].message.content if response and response.choices else None
+            answers = json.loads(content or "{}").get("answers")
+            if isinstance(answers, list) and len(answers) == len(questions):
+                return [{"success": True, "answer": str(answer)} for answer in answers]
+            logger.warning("Coalesced answer did not match the questions, answering individually")
+
+        except Exception as e:
+            logger.warning(f"Coalesced research questions failed, answering individually: {e}")
+
+        return [self._answer_question(question, context, provide_citations) for question in questions]
+
+    def _answer_question(self, question: str, context: str, provide_citations: bool) -> Dict[str, Any]:
+        """Answer one research question with its own request"""
         try:
             prompt = f"""
             Based on the following context, answer this research question:
@@ -367,19 +1148,23 @@ class GPT5Client:
             {context}
             """
 
-            request_params = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "You are a research assistant. Provide accurate, evidence-based answers."},
+            request_params = self.build_request(
+                [
+                    {"role": "system", "content": SYSTEM_PROMPTS["research_question"]},
                     {"role": "user", "content": prompt}
                 ],
-                "max_tokens": 2000  # Increased for reasoning + response
-            }
-
-            if "aimlapi" in str(self.client.base_url).lower():
-                request_params["reasoning_effort"] = "medium"
+                max_tokens=2000,  # Increased for reasoning + response
+                reasoning_effort="medium"
+            )
 
-            response = self.client.chat.completions.create(**request_params)
+            # Scope semantic matches to this exact context so only the question may vary
+            scope = LLMCache.make_key({
+                "model": self.model,
+                "context": context,
+                "provide_citations": provide_citations,
+                "reasoning_effort": request_params.get("reasoning_effort")
+            })
+            response = self._create_semantic(request_params, scope, question)
 
             # Check response content
             content = ""
@@ -415,13 +1200,13 @@ class GPT5Client:
             Generated hypotheses with rationale
         """
         # Input validation
-        if not research_area or len(research_area.strip()) == 0:
+        if not research_area or research_area.isspace():
             return {
                 "success": False,
                 "error": "No research area provided"
             }
 
-        if not literature_summary or len(literature_summary.strip()) == 0:
+        if not literature_summary or literature_summary.isspace():
             return {
                 "success": False,
                 "error": "No literature summary provided"
@@ -445,33 +1230,28 @@ class GPT5Client:
             Please ensure each hypothesis is clearly numbered and well-structured.
             """
 
-            request_params = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "You are an expert research methodologist specializing in hypothesis generation. Generate clear, testable hypotheses with detailed rationale and methodology."},
+            request_params = self.build_request(
+                [
+                    {"role": "system", "content": SYSTEM_PROMPTS["hypotheses"]},
                     {"role": "user", "content": prompt}
                 ],
-                "max_tokens": 4000,  # Increased significantly for reasoning + response
-                "temperature": 0.7
-            }
-
-            # Add reasoning_effort only if supported
-            if not self.using_comet and "aimlapi" in str(self.client.base_url).lower():
-                request_params["reasoning_effort"] = "high"
+                max_tokens=4000,  # Increased significantly for reasoning + response
+                temperature=0.7
+            )
 
             logger.info(f"Generating {num_hypotheses} hypotheses for research area: {research_area[:100]}...")
-            response = self.client.chat.completions.create(**request_params)
+            response = self._create(request_params)
 
             # Check response content with detailed logging
             if response and response.choices and len(response.choices) > 0:
                 content = response.choices[0].message.content
-                if not content or content.strip() == "":
+                if not content or content.isspace():
                     logger.warning("Empty hypothesis generation response from API")
-                    logger.warning(f"Full response: {response}")
+                    logger.debug("Full response: %r", response)
                     content = f"Hypothesis generation completed but returned empty content. This may be due to content filtering or API limitations. Please try with a different research area or more detailed literature summary. Research area: {research_area}"
             else:
                 logger.error("Invalid response structure for hypothesis generation")
-                logger.error(f"Full response: {response}")
+                logger.debug("Full response: %r", response)
                 content = "Error: Unable to generate hypotheses due to invalid API response. Please try again."
 
             return {
@@ -495,104 +1275,117 @@ class GPT5Client:
 
     def conduct_meta_analysis(
         self,
-        papers: List[str],
+        papers: Iterable[str],
         research_question: str,
         analysis_type: str = "Effect Size Analysis",
         statistical_method: str = "Random Effects Model",
         include_forest_plot: bool = True,
-        include_heterogeneity: bool = True
+        include_heterogeneity: bool = True,
+        summarize_first: bool = False
     ) -> Dict[str, Any]:
         """
         Conduct meta-analysis of multiple research studies
 
         Args:
-            papers: List of paper contents
+            papers: Paper contents (any iterable; only the first 15 are consumed)
             research_question: Research question/hypothesis
             analysis_type: Type of meta-analysis
             statistical_method: Statistical method to use
             include_forest_plot: Whether to describe forest plot
             include_heterogeneity: Whether to assess heterogeneity
+            summarize_first: Summarize each study concurrently and analyze the
+                summaries (map-reduce) instead of truncated full texts
 
         Returns:
             Meta-analysis results
         """
-        # Input validation
-        if not papers or len(papers) < 2:
+        # Pull at most MAX_META_ANALYSIS_STUDIES non-empty studies without materializing the whole corpus
+        studies = [
+            study for study in islice(papers or [], self.MAX_META_ANALYSIS_STUDIES)
+            if study and not study.isspace()
+        ]
+
+        # Input validation, ahead of any summary calls
+        if len(studies) < 2:
             return {
                 "success": False,
                 "error": "At least 2 studies required for meta-analysis"
             }
 
-        if not research_question or len(research_question.strip()) == 0:
+        if not research_question or research_question.isspace():
             return {
                 "success": False,
                 "error": "No research question provided"
             }
 
+        if summarize_first:
+            studies = self.summarize_papers(studies, focus=research_question)
+
+        budget = tokens.share_token_budget(7500, len(studies))
+        studies = [tokens.truncate_tokens(study, budget) for study in studies]
+
         try:
             # Prepare studies for analysis - limit content to avoid token limits
-            studies_content = "\n\n---STUDY SEPARATOR---\n\n".join([
-                study[:2000] for study in papers[:15] if study and len(study.strip()) > 0
-            ])
-
-            prompt = f"""
-            Conduct a comprehensive meta-analysis based on the following research question and studies.
-
-            Research Question: {research_question}
-            Analysis Type: {analysis_type}
-            Statistical Method: {statistical_method}
-
-            Please provide:
-            1. Executive Summary
-            2. Study Characteristics (sample sizes, methodologies, populations)
-            3. Effect Size Analysis (if applicable)
-            4. Statistical Results and Confidence Intervals
-            {"5. Forest Plot Description and Interpretation" if include_forest_plot else ""}
-            {"6. Heterogeneity Assessment (I² statistic, Q-test)" if include_heterogeneity else ""}
-            7. Publication Bias Assessment
-            8. Clinical/Practical Significance
-            9. Limitations and Recommendations
-            10. Conclusion
-
-            Studies to analyze:
-            {studies_content}
-
-            Please ensure statistical rigor and provide specific numerical estimates where possible.
-            """
+            studies_content = "\n\n---STUDY SEPARATOR---\n\n".join(studies)
+
+            lines = [
+                "Conduct a comprehensive meta-analysis based on the following research question and studies.",
+                "",
+                f"Research Question: {research_question}",
+                f"Analysis Type: {analysis_type}",
+                f"Statistical Method: {statistical_method}",
+                "",
+                "Please provide:",
+                "1. Executive Summary",
+                "2. Study Characteristics (sample sizes, methodologies, populations)",
+                "3. Effect Size Analysis (if applicable)",
+                "4. Statistical Results and Confidence Intervals"
+            ]
+            if include_forest_plot:
+                lines.append("5. Forest Plot Description and Interpretation")
+            if include_heterogeneity:
+                lines.append("6. Heterogeneity Assessment (I² statistic, Q-test)")
+            lines += [
+                "7. Publication Bias Assessment",
+                "8. Clinical/Practical Significance",
+                "9. Limitations and Recommendations",
+                "10. Conclusion",
+                "",
+                "Studies to analyze:",
+                studies_content,
+                "",
+                "Please ensure statistical rigor and provide specific numerical estimates where possible."
+            ]
+            prompt = "\n".join(lines)
 
-            request_params = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "You are an expert biostatistician and meta-analysis researcher. Provide rigorous statistical analysis with appropriate caveats about data limitations. Focus on effect sizes, confidence intervals, and heterogeneity assessment."},
+            request_params = self.build_request(
+                [
+                    {"role": "system", "content": SYSTEM_PROMPTS["meta_analysis"]},
                     {"role": "user", "content": prompt}
                 ],
-                "max_tokens": 8000,  # Increased significantly for complex meta-analysis
-                "temperature": 0.7
-            }
-
-            # Add reasoning_effort only if supported
-            if not self.using_comet and "aimlapi" in str(self.client.base_url).lower():
-                request_params["reasoning_effort"] = "high"
+                max_tokens=8000,  # Increased significantly for complex meta-analysis
+                temperature=0.7
+            )
 
-            logger.info(f"Conducting meta-analysis of {len(papers)} studies for: {research_question[:100]}...")
-            response = self.client.chat.completions.create(**request_params)
+            logger.info(f"Conducting meta-analysis of {len(studies)} studies for: {research_question[:100]}...")
+            response = self._create(request_params)
 
             # Check response content
             if response and response.choices and len(response.choices) > 0:
                 content = response.choices[0].message.content
-                if not content or content.strip() == "":
+                if not content or content.isspace():
                     logger.warning("Empty meta-analysis response from API")
-                    logger.warning(f"Full response: {response}")
-                    content = f"Meta-analysis completed but returned empty content. This may be due to content filtering or API limitations. Please try with fewer studies or a different research question. Studies analyzed: {len(papers)}"
+                    logger.debug("Full response: %r", response)
+                    content = f"Meta-analysis completed but returned empty content. This may be due to content filtering or API limitations. Please try with fewer studies or a different research question. Studies analyzed: {len(studies)}"
             else:
                 logger.error("Invalid response structure for meta-analysis")
-                logger.error(f"Full response: {response}")
+                logger.debug("Full response: %r", response)
                 content = "Error: Unable to conduct meta-analysis due to invalid API response. Please try again."
 
             return {
                 "success": True,
                 "analysis": content,
-                "study_count": len(papers),
+                "study_count": len(studies),
                 "analysis_type": analysis_type,
                 "statistical_method": statistical_method,
                 "model_used": self.model,
@@ -613,7 +1406,8 @@ class GPT5Client:
         self,
         papers: List[str],
         synthesis_type: str = "Concept Mapping",
-        research_focus: str = ""
+        research_focus: str = "",
+        summarize_first: bool = False
     ) -> Dict[str, Any]:
         """
         Generate research synthesis across multiple papers
@@ -622,6 +1416,8 @@ class GPT5Client:
             papers: List of paper contents
             synthesis_type: Type of synthesis to perform
             research_focus: Focus area for synthesis
+            summarize_first: Summarize each paper concurrently and synthesize the
+                summaries (map-reduce) instead of truncated full texts
 
         Returns:
             Research synthesis results
@@ -634,9 +1430,14 @@ class GPT5Client:
             }
 
         try:
+            if summarize_first:
+                papers = self.summarize_papers(papers[:self.MAX_SYNTHESIS_PAPERS], focus=research_focus)
+
             # Prepare papers for synthesis
+            selected = [paper for paper in papers[:self.MAX_SYNTHESIS_PAPERS] if paper and not paper.isspace()]
+            budget = tokens.share_token_budget(6250, len(selected))
             papers_content = "\n\n---PAPER SEPARATOR---\n\n".join([
-                paper[:2500] for paper in papers[:10] if paper and len(paper.strip()) > 0
+                tokens.truncate_tokens(paper, budget) for paper in selected
             ])
 
             if synthesis_type == "Concept Mapping":
@@ -646,54 +1447,49 @@ class GPT5Client:
             else:
                 task_description = f"Perform {synthesis_type.lower()} to identify patterns and relationships across the studies."
 
-            prompt = f"""
-            Perform {synthesis_type} across the following research papers.
-
-            Research Focus: {research_focus}
-
-            Task: {task_description}
-
-            Please provide:
-            1. Overview of papers and scope
-            2. Key concepts and themes identified
-            3. Relationships and patterns between studies
-            4. Methodological insights (if applicable)
-            5. Theoretical contributions and frameworks
-            6. Convergent and divergent findings
-            7. Synthesis conclusions and implications
-            8. Recommendations for future research
-
-            Papers to synthesize:
-            {papers_content}
-            """
+            prompt = "\n".join([
+                f"Perform {synthesis_type} across the following research papers.",
+                "",
+                f"Research Focus: {research_focus}",
+                "",
+                f"Task: {task_description}",
+                "",
+                "Please provide:",
+                "1. Overview of papers and scope",
+                "2. Key concepts and themes identified",
+                "3. Relationships and patterns between studies",
+                "4. Methodological insights (if applicable)",
+                "5. Theoretical contributions and frameworks",
+                "6. Convergent and divergent findings",
+                "7. Synthesis conclusions and implications",
+                "8. Recommendations for future research",
+                "",
+                "Papers to synthesize:",
+                papers_content
+            ])
 
-            request_params = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "You are an expert research synthesist. Create comprehensive syntheses that reveal patterns, relationships, and insights across multiple studies. Focus on theoretical connections and methodological innovations."},
+            request_params = self.build_request(
+                [
+                    {"role": "system", "content": SYSTEM_PROMPTS["research_synthesis"]},
                     {"role": "user", "content": prompt}
                 ],
-                "max_tokens": 7000,  # Increased for comprehensive synthesis
-                "temperature": 0.7
-            }
-
-            # Add reasoning_effort only if supported
-            if not self.using_comet and "aimlapi" in str(self.client.base_url).lower():
-                request_params["reasoning_effort"] = "high"
+                max_tokens=7000,  # Increased for comprehensive synthesis
+                temperature=0.7
+            )
 
             logger.info(f"Generating {synthesis_type} for {len(papers)} papers...")
-            response = self.client.chat.completions.create(**request_params)
+            response = self._create(request_params)
 
             # Check response content
             if response and response.choices and len(response.choices) > 0:
                 content = response.choices[0].message.content
-                if not content or content.strip() == "":
+                if not content or content.isspace():
                     logger.warning("Empty research synthesis response from API")
-                    logger.warning(f"Full response: {response}")
+                    logger.debug("Full response: %r", response)
                     content = f"Research synthesis completed but returned empty content. This may be due to content filtering or API limitations. Please try with fewer papers or adjust the research focus. Papers analyzed: {len(papers)}"
             else:
                 logger.error("Invalid response structure for research synthesis")
-                logger.error(f"Full response: {response}")
+                logger.debug("Full response: %r", response)
                 content = "Error: Unable to generate research synthesis due to invalid API response. Please try again."
 
             return {
@@ -738,87 +1534,175 @@ class GPT5Client:
             }
 
         try:
-            # Extract paper information for bibliography
-            paper_info = []
-            for i, paper in enumerate(papers):
-                info = f"Paper {i+1}:\n"
-                info += f"Filename: {paper.get('filename', 'Unknown')}\n"
-                info += f"Content excerpt: {paper.get('content', '')[:500]}...\n"
-                paper_info.append(info)
+            request_params = self._build_bibliography_request(papers, format_style)
+            disk_key = self._persistent_key("bibliography", request_params)
+            cached = self._load_persistent(disk_key)
+            if cached is not None:
+                return {**cached, "cached": True}
 
-            papers_text = "\n\n".join(paper_info)
+            logger.info(f"Generating {format_style} bibliography for {len(papers)} papers...")
+            response = self._create(request_params)
+            return self._bibliography_result(response, papers, format_style, disk_key)
 
-            prompt = f"""
-            Generate a properly formatted bibliography in {format_style} format for the following research papers.
-
-            For each paper, extract or infer the following information where possible:
-            - Author(s)
-            - Title
-            - Publication year
-            - Journal/Publisher
-            - Volume/Issue (if applicable)
-            - Page numbers (if applicable)
-            - DOI or URL (if available)
-
-            Format each entry according to {format_style} guidelines. If information is missing,
-            indicate this clearly and provide the best possible citation with available information.
-
-            Papers to cite:
-            {papers_text}
-
-            Please provide:
-            1. Complete bibliography in {format_style} format
-            2. Notes about any missing information
-            3. Formatting guidelines used
-            """
+        except Exception as e:
+            return self._bibliography_error(e)
 
-            request_params = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": f"You are an expert academic librarian specializing in {format_style} citation format. Generate accurate, properly formatted bibliographies following official style guidelines."},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": 6000,  # Increased for comprehensive bibliographies
-                "temperature": 0.3  # Lower temperature for more consistent formatting
+    async def agenerate_bibliography(
+        self,
+        papers: List[Dict[str, Any]],
+        format_style: str = "APA 7th"
+    ) -> Dict[str, Any]:
+        """
+        Generate a bibliography without blocking the event loop
+
+        See generate_bibliography for arguments and results.
+        """
+        if not papers:
+            return {
+                "success": False,
+                "error": "No papers provided for bibliography"
             }
 
-            # Add reasoning_effort only if supported
-            if not self.using_comet and "aimlapi" in str(self.client.base_url).lower():
-                request_params["reasoning_effort"] = "medium"
+        try:
+            request_params = self._build_bibliography_request(papers, format_style)
+            disk_key = self._persistent_key("bibliography", request_params)
+            cached = self._load_persistent(disk_key)
+            if cached is not None:
+                return {**cached, "cached": True}
 
             logger.info(f"Generating {format_style} bibliography for {len(papers)} papers...")
-            response = self.client.chat.completions.create(**request_params)
+            response = await self._acreate(request_params)
+            return self._bibliography_result(response, papers, format_style, disk_key)
 
-            # Check response content
-            if response and response.choices and len(response.choices) > 0:
-                content = response.choices[0].message.content
-                if not content or content.strip() == "":
-                    logger.warning("Empty bibliography response from API")
-                    logger.warning(f"Full response: {response}")
-                    content = f"Bibliography generation completed but returned empty content. This may be due to insufficient paper metadata. Papers processed: {len(papers)}"
-            else:
-                logger.error("Invalid response structure for bibliography")
-                logger.error(f"Full response: {response}")
-                content = "Error: Unable to generate bibliography due to invalid API response. Please try again."
+        except Exception as e:
+            return self._bibliography_error(e)
 
-            return {
+    def generate_bibliography_stream(
+        self,
+        papers: List[Dict[str, Any]],
+        format_style: str = "APA 7th"
+    ) -> Iterator[str]:
+        """
+        Stream a bibliography as it is generated
+
+        Shares the persistent cache with generate_bibliography; a cached
+        bibliography is yielded in one piece.
+
+        Args:
+            papers: List of paper data with metadata
+            format_style: Citation format style
+
+        Yields:
+            Text fragments of the bibliography
+
+        Raises:
+            ValueError: If no papers are provided
+        """
+        if not papers:
+            raise ValueError("No papers provided for bibliography")
+
+        request_params = self._build_bibliography_request(papers, format_style)
+        disk_key = self._persistent_key("bibliography", request_params)
+        cached = self._load_persistent(disk_key)
+        if cached is not None:
+            yield cached["bibliography"]
+            return
+
+        logger.info(f"Streaming {format_style} bibliography for {len(papers)} papers...")
+        parts = []
+        for part in self._stream_completion(request_params):
+            parts.append(part)
+            yield part
+
+        # Only a fully consumed stream with content is persisted
+        content = "".join(parts)
+        if content and not content.isspace():
+            self._store_persistent(disk_key, {
                 "success": True,
                 "bibliography": content,
                 "paper_count": len(papers),
                 "format_style": format_style,
                 "model_used": self.model,
                 "api_used": "Comet" if self.using_comet else "AI/ML"
-            }
+            })
 
-        except Exception as e:
-            logger.error(f"Bibliography generation failed: {e}")
-            logger.error(f"Exception type: {type(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "message": f"Failed to generate bibliography: {str(e)}"
-            }
+    def _build_bibliography_request(
+        self,
+        papers: List[Dict[str, Any]],
+        format_style: str
+    ) -> Dict[str, Any]:
+        """Build chat completion parameters for a bibliography of papers"""
+        unique = Helpers.unique_papers(papers)
+        if len(unique) < len(papers):
+            logger.info(f"Skipping {len(papers) - len(unique)} duplicate papers in bibliography request")
+        papers = unique
+
+        # Extract paper information for bibliography
+        papers_text = "\n\n".join(
+            f"Paper {i}:\n"
+            f"Filename: {paper.get('filename', 'Unknown')}\n"
+            f"Content excerpt: {tokens.truncate_tokens(paper.get('content', ''), 125)}...\n"
+            for i, paper in enumerate(papers, 1)
+        )
+
+        # The static instructions live in the system prompt; only the papers vary
+        prompt = f"Generate a properly formatted bibliography in {format_style} format for the following research papers.\n\nPapers to cite:\n{papers_text}"
+
+        request_params = self.build_request(
+            [
+                {"role": "system", "content": SYSTEM_PROMPTS["bibliography"]},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=min(6000, 2000 + 300 * len(papers)),  # Reasoning budget plus room per entry
+            reasoning_effort="medium",
+            temperature=0.3  # Lower temperature for more consistent formatting
+        )
+
+        return request_params
+
+    def _bibliography_result(
+        self,
+        response,
+        papers: List[Dict[str, Any]],
+        format_style: str,
+        disk_key: str
+    ) -> Dict[str, Any]:
+        """Turn a bibliography response into the result dictionary, persisting real bibliographies"""
+        # Check response content
+        if response and response.choices and len(response.choices) > 0:
+            content = response.choices[0].message.content
+            if not content or content.isspace():
+                logger.warning("Empty bibliography response from API")
+                logger.debug("Full response: %r", response)
+                content = f"Bibliography generation completed but returned empty content. This may be due to insufficient paper metadata. Papers processed: {len(papers)}"
+        else:
+            logger.error("Invalid response structure for bibliography")
+            logger.debug("Full response: %r", response)
+            content = "Error: Unable to generate bibliography due to invalid API response. Please try again."
+
+        result = {
+            "success": True,
+            "bibliography": content,
+            "paper_count": len(papers),
+            "format_style": format_style,
+            "model_used": self.model,
+            "api_used": "Comet" if self.using_comet else "AI/ML"
+        }
+        if self._response_text(response):
+            self._store_persistent(disk_key, result)
+        return result
+
+    @staticmethod
+    def _bibliography_error(error: Exception) -> Dict[str, Any]:
+        """Log a failed bibliography request and build its error result"""
+        logger.error(f"Bibliography generation failed: {error}")
+        logger.error(f"Exception type: {type(error)}")
+        return {
+            "success": False,
+            "error": str(error),
+            "error_type": type(error).__name__,
+            "message": f"Failed to generate bibliography: {str(error)}"
+        }
 
     def format_citation(
         self,
@@ -835,73 +1719,402 @@ class GPT5Client:
         Returns:
             Formatted citation
         """
+        cache_key = self._citation_cache_key(source_info, format_style)
+        cached = self._get_cached_citation(cache_key)
+        if cached is not None:
+            return self._citation_result(cached, source_info, format_style, cached=True)
+
         try:
-            # Build source description
-            source_desc = f"Source Type: {source_info.get('type', 'Unknown')}\n"
-            for key, value in source_info.items():
-                if value and key != 'type':
-                    source_desc += f"{key.title()}: {value}\n"
+            request_params = self._build_citation_request(source_info, format_style)
 
-            prompt = f"""
-            Generate a properly formatted citation in {format_style} format for the following source:
+            logger.info(f"Formatting {format_style} citation for {source_info.get('type', 'unknown')} source...")
+            response = self._create(request_params)
+            return self._citation_response_result(response, source_info, format_style, cache_key)
+
+        except Exception as e:
+            return self._citation_error(e)
+
+    async def aformat_citation(
+        self,
+        source_info: Dict[str, Any],
+        format_style: str = "APA 7th"
+    ) -> Dict[str, Any]:
+        """
+        Format a single citation without blocking the event loop
+
+        Shares the citation cache with format_citation; see it for arguments
+        and results.
+        """
+        cache_key = self._citation_cache_key(source_info, format_style)
+        cached = self._get_cached_citation(cache_key)
+        if cached is not None:
+            return self._citation_result(cached, source_info, format_style, cached=True)
+
+        try:
+            request_params = self._build_citation_request(source_info, format_style)
+
+            logger.info(f"Formatting {format_style} citation for {source_info.get('type', 'unknown')} source...")
+            response = await self._acreate(request_params)
+            return self._citation_response_result(response, source_info, format_style, cache_key)
+
+        except Exception as e:
+            return self._citation_error(e)
+
+    async def aformat_citations_bulk(
+        self,
+        sources: List[Dict[str, Any]],
+        format_style: str = "APA 7th",
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Format many citations concurrently, one request per source
 
-            {source_desc}
+        Args:
+            sources: List of source information dictionaries
+            format_style: Citation format style
+            max_concurrency: Maximum number of in-flight requests
 
-            Please provide:
-            1. The complete citation in {format_style} format
-            2. Brief explanation of formatting choices
+        Returns:
+            One format_citation result per source, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _format_one(source_info: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.aformat_citation(source_info, format_style)
+
+        return list(await asyncio.gather(*(_format_one(source_info) for source_info in sources)))
+
+    def format_citations_bulk(
+        self,
+        sources: List[Dict[str, Any]],
+        format_style: str = "APA 7th",
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Synchronous facade over aformat_citations_bulk for callers without an event loop"""
+        return asyncio.run(self.aformat_citations_bulk(sources, format_style, max_concurrency))
+
+    def _citation_response_result(
+        self,
+        response,
+        source_info: Dict[str, Any],
+        format_style: str,
+        cache_key: tuple
+    ) -> Dict[str, Any]:
+        """Turn a citation response into the result dictionary, caching real citations"""
+        # Check response content
+        if response and response.choices and len(response.choices) > 0:
+            content = response.choices[0].message.content
+            if not content or content.isspace():
+                logger.warning("Empty citation formatting response from API")
+                logger.debug("Full response: %r", response)
+                content = f"Citation formatting completed but returned empty content. Please check the source information provided."
+            else:
+                self._set_cached_citation(cache_key, content)
+        else:
+            logger.error("Invalid response structure for citation formatting")
+            logger.debug("Full response: %r", response)
+            content = "Error: Unable to format citation due to invalid API response. Please try again."
+
+        return self._citation_result(content, source_info, format_style)
+
+    def _citation_result(
+        self,
+        citation: str,
+        source_info: Dict[str, Any],
+        format_style: str,
+        cached: bool = False
+    ) -> Dict[str, Any]:
+        """Build the result dictionary for a formatted citation"""
+        result = {
+            "success": True,
+            "citation": citation,
+            "format_style": format_style,
+            "source_type": source_info.get('type', 'Unknown'),
+            "model_used": self.model,
+            "api_used": "Comet" if self.using_comet else "AI/ML"
+        }
+        if cached:
+            result["cached"] = True
+        return result
+
+    @staticmethod
+    def _citation_error(error: Exception) -> Dict[str, Any]:
+        """Log a failed citation request and build its error result"""
+        logger.error(f"Citation formatting failed: {error}")
+        logger.error(f"Exception type: {type(error)}")
+        return {
+            "success": False,
+            "error": str(error),
+            "error_type": type(error).__name__,
+            "message": f"Failed to format citation: {str(error)}"
+        }
+
+    def format_citation_stream(
+        self,
+        source_info: Dict[str, Any],
+        format_style: str = "APA 7th"
+    ) -> Iterator[str]:
+        """
+        Stream a single formatted citation as it is generated
 
+        Args:
+            source_info: Dictionary with source information
+            format_style: Citation format style
+
+        Yields:
+            Text fragments of the citation and its explanation
+        """
+        cache_key = self._citation_cache_key(source_info, format_style)
+        cached = self._get_cached_citation(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        logger.info(f"Streaming {format_style} citation for {source_info.get('type', 'unknown')} source...")
+        parts = []
+        for part in self._stream_completion(self._build_citation_request(source_info, format_style)):
+            parts.append(part)
+            yield part
+
+        # Only a fully consumed stream is cached
+        if parts:
+            self._set_cached_citation(cache_key, "".join(parts))
+
+    @staticmethod
+    def _citation_cache_key(source_info: Dict[str, Any], format_style: str) -> tuple:
+        """Build a hashable key from the non-empty source fields and style"""
+        fields = tuple(sorted((k, str(v).strip()) for k, v in source_info.items() if v and str(v).strip()))
+        return (fields, format_style)
+
+    def _get_cached_citation(self, key: tuple) -> Optional[str]:
+        """Return a cached citation from memory or disk and mark it as recently used"""
+        with self._citation_cache_lock:
+            citation = self._citation_cache.get(key)
+            if citation is not None:
+                self._citation_cache.move_to_end(key)
+        if citation is None:
+            citation = self._load_persistent(self._persistent_key("citation", key))
+            if citation is not None:
+                self._remember_citation(key, citation)
+        if citation is not None:
+            logger.info("Citation served from cache")
+        return citation
+
+    def _set_cached_citation(self, key: tuple, citation: str):
+        """Cache a citation in memory and on disk"""
+        self._remember_citation(key, citation)
+        self._store_persistent(self._persistent_key("citation", key), citation)
+
+    def _remember_citation(self, key: tuple, citation: str):
+        """Keep a citation in memory, evicting the least recently used entry when full"""
+        with self._citation_cache_lock:
+            self._citation_cache[key] = citation
+            self._citation_cache.move_to_end(key)
+            if len(self._citation_cache) > self._citation_cache_size:
+                self._citation_cache.popitem(last=False)
+
+    def _persistent_key(self, kind: str, source: Any) -> str:
+        """Hash a result kind, its inputs and the model into a persistent cache key"""
+        return LLMCache.make_key({"kind": kind, "src": source, "model": self.model})
+
+    def _load_persistent(self, key: str) -> Optional[Any]:
+        """Return a value from the persistent cache, or None if missing or unavailable"""
+        if self._disk_cache is None:
+            return None
+        try:
+            return self._disk_cache.get(key)
+        except Exception as e:
+            logger.warning(f"Persistent cache read failed: {e}")
+            return None
+
+    def _store_persistent(self, key: str, value: Any):
+        """Store a value in the persistent cache, ignoring storage errors"""
+        if self._disk_cache is None:
+            return
+        try:
+            self._disk_cache.set(key, value)
+        except Exception as e:
+            logger.warning(f"Persistent cache write failed: {e}")
+
+    def _build_citation_request(
+        self,
+        source_info: Dict[str, Any],
+        format_style: str
+    ) -> Dict[str, Any]:
+        """Build chat completion parameters for formatting one citation"""
+        # Build source description
+        source_desc = "\n".join([
+            f"Source Type: {source_info.get('type', 'Unknown')}",
+            *(f"{key.title()}: {value}" for key, value in source_info.items() if value and key != 'type')
+        ])
+
+        prompt = f"""
+        Generate a properly formatted citation in {format_style} format for the following source:
+
+        {source_desc}
+
+        Please provide:
+        1. The complete citation in {format_style} format
+        2. Brief explanation of formatting choices
+
+        Follow official {format_style} guidelines precisely.
+        """
+
+        request_params = self.build_request(
+            [
+                {"role": "system", "content": SYSTEM_PROMPTS["citation"]},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=2000,  # Increased for detailed citation formatting
+            reasoning_effort="medium",
+            temperature=0.2  # Very low temperature for consistent formatting
+        )
+
+        return request_params
+
+    def format_citations_batch(
+        self,
+        sources: List[Dict[str, Any]],
+        format_style: str = "APA 7th"
+    ) -> Dict[str, Any]:
+        """
+        Format several citations in one request
+
+        Sources the response leaves out are formatted individually
+        (concurrently, via format_citations_bulk) instead of failing the
+        whole batch.
+
+        Args:
+            sources: List of source information dictionaries
+            format_style: Citation format style
+
+        Returns:
+            Formatted citations, one per source in input order
+        """
+        if not sources:
+            return {
+                "success": False,
+                "error": "No sources provided"
+            }
+
+        try:
+            # Number each source so the model can tie every citation to its index
+            source_blocks = []
+            for i, source_info in enumerate(sources, 1):
+                fields = [f"Source Type: {source_info.get('type', 'Unknown')}"]
+                fields.extend(f"{key.title()}: {value}" for key, value in source_info.items() if value and key != 'type')
+                source_blocks.append(f"{i}. " + "; ".join(fields))
+
+            prompt = f"""
+            Format the following {len(sources)} sources in {format_style} format.
+
+            {chr(10).join(source_blocks)}
+
+            Return only a JSON object of the form {{"citations": [{{"index": 1, "citation": "..."}}, ...]}}
+            with one entry per source, where index is the number of the source above.
             Follow official {format_style} guidelines precisely.
             """
 
-            request_params = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": f"You are an expert in {format_style} citation format. Generate precise, properly formatted citations following official guidelines."},
+            request_params = self.build_request(
+                [
+                    {"role": "system", "content": SYSTEM_PROMPTS["citation"]},
                     {"role": "user", "content": prompt}
                 ],
-                "max_tokens": 2000,  # Increased for detailed citation formatting
-                "temperature": 0.2  # Very low temperature for consistent formatting
-            }
-
-            # Add reasoning_effort only if supported
-            if not self.using_comet and "aimlapi" in str(self.client.base_url).lower():
-                request_params["reasoning_effort"] = "medium"
+                max_tokens=2000 + 300 * len(sources),  # Reasoning budget plus room per citation
+                reasoning_effort="medium",
+                temperature=0.2  # Very low temperature for consistent formatting
+            )
+            if Config.LLM_JSON_MODE:
+                request_params["response_format"] = {"type": "json_object"}
 
-            logger.info(f"Formatting {format_style} citation for {source_info.get('type', 'unknown')} source...")
-            response = self.client.chat.completions.create(**request_params)
+            logger.info(f"Formatting {len(sources)} {format_style} citations in one request...")
+            response = self._create(request_params)
 
-            # Check response content
+            content = ""
             if response and response.choices and len(response.choices) > 0:
-                content = response.choices[0].message.content
-                if not content or content.strip() == "":
-                    logger.warning("Empty citation formatting response from API")
-                    logger.warning(f"Full response: {response}")
-                    content = f"Citation formatting completed but returned empty content. Please check the source information provided."
-            else:
-                logger.error("Invalid response structure for citation formatting")
-                logger.error(f"Full response: {response}")
-                content = "Error: Unable to format citation due to invalid API response. Please try again."
+                content = response.choices[0].message.content or ""
+
+            by_index = self._parse_citation_list(content, len(sources))
+            missing = [i for i in range(1, len(sources) + 1) if i not in by_index]
+            if missing:
+                logger.warning(f"Batch response missed {len(missing)} of {len(sources)} citations, formatting them individually")
+                fallback = self.format_citations_bulk([sources[i - 1] for i in missing], format_style)
+                for i, result in zip(missing, fallback):
+                    if not result["success"]:
+                        return {
+                            "success": False,
+                            "error": f"Source {i}: {result.get('error', 'Unknown error')}",
+                            "raw": content
+                        }
+                    by_index[i] = result["citation"]
 
             return {
                 "success": True,
-                "citation": content,
+                "citations": [by_index[i] for i in range(1, len(sources) + 1)],
                 "format_style": format_style,
-                "source_type": source_info.get('type', 'Unknown'),
+                "fallback_count": len(missing),
                 "model_used": self.model,
                 "api_used": "Comet" if self.using_comet else "AI/ML"
             }
 
         except Exception as e:
-            logger.error(f"Citation formatting failed: {e}")
-            logger.error(f"Exception type: {type(e)}")
+            logger.error(f"Batch citation formatting failed: {e}")
             return {
                 "success": False,
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "message": f"Failed to format citation: {str(e)}"
+                "error": str(e)
             }
 
+    @staticmethod
+    def _parse_citation_list(content: str, count: int) -> Dict[int, str]:
+        """
+        Map 1-based source indices to citations parsed from a batch response
+
+        Accepts {"citations": [{"index": i, "citation": "..."}]}, entries given
+        as plain strings (taken positionally), or a bare JSON array wrapped in
+        prose or a code fence when JSON mode is off.
+
+        Args:
+            content: Raw response text
+            count: Number of sources in the request; other indices are dropped
+
+        Returns:
+            Citations by index; indices the response left out are missing
+        """
+        items = None
+        try:
+            parsed = json.loads(content)
+            if isinstance(parsed, dict) and isinstance(parsed.get("citations"), list):
+                items = parsed["citations"]
+        except json.JSONDecodeError:
+            pass
+
+        if items is None:
+            start = content.find("[")
+            end = content.rfind("]")
+            if start == -1 or end <= start:
+                return {}
+            try:
+                items = json.loads(content[start:end + 1])
+            except json.JSONDecodeError:
+                return {}
+            if not isinstance(items, list):
+                return {}
+
+        by_index = {}
+        for position, item in enumerate(items, 1):
+            if isinstance(item, dict):
+                index, citation = item.get("index", position), item.get("citation")
+            else:
+                index, citation = position, item
+            try:
+                index = int(index)
+            except (TypeError, ValueError):
+                continue
+            if 1 <= index <= count and citation is not None and str(citation).strip():
+                by_index[index] = str(citation).strip()
+        return by_index
+
     def analyze_citations(
         self,
         papers: List[str]
@@ -923,90 +2136,664 @@ class GPT5Client:
             }
 
         try:
-            # Prepare papers for analysis
-            papers_content = "\n\n---PAPER SEPARATOR---\n\n".join([
-                paper[:2000] for paper in papers[:10] if paper and len(paper.strip()) > 0
-            ])
+            request_params = self._build_citation_analysis_request(papers)
+            disk_key = self._persistent_key("citation_analysis", request_params)
+            cached = self._load_persistent(disk_key)
+            if cached is not None:
+                return {**cached, "cached": True}
 
-            prompt = f"""
-            Analyze citation patterns and networks across the following research papers.
-
-            Please provide:
-            1. Citation frequency analysis
-            2. Most cited authors and works
-            3. Citation recency patterns (temporal analysis)
-            4. Interdisciplinary citation patterns
-            5. Self-citation analysis
-            6. Citation network insights
-            7. Geographic distribution of citations (if evident)
-            8. Journal/publication venue analysis
-            9. Gaps in citation coverage
-            10. Recommendations for additional references
-
-            Papers to analyze:
-            {papers_content}
-
-            Focus on patterns, trends, and insights that could inform future research.
-            """
+            logger.info(f"Analyzing citation patterns across {len(papers)} papers...")
+            response = self._create(request_params)
+            return self._citation_analysis_result(response, papers, disk_key)
 
-            request_params = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": "You are an expert bibliometrician and citation analyst. Provide comprehensive analysis of citation patterns, networks, and trends. Focus on actionable insights for researchers."},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": 6000,  # Increased for comprehensive citation analysis
-                "temperature": 0.7
+        except Exception as e:
+            return self._citation_analysis_error(e)
+
+    async def aanalyze_citations(
+        self,
+        papers: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Analyze citation patterns without blocking the event loop
+
+        See analyze_citations for arguments and results.
+        """
+        if not papers:
+            return {
+                "success": False,
+                "error": "No papers provided for citation analysis"
             }
 
-            # Add reasoning_effort only if supported
-            if not self.using_comet and "aimlapi" in str(self.client.base_url).lower():
-                request_params["reasoning_effort"] = "high"
+        try:
+            request_params = self._build_citation_analysis_request(papers)
+            disk_key = self._persistent_key("citation_analysis", request_params)
+            cached = self._load_persistent(disk_key)
+            if cached is not None:
+                return {**cached, "cached": True}
 
             logger.info(f"Analyzing citation patterns across {len(papers)} papers...")
-            response = self.client.chat.completions.create(**request_params)
+            response = await self._acreate(request_params)
+            return self._citation_analysis_result(response, papers, disk_key)
 
-            # Check response content
-            if response and response.choices and len(response.choices) > 0:
-                content = response.choices[0].message.content
-                if not content or content.strip() == "":
-                    logger.warning("Empty citation analysis response from API")
-                    logger.warning(f"Full response: {response}")
-                    content = f"Citation analysis completed but returned empty content. This may be due to limited citation information in the provided papers. Papers analyzed: {len(papers)}"
-            else:
-                logger.error("Invalid response structure for citation analysis")
-                logger.error(f"Full response: {response}")
-                content = "Error: Unable to analyze citations due to invalid API response. Please try again."
+        except Exception as e:
+            return self._citation_analysis_error(e)
+
+    def _build_citation_analysis_request(self, papers: List[str]) -> Dict[str, Any]:
+        """Build chat completion parameters for a citation pattern analysis"""
+        # Prepare papers for analysis
+        # Stop after the first 10 non-blank papers instead of scanning them all
+        papers = list(islice((paper for paper in papers if paper and not paper.isspace()), 10))
+        budget = tokens.share_token_budget(5000, len(papers))
+        excerpts = [tokens.truncate_tokens(paper, budget) for paper in papers]
+        papers_content = "\n\n---PAPER SEPARATOR---\n\n".join(excerpts)
+
+        prompt = f"""
+        Analyze citation patterns and networks across the following research papers.
+
+        Please provide:
+        1. Citation frequency analysis
+        2. Most cited authors and works
+        3. Citation recency patterns (temporal analysis)
+        4. Interdisciplinary citation patterns
+        5. Self-citation analysis
+        6. Citation network insights
+        7. Geographic distribution of citations (if evident)
+        8. Journal/publication venue analysis
+        9. Gaps in citation coverage
+        10. Recommendations for additional references
+
+        Papers to analyze:
+        {papers_content}
+
+        Focus on patterns, trends, and insights that could inform future research.
+        """
 
+        request_params = self.build_request(
+            [
+                {"role": "system", "content": SYSTEM_PROMPTS["citation_analysis"]},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=min(6000, 2000 + 400 * len(excerpts)),  # Reasoning budget plus room per paper
+            temperature=0.7
+        )
+
+        return request_params
+
+    def _citation_analysis_result(self, response, papers: List[str], disk_key: str) -> Dict[str, Any]:
+        """Turn a citation analysis response into the result dictionary, persisting real analyses"""
+        # Check response content
+        if response and response.choices and len(response.choices) > 0:
+            content = response.choices[0].message.content
+            if not content or content.isspace():
+                logger.warning("Empty citation analysis response from API")
+                logger.debug("Full response: %r", response)
+                content = f"Citation analysis completed but returned empty content. This may be due to limited citation information in the provided papers. Papers analyzed: {len(papers)}"
+        else:
+            logger.error("Invalid response structure for citation analysis")
+            logger.debug("Full response: %r", response)
+            content = "Error: Unable to analyze citations due to invalid API response. Please try again."
+
+        result = {
+            "success": True,
+            "analysis": content,
+            "paper_count": len(papers),
+            "model_used": self.model,
+            "api_used": "Comet" if self.using_comet else "AI/ML"
+        }
+        if self._response_text(response):
+            self._store_persistent(disk_key, result)
+        return result
+
+    @staticmethod
+    def _citation_analysis_error(error: Exception) -> Dict[str, Any]:
+        """Log a failed citation analysis and build its error result"""
+        logger.error(f"Citation analysis failed: {error}")
+        logger.error(f"Exception type: {type(error)}")
+        return {
+            "success": False,
+            "error": str(error),
+            "error_type": type(error).__name__,
+            "message": f"Failed to analyze citations: {str(error)}"
+        }
+
+    def summarize_papers(
+        self,
+        papers: List[str],
+        focus: str = "",
+        max_concurrency: int = 8,
+        chunk_tokens: int = 4000
+    ) -> List[str]:
+        """
+        Summarize papers in parallel worker threads ahead of a multi-paper analysis
+
+        Synchronous counterpart of asummarize_papers with the same
+        results; requests reuse the shared keep-alive connection pool.
+
+        Args:
+            papers: List of paper contents
+            focus: Research question or focus the summaries should serve
+            max_concurrency: Maximum number of in-flight requests
+            chunk_tokens: Maximum tokens per summarized window
+
+        Returns:
+            One summary per paper, in input order
+        """
+        paper_chunks = [tokens.chunkify(paper, max_tokens=chunk_tokens) for paper in papers]
+        flat_chunks = [chunk for chunks in paper_chunks for chunk in chunks]
+
+        results = self._complete_many(
+            [self._summary_messages(chunk, focus) for chunk in flat_chunks],
+            max_tokens=2000,  # Room for reasoning + a short summary
+            reasoning_effort="low",
+            max_concurrency=max_concurrency
+        )
+
+        return self._join_chunk_summaries(paper_chunks, results)
+
+    async def asummarize_papers(
+        self,
+        papers: List[str],
+        focus: str = "",
+        max_concurrency: int = 8,
+        chunk_tokens: int = 4000
+    ) -> List[str]:
+        """
+        Summarize papers concurrently ahead of a multi-paper analysis
+
+        Each paper is split into windows of chunk_tokens tokens; all windows
+        are summarized in parallel and joined back per paper.
+
+        Args:
+            papers: List of paper contents
+            focus: Research question or focus the summaries should serve
+            max_concurrency: Maximum number of in-flight requests
+            chunk_tokens: Maximum tokens per summarized window
+
+        Returns:
+            One summary per paper, in input order. Windows whose summary
+            request fails fall back to their original text.
+        """
+        paper_chunks = [tokens.chunkify(paper, max_tokens=chunk_tokens) for paper in papers]
+        flat_chunks = [chunk for chunks in paper_chunks for chunk in chunks]
+
+        results = await self._acomplete_many(
+            [self._summary_messages(chunk, focus) for chunk in flat_chunks],
+            max_tokens=2000,  # Room for reasoning + a short summary
+            reasoning_effort="low",
+            max_concurrency=max_concurrency
+        )
+
+        return self._join_chunk_summaries(paper_chunks, results)
+
+    def submit_summary_batch(
+        self,
+        papers: List[str],
+        focus: str = "",
+        chunk_tokens: int = 4000
+    ) -> Dict[str, Any]:
+        """
+        Submit the per-paper summaries of asummarize_papers as a Batch API job
+
+        Batch jobs are billed at half price but may take up to 24 hours;
+        poll them with collect_summary_batch.
+
+        Args:
+            papers: List of paper contents
+            focus: Research question or focus the summaries should serve
+            chunk_tokens: Maximum tokens per summarized window
+
+        Returns:
+            Submission results with the batch_id
+        """
+        try:
+            requests = {}
+            for i, paper in enumerate(papers):
+                for j, chunk in enumerate(tokens.chunkify(paper, max_tokens=chunk_tokens)):
+                    body = self.build_request(
+                        self._summary_messages(chunk, focus),
+                        max_tokens=2000,
+                        reasoning_effort="low"
+                    )
+                    requests[f"paper_{i}_chunk_{j}"] = body
+
+            batch_id = self._submit_batch(requests, "summaries.jsonl")
+            logger.info(f"Submitted summary batch {batch_id} with {len(requests)} requests")
             return {
                 "success": True,
-                "analysis": content,
-                "paper_count": len(papers),
-                "model_used": self.model,
-                "api_used": "Comet" if self.using_comet else "AI/ML"
+                "batch_id": batch_id,
+                "request_count": len(requests)
             }
 
         except Exception as e:
-            logger.error(f"Citation analysis failed: {e}")
-            logger.error(f"Exception type: {type(e)}")
+            logger.error(f"Summary batch submission failed: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "error_type": type(e).__name__,
+                "message": f"Failed to submit batch: {str(e)}"
+            }
+
+    def collect_summary_batch(
+        self,
+        batch_id: str,
+        papers: List[str],
+        chunk_tokens: int = 4000
+    ) -> Dict[str, Any]:
+        """
+        Check a summary batch and collect its results once it has finished
+
+        Args:
+            batch_id: ID returned by submit_summary_batch
+            papers: The paper contents the batch was submitted for
+            chunk_tokens: The chunk_tokens the batch was submitted with
+
+        Returns:
+            Batch status, plus one summary per paper once the status is
+            "completed". Requests that failed fall back to their original text.
+        """
+        try:
+            status, results = self._batch_results(batch_id)
+            if status in ("failed", "expired", "cancelling", "cancelled"):
+                return {
+                    "success": False,
+                    "status": status,
+                    "summaries": None,
+                    "error": f"Batch {batch_id} {status}"
+                }
+            if results is None:
+                return {"success": True, "status": status, "summaries": None}
+
+            paper_chunks = [tokens.chunkify(paper, max_tokens=chunk_tokens) for paper in papers]
+            flat_results = [
+                results.get(f"paper_{i}_chunk_{j}", RuntimeError("Missing from batch output"))
+                for i, chunks in enumerate(paper_chunks)
+                for j in range(len(chunks))
+            ]
+
+            return {
+                "success": True,
+                "status": status,
+                "summaries": self._join_chunk_summaries(paper_chunks, flat_results)
+            }
+
+        except Exception as e:
+            logger.error(f"Summary batch collection failed: {e}")
+            return {
+                "success": False,
+                "status": "unknown",
+                "summaries": None,
+                "error": str(e)
+            }
+
+    def submit_citation_batch(
+        self,
+        sources: List[Dict[str, Any]],
+        format_style: str = "APA 7th"
+    ) -> Dict[str, Any]:
+        """
+        Submit one format_citation request per source as a Batch API job
+
+        For large, non-interactive exports: batch jobs are billed at half
+        price but may take up to 24 hours; poll them with collect_citation_batch.
+
+        Args:
+            sources: List of source information dictionaries
+            format_style: Citation format style
+
+        Returns:
+            Submission results with the batch_id
+        """
+        if not sources:
+            return {
+                "success": False,
+                "error": "No sources provided"
+            }
+
+        try:
+            requests = {
+                f"source_{i}": self._build_citation_request(source_info, format_style)
+                for i, source_info in enumerate(sources)
+            }
+
+            batch_id = self._submit_batch(requests, "citations.jsonl")
+            logger.info(f"Submitted citation batch {batch_id} with {len(requests)} requests")
+            return {
+                "success": True,
+                "batch_id": batch_id,
+                "request_count": len(requests)
+            }
+
+        except Exception as e:
+            logger.error(f"Citation batch submission failed: {e}")
             return {
                 "success": False,
                 "error": str(e),
                 "error_type": type(e).__name__,
-                "message": f"Failed to analyze citations: {str(e)}"
+                "message": f"Failed to submit batch: {str(e)}"
             }
 
-    def _get_system_prompt(self, analysis_type: str) -> str:
+    def collect_citation_batch(
+        self,
+        batch_id: str,
+        sources: List[Dict[str, Any]],
+        format_style: str = "APA 7th"
+    ) -> Dict[str, Any]:
+        """
+        Check a citation batch and collect its results once it has finished
+
+        Collected citations are added to the citation cache, so later
+        format_citation calls for the same sources are served locally.
+
+        Args:
+            batch_id: ID returned by submit_citation_batch
+            sources: The sources the batch was submitted for
+            format_style: The format_style the batch was submitted with
+
+        Returns:
+            Batch status, plus one citation per source (None where the
+            request failed) once the status is "completed"
+        """
+        try:
+            status, results = self._batch_results(batch_id)
+            if status in ("failed", "expired", "cancelling", "cancelled"):
+                return {
+                    "success": False,
+                    "status": status,
+                    "citations": None,
+                    "error": f"Batch {batch_id} {status}"
+                }
+            if results is None:
+                return {"success": True, "status": status, "citations": None}
+
+            citations = []
+            for i, source_info in enumerate(sources):
+                citation = results.get(f"source_{i}")
+                if isinstance(citation, str) and not citation.isspace():
+                    self._set_cached_citation(self._citation_cache_key(source_info, format_style), citation)
+                    citations.append(citation)
+                else:
+                    citations.append(None)
+
+            return {
+                "success": True,
+                "status": status,
+                "citations": citations,
+                "failed_count": citations.count(None)
+            }
+
+        except Exception as e:
+            logger.error(f"Citation batch collection failed: {e}")
+            return {
+                "success": False,
+                "status": "unknown",
+                "citations": None,
+                "error": str(e)
+            }
+
+    def _submit_batch(self, requests: Dict[str, Dict[str, Any]], filename: str) -> str:
+        """
+        Upload chat completion requests as JSONL and start a 24h Batch API job
+
+        Args:
+            requests: Request body by custom_id
+            filename: Name of the uploaded input file
+
+        Returns:
+            The batch ID
+        """
+        lines = [
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body
+            })
+            for custom_id, body in requests.items()
+        ]
+        input_file = self.client.files.create(
+            file=(filename, "\n".join(lines).encode('utf-8')),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+
+    def _batch_results(self, batch_id: str) -> tuple:
+        """
+        Return a batch's status and, once it has completed, its results
+
+        Returns:
+            (status, results) where results maps custom_id to the response
+            text, or to an exception for requests that failed; results is
+            None until the batch has completed
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status != "completed":
+            return batch.status, None
+
+        results: Dict[str, Any] = {}
+        if batch.output_file_id:
+            for line in self.client.files.content(batch.output_file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                try:
+                    results[record["custom_id"]] = record["response"]["body"]["choices"][0]["message"]["content"]
+                except (KeyError, IndexError, TypeError):
+                    results[record["custom_id"]] = RuntimeError(str(record.get("error") or "Empty batch response"))
+        return batch.status, results
+
+    @staticmethod
+    def _summary_messages(chunk: str, focus: str) -> List[Dict[str, str]]:
+        """Build the messages that summarize one paper excerpt"""
+        return [
+            {"role": "system", "content": SYSTEM_PROMPTS["paper_summary"]},
+            {"role": "user", "content": f"Research focus: {focus}\n\nSummarize the following paper excerpt:\n\n{chunk}"}
+        ]
+
+    @staticmethod
+    def _join_chunk_summaries(paper_chunks: List[List[str]], results: List[Any]) -> List[str]:
+        """Join per-chunk summaries back into one summary per paper"""
+        summaries = []
+        position = 0
+        for i, chunks in enumerate(paper_chunks):
+            parts = []
+            for chunk, result in zip(chunks, results[position:position + len(chunks)]):
+                if isinstance(result, Exception):
+                    logger.warning(f"Summary for a chunk of paper {i + 1} failed, using original content: {result}")
+                    parts.append(chunk)
+                else:
+                    parts.append(result or chunk)
+            position += len(chunks)
+            summaries.append("\n\n".join(parts))
+
+        return summaries
+
+    async def aextract_references(
+        self,
+        papers: List[str],
+        max_concurrency: int = 8
+    ) -> List[str]:
+        """
+        Extract each paper's cited works concurrently ahead of citation analysis
+
+        Args:
+            papers: List of paper contents
+            max_concurrency: Maximum number of in-flight requests
+
+        Returns:
+            One compact reference list per paper, in input order. Papers whose
+            request fails fall back to their opening text.
+        """
+        # Reference lists sit at the end of a paper, in-text citations throughout
+        excerpts = [paper[:2000] + "\n...\n" + paper[-8000:] if len(paper) > 10000 else paper for paper in papers]
+
+        results = await self._acomplete_many(
+            [
+                [
+                    {"role": "system", "content": SYSTEM_PROMPTS["reference_extraction"]},
+                    {"role": "user", "content": f"List every work cited in the following paper:\n\n{excerpt}"}
+                ]
+                for excerpt in excerpts
+            ],
+            max_tokens=3000,  # Room for reasoning + a long reference list
+            reasoning_effort="low",
+            max_concurrency=min(max_concurrency, Config.MAX_REQUESTS_PER_MINUTE)
+        )
+
+        references = []
+        for i, (paper, result) in enumerate(zip(papers, results)):
+            if isinstance(result, Exception) or not result:
+                logger.warning(f"Reference extraction for paper {i + 1} failed, using its opening text: {result}")
+                references.append(paper[:2000])
+            else:
+                references.append(result)
+
+        return references
+
+    async def aextract_aspects(
+        self,
+        documents: List[str],
+        aspects: List[str],
+        max_concurrency: int = 8
+    ) -> List[str]:
+        """
+        Extract the given aspects from each document concurrently
+
+        Args:
+            documents: List of document contents
+            aspects: Aspects to extract, e.g. "Methodology"
+            max_concurrency: Maximum number of in-flight requests
+
+        Returns:
+            One JSON object (as text) per document, keyed by aspect, in input
+            order. Documents whose request fails fall back to their opening text.
+        """
+        excerpts = [tokens.truncate_tokens(document, 1000) for document in documents]
+
+        results = await self._acomplete_many(
+            [
+                [
+                    {"role": "system", "content": SYSTEM_PROMPTS["aspect_extraction"]},
+                    {"role": "user", "content": f"Aspects: {', '.join(aspects)}\n\nDocument:\n{excerpt}"}
+                ]
+                for excerpt in excerpts
+            ],
+            max_tokens=2000,  # Room for reasoning + a short JSON object
+            reasoning_effort="low",
+            max_concurrency=max_concurrency,
+            response_format={"type": "json_object"} if Config.LLM_JSON_MODE else None
+        )
+
+        extractions = []
+        for i, (excerpt, result) in enumerate(zip(excerpts, results)):
+            if isinstance(result, Exception) or not result:
+                logger.warning(f"Aspect extraction for document {i + 1} failed, using its opening text: {result}")
+                extractions.append(excerpt)
+            else:
+                extractions.append(result)
+
+        return extractions
+
+    async def _acomplete_many(
+        self,
+        messages_list: List[List[Dict[str, str]]],
+        max_tokens: int,
+        reasoning_effort: str = "low",
+        max_concurrency: int = 8,
+        response_format: Optional[Dict[str, str]] = None
+    ) -> List[Any]:
+        """
+        Run independent chat completions concurrently
+
+        Args:
+            messages_list: One message list per request
+            max_tokens: Token budget for each request
+            reasoning_effort: Reasoning effort where the provider supports it
+            max_concurrency: Maximum number of in-flight requests
+            response_format: Optional response_format, e.g. JSON mode
+
+        Returns:
+            Per request, in input order: the response text, None if the response
+            was empty, or the exception it raised
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _complete_one(messages: List[Dict[str, str]]) -> Optional[str]:
+            request_params = self._many_request_params(messages, max_tokens, reasoning_effort, response_format)
+
+            async with semaphore:
+                return self._response_text(await self._acreate(request_params))
+
+        return await asyncio.gather(
+            *[_complete_one(messages) for messages in messages_list],
+            return_exceptions=True
+        )
+
+    def _complete_many(
+        self,
+        messages_list: List[List[Dict[str, str]]],
+        max_tokens: int,
+        reasoning_effort: str = "low",
+        max_concurrency: int = 8,
+        response_format: Optional[Dict[str, str]] = None
+    ) -> List[Any]:
+        """
+        Run independent chat completions in parallel worker threads
+
+        Same arguments and results as _acomplete_many, for callers that
+        cannot run an event loop.
+        """
+        semaphore = threading.Semaphore(max_concurrency)
+
+        def _complete_one(messages: List[Dict[str, str]]) -> Optional[str]:
+            request_params = self._many_request_params(messages, max_tokens, reasoning_effort, response_format)
+
+            with semaphore:
+                return self._response_text(self._create(request_params))
+
+        futures = [_EXECUTOR.submit(_complete_one, messages) for messages in messages_list]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def _many_request_params(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        reasoning_effort: str,
+        response_format: Optional[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """Build the parameters of one request in a fan-out"""
+        request_params = self.build_request(
+            messages,
+            max_tokens=max_tokens,
+            reasoning_effort=reasoning_effort
+        )
+        if response_format:
+            request_params["response_format"] = response_format
+        return request_params
+
+    @staticmethod
+    def _response_text(response) -> Optional[str]:
+        """Return a response's text, or None if it is empty"""
+        if response and response.choices and len(response.choices) > 0:
+            content = response.choices[0].message.content
+            if content and not content.isspace():
+                return content
+        return None
+
+    @staticmethod
+    def _get_system_prompt(analysis_type: str) -> str:
         """Get appropriate system prompt based on analysis type"""
-        prompts = {
-            "comprehensive": "You are an expert document analyst. Provide comprehensive analysis including summary, key points, insights, and recommendations.",
-            "summary": "You are an expert at summarizing documents. Provide clear, concise summaries.",
-            "research": "You are an academic researcher. Analyze documents from a research perspective.",
-            "legal": "You are a legal document analyst. Focus on legal implications and key terms.",
-            "medical": "You are a medical document analyst. Focus on clinical findings and medical insights.",
-            "financial": "You are a financial analyst. Focus on financial metrics and implications."
-        }
-        return prompts.get(analysis_type, prompts["comprehensive"])
+        return ANALYSIS_SYSTEM_PROMPTS.get(analysis_type, ANALYSIS_SYSTEM_PROMPTS["comprehensive"])
 
     @st.cache_data(ttl=3600)
     def cached_analysis(_self, content: str, analysis_type: str) -> Dict[str, Any]:
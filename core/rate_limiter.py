@@ -0,0 +1,79 @@
+"""Client-side rate limiting for GPT-5 requests"""
+
+import asyncio
+import threading
+import time
+from typing import Dict
+
+
+class RateLimiter:
+    """
+    Token bucket of requests per minute with a shared cooldown
+
+    Every request takes one token before it is sent. After the provider
+    answers with a rate-limit error, cooldown() holds all requests back
+    locally instead of letting each discover the limit with its own 429.
+    """
+
+    def __init__(self, rpm: int = 60):
+        self.rpm = max(rpm, 1)
+        self.tokens = float(self.rpm)
+        self.refill_ts = time.monotonic()
+        self.cooldown_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token if possible; return 0, or the seconds to wait before trying again"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self.cooldown_until:
+                return self.cooldown_until - now
+
+            self.tokens = min(float(self.rpm), self.tokens + (now - self.refill_ts) * self.rpm / 60)
+            self.refill_ts = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) * 60 / self.rpm
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            wait = self._reserve()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def aacquire(self):
+        """Wait without blocking the event loop until a request may be sent"""
+        while True:
+            wait = self._reserve()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def cooldown(self, seconds: float):
+        """Hold back all requests for the next seconds"""
+        with self._lock:
+            self.cooldown_until = max(self.cooldown_until, time.monotonic() + seconds)
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(key: str, rpm: int) -> RateLimiter:
+    """
+    Return the process-wide limiter for key, creating it on first use
+
+    Args:
+        key: Identifies the rate-limited endpoint, e.g. the API base URL
+        rpm: Requests per minute for a newly created limiter
+
+    Returns:
+        Limiter shared by every caller using the same key
+    """
+    with _limiters_lock:
+        if key not in _limiters:
+            _limiters[key] = RateLimiter(rpm)
+        return _limiters[key]
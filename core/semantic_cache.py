@@ -0,0 +1,159 @@
+"""Semantic response cache for near-duplicate GPT-5 prompts"""
+
+import threading
+import time
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from sentence_transformers import SentenceTransformer
+    _SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    _SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+
+class SemanticCache:
+    """
+    Thread-safe cache that returns a stored response when a new prompt's
+    embedding is close enough to a previously answered one.
+
+    Entries are partitioned by scope (e.g. a hash of the model, system prompt
+    and document context) so only prompts asked against the same inputs can
+    match. Embeddings are L2-normalised, so a dot product is cosine similarity.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        threshold: float = 0.92,
+        max_entries: int = 512,
+        ttl_seconds: float = 3600
+    ):
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._model = None
+        self._model_failed = False
+        self._scopes: Dict[str, Dict[str, Any]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        """Whether an embedding model can be used"""
+        return _SENTENCE_TRANSFORMERS_AVAILABLE and not self._model_failed
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Embed text with the local model, loading it on first use"""
+        if not self.available:
+            return None
+        if self._model is None:
+            with self._lock:
+                if self._model is None and not self._model_failed:
+                    try:
+                        self._model = SentenceTransformer(self.model_name, device="cpu")
+                    except Exception as e:
+                        logger.warning(f"Semantic cache disabled, could not load {self.model_name}: {e}")
+                        self._model_failed = True
+                        return None
+        embedding = self._model.encode([text], normalize_embeddings=True)[0]
+        return np.asarray(embedding, dtype=np.float32)
+
+    def get(self, scope: str, text: str) -> Optional[Any]:
+        """
+        Return the response cached for the most similar prompt in scope
+
+        Args:
+            scope: Key identifying everything except the prompt text
+            text: Prompt text to compare against cached prompts
+
+        Returns:
+            Cached response, or None if nothing in scope is similar enough
+        """
+        embedding = self._embed(text)
+        if embedding is None:
+            return None
+
+        with self._lock:
+            self._evict_expired()
+            entries = self._scopes.get(scope)
+            if not entries or not entries["values"]:
+                self.misses += 1
+                return None
+
+            similarities = entries["matrix"] @ embedding
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            logger.info(f"Semantic cache hit (similarity {similarities[best]:.3f})")
+            return entries["values"][best]
+
+    def set(self, scope: str, text: str, value: Any):
+        """Store value for the prompt text in scope"""
+        embedding = self._embed(text)
+        if embedding is None:
+            return
+
+        with self._lock:
+            entries = self._scopes.setdefault(
+                scope,
+                {"matrix": np.empty((0, embedding.shape[0]), dtype=np.float32), "values": [], "expires": []}
+            )
+            entries["matrix"] = np.vstack([entries["matrix"], embedding])
+            entries["values"].append(value)
+            entries["expires"].append(time.monotonic() + self.ttl_seconds)
+            self._size += 1
+
+            while self._size > self.max_entries:
+                self._evict_oldest()
+
+    def clear(self):
+        """Drop all entries and reset the counters"""
+        with self._lock:
+            self._scopes.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit, miss and size counters"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": self._size}
+
+    def _keep(self, scope: str, keep: List[bool]):
+        """Retain only the entries of scope flagged in keep (lock must be held)"""
+        entries = self._scopes[scope]
+        entries["matrix"] = entries["matrix"][np.asarray(keep, dtype=bool)]
+        entries["values"] = [v for v, k in zip(entries["values"], keep) if k]
+        entries["expires"] = [e for e, k in zip(entries["expires"], keep) if k]
+        self._size -= keep.count(False)
+        if not entries["values"]:
+            del self._scopes[scope]
+
+    def _evict_expired(self):
+        """Remove expired entries from every scope (lock must be held)"""
+        now = time.monotonic()
+        for scope in list(self._scopes):
+            keep = [expires > now for expires in self._scopes[scope]["expires"]]
+            if not all(keep):
+                self._keep(scope, keep)
+
+    def _evict_oldest(self):
+        """Remove the entry closest to expiry, i.e. the oldest one (lock must be held)"""
+        scope, index = min(
+            ((s, i) for s, entries in self._scopes.items() for i in range(len(entries["expires"]))),
+            key=lambda item: self._scopes[item[0]]["expires"][item[1]]
+        )
+        keep = [True] * len(self._scopes[scope]["expires"])
+        keep[index] = False
+        self._keep(scope, keep)
@@ -0,0 +1,109 @@
+"""Sharing of identical in-flight GPT-5 requests"""
+
+import asyncio
+import threading
+from concurrent.futures import CancelledError, Future
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class SingleFlight:
+    """
+    Let concurrent callers with the same key share one call
+
+    The first caller of a key runs the call; callers arriving while it is in
+    flight wait for its result instead of issuing their own. Results are
+    handed over through thread-safe futures, so blocking callers in other
+    Streamlit sessions and coroutines on other event loops can share a call.
+    Nothing is kept once the call finishes; repeats after that are the
+    response cache's job. Errors are shared, but if the running caller is
+    cancelled or interrupted, a waiting caller takes over the call instead.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, call: Callable[[], Any]) -> Any:
+        """
+        Return call()'s result, sharing it with concurrent callers of key
+
+        Args:
+            key: Identifies the call; equal keys must mean interchangeable results
+            call: Runs the call when no caller of key is in flight
+
+        Returns:
+            The result of this caller's or the in-flight caller's call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                break
+            try:
+                return future.result()
+            except CancelledError:
+                # The running caller was interrupted; join again and maybe take over
+                pass
+
+        try:
+            result = call()
+        except Exception as e:
+            self._finish(key, future, error=e)
+            raise
+        except BaseException:
+            self._abandon(key, future)
+            raise
+        self._finish(key, future, result=result)
+        return result
+
+    async def ado(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Async counterpart of do; waiting does not block the event loop"""
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                break
+            try:
+                # Shielded so cancelling this waiter leaves the shared future alone
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The running caller was cancelled; join again and maybe take over
+
+        try:
+            result = await call()
+        except Exception as e:
+            self._finish(key, future, error=e)
+            raise
+        except BaseException:
+            self._abandon(key, future)
+            raise
+        self._finish(key, future, result=result)
+        return result
+
+    def _join(self, key: str) -> Tuple[Future, bool]:
+        """Return the future of key's call and whether this caller must run it"""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._inflight[key] = future
+            return future, True
+
+    def _finish(self, key: str, future: Future, result: Any = None, error: BaseException = None):
+        """Stop sharing key's call and hand its outcome to the waiting callers"""
+        with self._lock:
+            del self._inflight[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _abandon(self, key: str, future: Future):
+        """Stop sharing key's interrupted call and send its waiting callers to retry"""
+        with self._lock:
+            del self._inflight[key]
+        future.cancel()
@@ -0,0 +1,119 @@
+"""Token counting, truncation and chunking for GPT-5 prompts"""
+
+import re
+from functools import lru_cache
+from typing import List
+import streamlit as st
+
+try:
+    import tiktoken
+    _TIKTOKEN_AVAILABLE = True
+except ImportError:
+    _TIKTOKEN_AVAILABLE = False
+
+# A word for chunk_text: any run of non-whitespace
+_WORD_RE = re.compile(r'\S+')
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with the cached encoder, approximating ~4 characters per token without it"""
+    encoder = _get_token_encoder()
+    if encoder is None:
+        return len(text) // 4
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to at most max_tokens tokens, approximating ~4 characters per token without the encoder"""
+    if len(text) <= max_tokens:
+        # Every token covers at least one character
+        return text
+    if _get_token_encoder() is None:
+        return text[:max_tokens * 4]
+    return _truncate_encoded(text, max_tokens)
+
+
+def share_token_budget(total_tokens: int, count: int) -> int:
+    """Split a prompt's excerpt budget evenly, so fewer papers each get more of their text"""
+    return total_tokens // max(count, 1)
+
+
+def chunk_text(text: str, max_chunk_size: int = 3000) -> List[str]:
+    """
+    Split text into chunks for processing
+
+    Args:
+        text: Text to chunk
+        max_chunk_size: Maximum size of each chunk
+
+    Returns:
+        List of text chunks
+    """
+    # Chunks are slices of text between word boundaries, so no word lists are built
+    chunks = []
+    start = None
+    last_end = 0
+
+    for match in _WORD_RE.finditer(text):
+        if start is None:
+            start = match.start()
+        elif match.end() - start > max_chunk_size:
+            chunks.append(text[start:last_end])
+            start = match.start()
+        last_end = match.end()
+
+    if start is not None:
+        chunks.append(text[start:last_end])
+
+    return chunks
+
+
+def chunkify(text: str, max_tokens: int = 4000) -> List[str]:
+    """
+    Split text into windows of at most max_tokens tokens
+
+    Args:
+        text: Text to chunk
+        max_tokens: Maximum tokens per chunk
+
+    Returns:
+        List of text chunks (empty for empty text)
+    """
+    if not text or text.isspace():
+        return []
+
+    encoder = _get_token_encoder()
+    if encoder is None:
+        # Without tiktoken, approximate ~4 characters per token
+        return chunk_text(text, max_chunk_size=max_tokens * 4)
+
+    tokens = encoder.encode(text, disallowed_special=())
+    return [
+        encoder.decode(tokens[i:i + max_tokens])
+        for i in range(0, len(tokens), max_tokens)
+    ]
+
+
+@st.cache_resource(show_spinner=False)
+def _get_token_encoder():
+    """Load the tiktoken encoder once per process, or None if tiktoken is missing"""
+    if not _TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # Encodings are downloaded on first use and may be unavailable offline
+        return None
+
+
+@lru_cache(maxsize=256)
+def _truncate_encoded(text: str, max_tokens: int) -> str:
+    """Token-truncate text once; the same paper is cut to the same budget by several prompts"""
+    encoder = _get_token_encoder()
+    # Encode only a prefix long enough for the budget instead of the whole paper.
+    # Tokenization can differ only near the cut, so the prefix must hold a margin
+    # of extra tokens; otherwise (very long tokens) fall back to the full text.
+    tokens = encoder.encode(text[:max_tokens * 8 + 512], disallowed_special=())
+    if len(tokens) < max_tokens + 64:
+        tokens = encoder.encode(text, disallowed_special=())
+    return encoder.decode(tokens[:max_tokens])
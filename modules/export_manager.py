@@ -1,16 +1,132 @@
 """Export functionality for research outputs"""
 
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any, List
-import pandas as pd
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Union
 import json
 
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+# A paragraph is a run of non-empty lines; blank lines separate paragraphs
+_PARAGRAPH_RE = re.compile(r'[^\n]+(?:\n(?!\n)[^\n]+)*')
+
+# LaTeX special characters and their escaped forms
+_LATEX_ESCAPES = {
+    '\\': '\\textbackslash{}',
+    '{': '\\{',
+    '}': '\\}',
+    '$': '\\$',
+    '&': '\\&',
+    '%': '\\%',
+    '#': '\\#',
+    '_': '\\_',
+    '~': '\\textasciitilde{}',
+    '^': '\\textasciicircum{}'
+}
+_LATEX_SPECIAL_RE = re.compile('|'.join(re.escape(char) for char in _LATEX_ESCAPES))
+
+# export_all format keys and the exporter method for each
+_EXPORTERS = {
+    'pdf': 'export_to_pdf',
+    'docx': 'export_to_word',
+    'md': 'export_to_markdown',
+    'tex': 'export_to_latex',
+    'json': 'export_to_json'
+}
+
+# BibTeX entry type for each citation source type
+_BIBTEX_TYPES = {
+    'journal article': 'article',
+    'book': 'book',
+    'conference paper': 'inproceedings',
+    'thesis/dissertation': 'phdthesis',
+    'website': 'misc'
+}
+
+# BibTeX field for each source field, in output order
+_BIBTEX_FIELDS = {
+    'authors': 'author',
+    'title': 'title',
+    'journal': 'journal',
+    'venue': 'howpublished',
+    'publisher': 'publisher',
+    'year': 'year',
+    'volume': 'volume',
+    'issue': 'number',
+    'pages': 'pages',
+    'edition': 'edition',
+    'doi': 'doi',
+    'url': 'url'
+}
+
+# Separators between author names in free-text author lists
+_AUTHOR_SEPARATOR_RE = re.compile(r'\s*(?:;|,?\s+&\s+|\s+and\s+)\s*')
+
+# Output files are written through a large buffer, section by section
+_WRITE_BUFFER = 1 << 20
+
+
+@dataclass(frozen=True)
+class Block:
+    """
+    One format-neutral piece of exported content
+    
+    kind is 'heading' (level 0 for the title, 1 for a group such as the
+    literature review, 2 for a section), 'meta' (text is the value, label
+    the key) or 'paragraph'.
+    """
+    kind: str
+    text: str
+    level: int = 0
+    label: str = ''
+
+@lru_cache(maxsize=None)
+def _pdf_styles() -> Dict[str, Any]:
+    """Build the PDF paragraph styles once; ReportLab is imported on first use"""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    
+    styles = getSampleStyleSheet()
+    return {
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=colors.HexColor('#1E3A8A'),
+            spaceAfter=30,
+            alignment=1  # Center
+        ),
+        'meta': ParagraphStyle(
+            'MetaData',
+            parent=styles['Normal'],
+            fontSize=10,
+            textColor=colors.HexColor('#64748B')
+        ),
+        'content': ParagraphStyle(
+            'ContentStyle',
+            parent=styles['Normal'],
+            fontSize=11,
+            leading=14
+        ),
+        'section': ParagraphStyle(
+            'SectionHeading',
+            parent=styles['Heading2'],
+            fontSize=16,
+            textColor=colors.HexColor('#3B82F6'),
+            spaceBefore=20,
+            spaceAfter=10
+        )
+    }
+
 class ExportManager:
     """Manage export of research results to various formats"""
     
@@ -19,14 +135,14 @@ class ExportManager:
         self._ensure_export_directory()
     
     def _ensure_export_directory(self):
-        """Ensure export directory exists"""
-        if not os.path.exists(self.export_path):
-            os.makedirs(self.export_path)
+        """Ensure export directory exists (re-created if it was deleted since)"""
+        Path(self.export_path).mkdir(parents=True, exist_ok=True)
     
     def export_to_pdf(
         self,
         content: Dict[str, Any],
-        filename: str = None
+        filename: str = None,
+        blocks: Optional[List[Block]] = None
     ) -> str:
         """
         Export content to PDF format
@@ -34,10 +150,14 @@ class ExportManager:
         Args:
             content: Content to export
             filename: Output filename
+            blocks: Blocks of content already built by _iter_blocks
             
         Returns:
             Path to exported file
         """
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+        
         if not filename:
             filename = f"research_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
         
@@ -46,68 +166,29 @@ class ExportManager:
         # Create PDF document
         doc = SimpleDocTemplate(filepath, pagesize=letter)
         story = []
-        styles = getSampleStyleSheet()
-        
-        # Add title
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1E3A8A'),
-            spaceAfter=30,
-            alignment=1  # Center
-        )
-        
-        title = content.get('title', 'Research Export')
-        story.append(Paragraph(title, title_style))
-        story.append(Spacer(1, 12))
+        styles = _pdf_styles()
         
-        # Add metadata
-        if 'metadata' in content:
-            meta_style = ParagraphStyle(
-                'MetaData',
-                parent=styles['Normal'],
-                fontSize=10,
-                textColor=colors.HexColor('#64748B')
-            )
-            
-            for key, value in content['metadata'].items():
-                story.append(Paragraph(f"<b>{key}:</b> {value}", meta_style))
-            story.append(Spacer(1, 20))
-        
-        # Add main content
-        if 'full_review' in content:
-            content_style = ParagraphStyle(
-                'ContentStyle',
-                parent=styles['Normal'],
-                fontSize=11,
-                leading=14
-            )
+        prev_kind = None
+        for block in blocks if blocks is not None else self._iter_blocks(content):
+            if prev_kind == 'meta' and block.kind != 'meta':
+                story.append(Spacer(1, 20))
+            prev_kind = block.kind
             
-            # Split content into paragraphs
-            paragraphs = content['full_review'].split('\n\n')
-            for para in paragraphs:
-                if para.strip():
-                    story.append(Paragraph(para.replace('\n', '<br/>'), content_style))
-                    story.append(Spacer(1, 12))
-        
-        # Add sections if available
-        if 'sections' in content:
-            for section_name, section_content in content['sections'].items():
-                if section_content:
-                    # Section heading
-                    section_style = ParagraphStyle(
-                        'SectionHeading',
-                        parent=styles['Heading2'],
-                        fontSize=16,
-                        textColor=colors.HexColor('#3B82F6'),
-                        spaceBefore=20,
-                        spaceAfter=10
-                    )
-                    
-                    story.append(Paragraph(section_name.replace('_', ' ').title(), section_style))
-                    story.append(Paragraph(section_content.replace('\n', '<br/>'), content_style))
+            if block.kind == 'heading':
+                # Group headings are left out; the PDF separates groups by spacing
+                if block.level == 0:
+                    story.append(Paragraph(block.text, styles['title']))
                     story.append(Spacer(1, 12))
+                elif block.level >= 2:
+                    story.append(Paragraph(block.text, styles['section']))
+            elif block.kind == 'meta':
+                story.append(Paragraph(f"<b>{block.label}:</b> {block.text}", styles['meta']))
+            elif block.kind == 'paragraph':
+                story.append(Paragraph(block.text.replace('\n', '<br/>'), styles['content']))
+                story.append(Spacer(1, 12))
+        
+        if prev_kind == 'meta':
+            story.append(Spacer(1, 20))
         
         # Build PDF
         doc.build(story)
@@ -117,7 +198,8 @@ class ExportManager:
     def export_to_word(
         self,
         content: Dict[str, Any],
-        filename: str = None
+        filename: str = None,
+        blocks: Optional[List[Block]] = None
     ) -> str:
         """
         Export content to Word document
@@ -125,6 +207,7 @@ class ExportManager:
         Args:
             content: Content to export
             filename: Output filename
+            blocks: Blocks of content already built by _iter_blocks
             
         Returns:
             Path to exported file
@@ -141,32 +224,17 @@ class ExportManager:
         # Create document
         doc = Document()
         
-        # Add title
-        title = doc.add_heading(content.get('title', 'Research Export'), 0)
-        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        # Add metadata
-        if 'metadata' in content:
-            doc.add_heading('Document Information', level=1)
-            for key, value in content['metadata'].items():
+        for block in blocks if blocks is not None else self._iter_blocks(content):
+            if block.kind == 'heading':
+                heading = doc.add_heading(block.text, block.level)
+                if block.level == 0:
+                    heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            elif block.kind == 'meta':
                 p = doc.add_paragraph()
-                p.add_run(f"{key}: ").bold = True
-                p.add_run(str(value))
-        
-        # Add main content
-        if 'full_review' in content:
-            doc.add_heading('Literature Review', level=1)
-            paragraphs = content['full_review'].split('\n\n')
-            for para in paragraphs:
-                if para.strip():
-                    doc.add_paragraph(para)
-        
-        # Add sections
-        if 'sections' in content:
-            for section_name, section_content in content['sections'].items():
-                if section_content:
-                    doc.add_heading(section_name.replace('_', ' ').title(), level=2)
-                    doc.add_paragraph(section_content)
+                p.add_run(f"{block.label}: ").bold = True
+                p.add_run(block.text)
+            elif block.kind == 'paragraph':
+                doc.add_paragraph(block.text)
         
         # Save document
         doc.save(filepath)
@@ -193,35 +261,31 @@ class ExportManager:
         
         filepath = os.path.join(self.export_path, filename)
         
-        markdown_content = []
-        
-        # Add title
-        markdown_content.append(f"# {content.get('title', 'Research Export')}\n")
-        
-        # Add metadata
-        if 'metadata' in content:
-            markdown_content.append("## Document Information\n")
-            for key, value in content['metadata'].items():
-                markdown_content.append(f"- **{key}**: {value}")
-            markdown_content.append("")
-        
-        # Add main content
-        if 'full_review' in content:
-            markdown_content.append("## Literature Review\n")
-            markdown_content.append(content['full_review'])
-            markdown_content.append("")
-        
-        # Add sections
-        if 'sections' in content:
-            for section_name, section_content in content['sections'].items():
-                if section_content:
-                    markdown_content.append(f"## {section_name.replace('_', ' ').title()}\n")
-                    markdown_content.append(section_content)
-                    markdown_content.append("")
-        
-        # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(markdown_content))
+        # Each section is written as soon as it is formatted
+        with open(filepath, 'w', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
+            # Add title
+            f.write(f"# {content.get('title', 'Research Export')}\n\n")
+            
+            # Add metadata
+            if 'metadata' in content:
+                f.write("## Document Information\n\n")
+                for key, value in content['metadata'].items():
+                    f.write(f"- **{key}**: {value}\n")
+                f.write("\n")
+            
+            # Add main content
+            if 'full_review' in content:
+                f.write("## Literature Review\n\n")
+                f.write(content['full_review'])
+                f.write("\n\n")
+            
+            # Add sections
+            if 'sections' in content:
+                for section_name, section_content in content['sections'].items():
+                    if section_content:
+                        f.write(f"## {section_name.replace('_', ' ').title()}\n\n")
+                        f.write(section_content)
+                        f.write("\n\n")
         
         return filepath
     
@@ -245,55 +309,49 @@ class ExportManager:
         
         filepath = os.path.join(self.export_path, filename)
         
-        latex_content = []
-        
-        # LaTeX preamble
-        latex_content.extend([
-            "\\documentclass[12pt]{article}",
-            "\\usepackage[utf8]{inputenc}",
-            "\\usepackage{geometry}",
-            "\\geometry{a4paper, margin=1in}",
-            "\\usepackage{hyperref}",
-            "\\usepackage{graphicx}",
-            "",
-            f"\\title{{{content.get('title', 'Research Export')}}}",
-            f"\\author{{IntelliDoc Research Pro}}",
-            f"\\date{{\\today}}",
-            "",
-            "\\begin{document}",
-            "\\maketitle",
-            ""
-        ])
-        
-        # Add abstract if available
-        if 'executive_summary' in content.get('sections', {}):
-            latex_content.extend([
-                "\\begin{abstract}",
-                self._escape_latex(content['sections']['executive_summary']),
-                "\\end{abstract}",
+        # Each section is escaped and written as soon as it is reached
+        with open(filepath, 'w', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
+            # LaTeX preamble
+            f.write("\n".join([
+                "\\documentclass[12pt]{article}",
+                "\\usepackage[utf8]{inputenc}",
+                "\\usepackage{geometry}",
+                "\\geometry{a4paper, margin=1in}",
+                "\\usepackage{hyperref}",
+                "\\usepackage{graphicx}",
+                "",
+                f"\\title{{{content.get('title', 'Research Export')}}}",
+                f"\\author{{IntelliDoc Research Pro}}",
+                f"\\date{{\\today}}",
+                "",
+                "\\begin{document}",
+                "\\maketitle",
+                "",
                 ""
-            ])
-        
-        # Add main content
-        if 'full_review' in content:
-            latex_content.append("\\section{Literature Review}")
-            latex_content.append(self._escape_latex(content['full_review']))
-            latex_content.append("")
-        
-        # Add sections
-        if 'sections' in content:
-            for section_name, section_content in content['sections'].items():
-                if section_content and section_name != 'executive_summary':
-                    section_title = section_name.replace('_', ' ').title()
-                    latex_content.append(f"\\section{{{section_title}}}")
-                    latex_content.append(self._escape_latex(section_content))
-                    latex_content.append("")
-        
-        latex_content.append("\\end{document}")
-        
-        # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(latex_content))
+            ]))
+            
+            # Add abstract if available
+            if 'executive_summary' in content.get('sections', {}):
+                f.write("\\begin{abstract}\n")
+                f.write(self._escape_latex(content['sections']['executive_summary']))
+                f.write("\n\\end{abstract}\n\n")
+            
+            # Add main content
+            if 'full_review' in content:
+                f.write("\\section{Literature Review}\n")
+                f.write(self._escape_latex(content['full_review']))
+                f.write("\n\n")
+            
+            # Add sections
+            if 'sections' in content:
+                for section_name, section_content in content['sections'].items():
+                    if section_content and section_name != 'executive_summary':
+                        section_title = section_name.replace('_', ' ').title()
+                        f.write(f"\\section{{{section_title}}}\n")
+                        f.write(self._escape_latex(section_content))
+                        f.write("\n\n")
+            
+            f.write("\\end{document}\n")
         
         return filepath
     
@@ -324,15 +382,58 @@ class ExportManager:
             **content
         }
         
-        # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        # Write to file; orjson serializes straight to UTF-8 bytes
+        if _ORJSON_AVAILABLE:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, indent=2, ensure_ascii=False)
         
         return filepath
     
+    def export_all(
+        self,
+        content: Dict[str, Any],
+        formats: Iterable[str] = ("pdf", "docx", "md", "tex", "json")
+    ) -> Dict[str, str]:
+        """
+        Export content to several formats in parallel
+        
+        Args:
+            content: Content to export
+            formats: Format keys (pdf, docx, md, tex, json)
+            
+        Returns:
+            Path to the exported file for each format
+            
+        Raises:
+            ValueError: If a format is not supported
+        """
+        formats = list(dict.fromkeys(formats))
+        unknown = [fmt for fmt in formats if fmt not in _EXPORTERS]
+        if unknown:
+            raise ValueError(f"Unsupported export format(s): {', '.join(unknown)}")
+        if not formats:
+            return {}
+        
+        # PDF and Word render the same blocks, so content is only walked once
+        kwargs = {}
+        if 'pdf' in formats or 'docx' in formats:
+            blocks = list(self._iter_blocks(content))
+            kwargs = {fmt: {'blocks': blocks} for fmt in ('pdf', 'docx')}
+        
+        # Exporters overlap their file writes; rendering itself still shares the GIL
+        with ThreadPoolExecutor(max_workers=min(len(formats), os.cpu_count() or 1)) as executor:
+            futures = {
+                fmt: executor.submit(getattr(self, _EXPORTERS[fmt]), content, **kwargs.get(fmt, {}))
+                for fmt in formats
+            }
+            return {fmt: future.result() for fmt, future in futures.items()}
+    
     def export_bibliography(
         self,
-        citations: List[str],
+        citations: List[Union[str, Dict[str, Any]]],
         format: str = "txt",
         filename: str = None
     ) -> str:
@@ -340,8 +441,10 @@ class ExportManager:
         Export bibliography in various formats
         
         Args:
-            citations: List of formatted citations
-            format: Export format (txt, bib, ris)
+            citations: Formatted citation strings, or source dictionaries
+                (type, authors, title, journal, year, ...) for structured
+                BibTeX records
+            format: Export format (txt, bib)
             filename: Output filename
             
         Returns:
@@ -357,19 +460,96 @@ class ExportManager:
                 f.write("Bibliography\n")
                 f.write("=" * 50 + "\n\n")
                 for i, citation in enumerate(citations, 1):
+                    if isinstance(citation, dict):
+                        citation = ". ".join(
+                            ", ".join(value) if isinstance(value, list) else str(value)
+                            for value in (citation.get(key) for key in _BIBTEX_FIELDS) if value
+                        )
                     f.write(f"[{i}] {citation}\n\n")
         
         elif format == "bib":
             # BibTeX format
             with open(filepath, 'w', encoding='utf-8') as f:
                 for i, citation in enumerate(citations, 1):
-                    f.write(f"@article{{ref{i},\n")
-                    f.write(f"  title = {{{citation}}},\n")
-                    f.write(f"  year = {{2024}}\n")
-                    f.write("}\n\n")
+                    f.write(self._bibtex_entry(f"ref{i}", citation))
+                    f.write("\n")
         
         return filepath
     
+    def _bibtex_entry(self, key: str, citation: Union[str, Dict[str, Any]]) -> str:
+        """
+        Render one BibTeX record
+        
+        Args:
+            key: Citation key
+            citation: Source dictionary, or an already formatted citation,
+                which can only be kept as a note of a misc entry
+            
+        Returns:
+            BibTeX entry text
+        """
+        if not isinstance(citation, dict):
+            return f"@misc{{{key},\n  note = {{{self._escape_latex(citation)}}}\n}}\n"
+        
+        entry_type = _BIBTEX_TYPES.get(str(citation.get('type', '')).lower(), 'misc')
+        fields = []
+        for source_field, bibtex_field in _BIBTEX_FIELDS.items():
+            value = citation.get(source_field)
+            if not value:
+                continue
+            if source_field == 'authors':
+                names = value if isinstance(value, list) else _AUTHOR_SEPARATOR_RE.split(str(value))
+                value = " and ".join(name.strip() for name in names if name.strip())
+            value = str(value) if source_field in ('doi', 'url') else self._escape_latex(str(value))
+            fields.append(f"  {bibtex_field} = {{{value}}}")
+        
+        return f"@{entry_type}{{{key},\n" + ",\n".join(fields) + "\n}\n"
+    
+    def _iter_blocks(self, content: Dict[str, Any]) -> Iterator[Block]:
+        """
+        Yield content as format-neutral blocks for the document exporters
+        
+        Args:
+            content: Content to export
+            
+        Yields:
+            The title, metadata, literature review paragraphs and sections in
+            document order
+        """
+        yield Block('heading', content.get('title', 'Research Export'), 0)
+        
+        if 'metadata' in content:
+            yield Block('heading', 'Document Information', 1)
+            for key, value in content['metadata'].items():
+                yield Block('meta', str(value), label=str(key))
+        
+        if 'full_review' in content:
+            yield Block('heading', 'Literature Review', 1)
+            for para in self._iter_paragraphs(content['full_review']):
+                yield Block('paragraph', para)
+        
+        if 'sections' in content:
+            for section_name, section_content in content['sections'].items():
+                if section_content:
+                    yield Block('heading', section_name.replace('_', ' ').title(), 2)
+                    yield Block('paragraph', section_content)
+    
+    @staticmethod
+    def _iter_paragraphs(text: str) -> Iterator[str]:
+        """
+        Yield the non-blank paragraphs of text without splitting it into a list
+        
+        Args:
+            text: Text whose paragraphs are separated by blank lines
+            
+        Yields:
+            Paragraphs in order, with their internal line breaks
+        """
+        for match in _PARAGRAPH_RE.finditer(text):
+            paragraph = match.group(0)
+            if paragraph.strip():
+                yield paragraph
+    
     def _escape_latex(self, text: str) -> str:
         """
         Escape special LaTeX characters
@@ -380,20 +560,5 @@ class ExportManager:
         Returns:
             Escaped text
         """
-        replacements = {
-            '\\': '\\textbackslash{}',
-            '{': '\\{',
-            '}': '\\}',
-            '$': '\\$',
-            '&': '\\&',
-            '%': '\\%',
-            '#': '\\#',
-            '_': '\\_',
-            '~': '\\textasciitilde{}',
-            '^': '\\textasciicircum{}'
-        }
-        
-        for char, replacement in replacements.items():
-            text = text.replace(char, replacement)
-        
-        return text
\ No newline at end of file
+        # One pass, so replacements are never escaped again by later rules
+        return _LATEX_SPECIAL_RE.sub(lambda match: _LATEX_ESCAPES[match.group(0)], text)
\ No newline at end of file
@@ -1,36 +1,99 @@
 """File processing module for handling various document formats"""
 
 import io
+import os
+import gzip
 import base64
-from typing import List, Dict, Any, Optional
-from pypdf import PdfReader
-from PIL import Image
+import shutil
+import hashlib
+import importlib.metadata
+import logging
+import tempfile
+import threading
+import time
+import multiprocessing
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Callable
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from config.settings import Config
+from core.disk_cache import DiskCache
+from core import tokens
+
+logger = logging.getLogger(__name__)
+
+# Bump when this module changes the text it extracts from PDFs (e.g. block
+# ordering), so the persistent parse cache stops serving the old text
+_PDF_TEXT_REVISION = 2
+
+try:
+    import fitz
+    _PYMUPDF_AVAILABLE = True
+except ImportError:
+    _PYMUPDF_AVAILABLE = False
+
+# Image formats sent to GPT-5 unchanged, by file signature
+_PASSTHROUGH_IMAGE_TYPES = (
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg')
+)
+
+# Set inside parse worker processes, which have no Streamlit session to show
+# errors in; messages are collected here and shown by the calling thread
+_worker_errors: Optional[List[str]] = None
+
+
+def _report_error(message: str):
+    """Show a parsing error, or collect it when running in a parse worker process"""
+    if _worker_errors is not None:
+        _worker_errors.append(message)
+    else:
+        st.error(message)
 
 class FileProcessor:
     """Process various file formats for analysis"""
     
     @staticmethod
-    def process_uploaded_files(uploaded_files) -> List[Dict[str, Any]]:
+    def process_uploaded_files(
+        uploaded_files,
+        max_workers: int = 8,
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Process multiple uploaded files
+        Process multiple uploaded files in parallel
         
         Args:
             uploaded_files: List of uploaded file objects from Streamlit
+            max_workers: Maximum number of files parsed concurrently
+            on_progress: Optional callback receiving (completed, total) as files finish
             
         Returns:
-            List of processed file data
+            List of processed file data, in upload order
         """
-        processed_files = []
+        # Reject oversize and disallowed files before any of their bytes are read
+        files = [file for file in uploaded_files if FileProcessor.validate_file(file)]
+        if not files:
+            return []
         
-        for file in uploaded_files:
-            if file is not None:
-                file_data = FileProcessor.process_single_file(file)
-                if file_data:
-                    processed_files.append(file_data)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(files)
+        ctx = get_script_run_ctx()
         
-        return processed_files
+        def _process(file):
+            # Worker threads need the script context for st.error/st.cache_data
+            if ctx:
+                add_script_run_ctx(threading.current_thread(), ctx)
+            return FileProcessor.process_single_file(file)
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as executor:
+            futures = {executor.submit(_process, file): i for i, file in enumerate(files)}
+            for completed, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
+                if on_progress:
+                    on_progress(completed, len(files))
+        
+        return [file_data for file_data in results if file_data]
     
     @staticmethod
     def process_single_file(file) -> Optional[Dict[str, Any]]:
@@ -47,64 +110,123 @@ class FileProcessor:
             file_extension = file.name.split('.')[-1].lower()
             
             # Check file size
-            file_size_mb = file.size / (1024 * 1024)
-            if file_size_mb > Config.MAX_FILE_SIZE_MB:
+            if file.size > Config.MAX_FILE_SIZE_BYTES:
                 st.error(f"File {file.name} exceeds maximum size of {Config.MAX_FILE_SIZE_MB}MB")
                 return None
+            file_size_mb = file.size / (1024 * 1024)
             
-            # Process based on file type
-            if file_extension == 'pdf':
-                content = FileProcessor.extract_pdf_text(file)
-            elif file_extension == 'txt':
-                content = FileProcessor.extract_text(file)
-            elif file_extension in ['jpg', 'jpeg', 'png']:
-                content = FileProcessor.process_image(file)
-            elif file_extension == 'docx':
-                content = FileProcessor.extract_docx_text(file)
+            if file.size > Config.STREAM_THRESHOLD_BYTES:
+                # Large files are copied in 1MB chunks to a spool that rolls over to disk
+                with tempfile.SpooledTemporaryFile(max_size=Config.STREAM_THRESHOLD_BYTES) as spool:
+                    file.seek(0)
+                    shutil.copyfileobj(file, spool, length=1 << 20)
+                    spool.seek(0)
+                    parsed = FileProcessor._with_counts(FileProcessor.process_stream(spool, file.name), file_extension)
             else:
+                # Parse through the cache so reruns skip re-extracting and re-counting unchanged files
+                parsed = _parse_file_bytes(file.getvalue(), file.name)
+            if parsed is None:
                 st.warning(f"Unsupported file type: {file_extension}")
                 return None
             
             return {
                 "filename": file.name,
-                "content": content,
                 "type": file_extension,
-                "size": file_size_mb
+                "size": file_size_mb,
+                **parsed
             }
             
         except Exception as e:
             st.error(f"Error processing file {file.name}: {str(e)}")
             return None
     
+    @staticmethod
+    def _parse(file_bytes: bytes, filename: str) -> Optional[str]:
+        """
+        Extract content from raw file bytes based on the file extension
+        
+        Args:
+            file_bytes: Raw uploaded file contents
+            filename: Original filename (used to pick the parser)
+            
+        Returns:
+            Extracted content or None if the file type is unsupported
+        """
+        buffer = io.BytesIO(file_bytes)
+        buffer.name = filename
+        return FileProcessor.process_stream(buffer, filename)
+    
+    @staticmethod
+    def _with_counts(content: Optional[str], file_extension: str) -> Optional[Dict[str, Any]]:
+        """Bundle extracted content with its word and token counts"""
+        if content is None:
+            return None
+        if file_extension in ['jpg', 'jpeg', 'png']:
+            # Images carry a base64 data URL, not countable text
+            return {"content": content, "word_count": 0, "token_count": 0}
+        return {
+            "content": content,
+            "word_count": len(content.split()),
+            "token_count": FileProcessor.count_tokens(content)
+        }
+    
+    @staticmethod
+    def process_stream(stream, filename: str) -> Optional[str]:
+        """
+        Extract content from a seekable file-like object based on the file extension
+        
+        Args:
+            stream: Seekable binary stream positioned at the start of the file
+            filename: Original filename (used to pick the parser)
+            
+        Returns:
+            Extracted content or None if the file type is unsupported
+        """
+        file_extension = filename.split('.')[-1].lower()
+        
+        if file_extension == 'pdf':
+            return FileProcessor.extract_pdf_text(stream)
+        elif file_extension == 'txt':
+            return FileProcessor.extract_text(stream)
+        elif file_extension in ['jpg', 'jpeg', 'png']:
+            return FileProcessor.process_image(stream)
+        elif file_extension == 'docx':
+            return FileProcessor.extract_docx_text(stream)
+        return None
+    
     @staticmethod
     def extract_pdf_text(file) -> str:
-        """Extract text from PDF file"""
+        """Extract text from PDF file, with PyMuPDF when installed and pypdf otherwise"""
+        if _PYMUPDF_AVAILABLE:
+            try:
+                with fitz.open(stream=file.read(), filetype="pdf") as doc:
+                    return "\n\n".join(_pymupdf_page_text(page) for page in doc).strip()
+            except Exception:
+                # Retry malformed PDFs with pypdf, which is more lenient
+                file.seek(0)
+        
         try:
+            from pypdf import PdfReader
             pdf_reader = PdfReader(file)
-            text = ""
-            
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text += page.extract_text() + "\n\n"
-            
-            return text.strip()
+            return _extract_page_range(pdf_reader, 0, len(pdf_reader.pages)).strip()
             
         except Exception as e:
-            st.error(f"Error extracting PDF text: {str(e)}")
+            _report_error(f"Error extracting PDF text: {str(e)}")
             return ""
     
     @staticmethod
     def extract_text(file) -> str:
         """Extract text from text file"""
+        # Read once; the fallback decodes the same bytes instead of re-reading the file
+        data = file.read()
         try:
-            return file.read().decode('utf-8')
+            return data.decode('utf-8')
         except UnicodeDecodeError:
             try:
                 # Try with different encoding
-                file.seek(0)
-                return file.read().decode('latin-1')
+                return data.decode('latin-1')
             except:
-                st.error("Unable to decode text file")
+                _report_error("Unable to decode text file")
                 return ""
     
     @staticmethod
@@ -113,69 +235,180 @@ class FileProcessor:
         try:
             import docx
             doc = docx.Document(file)
-            text = []
-            
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text.append(paragraph.text)
-            
-            return "\n\n".join(text)
+            # paragraph.text rebuilds the string from its runs, so read it once per paragraph
+            texts = (paragraph.text for paragraph in doc.paragraphs)
+            return "\n\n".join(text for text in texts if text and not text.isspace())
             
         except Exception as e:
-            st.error(f"Error extracting DOCX text: {str(e)}")
+            _report_error(f"Error extracting DOCX text: {str(e)}")
             return ""
     
     @staticmethod
     def process_image(file) -> str:
         """Process image file for GPT-5 multimodal analysis"""
         try:
-            # Read image
-            image = Image.open(file)
+            from PIL import Image
+            data = file.read()
+            # Only the header is read here; pixels are decoded if the image is re-encoded
+            image = Image.open(io.BytesIO(data))
+            max_dimension = Config.IMAGE_MAX_DIMENSION
+            
+            if max(image.size) <= max_dimension:
+                # PNG and JPEG are accepted as-is, so their bytes skip decoding and re-encoding
+                for signature, mime in _PASSTHROUGH_IMAGE_TYPES:
+                    if data.startswith(signature):
+                        return f"data:{mime};base64,{base64.b64encode(data).decode()}"
+                image_format, mime = "PNG", "image/png"
+            else:
+                # Larger images cost more to send and analyze than the detail they add
+                image.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+                if "A" in image.mode or "transparency" in image.info:
+                    image_format, mime = "PNG", "image/png"
+                else:
+                    image = image.convert("RGB")
+                    image_format, mime = "JPEG", "image/jpeg"
             
             # Convert to base64 for GPT-5
             buffered = io.BytesIO()
-            image.save(buffered, format="PNG")
+            if image_format == "JPEG":
+                image.save(buffered, format="JPEG", quality=85, optimize=True)
+            else:
+                image.save(buffered, format="PNG")
             img_base64 = base64.b64encode(buffered.getvalue()).decode()
             
             # Return as data URL for GPT-5
-            return f"data:image/png;base64,{img_base64}"
+            return f"data:{mime};base64,{img_base64}"
             
         except Exception as e:
-            st.error(f"Error processing image: {str(e)}")
+            _report_error(f"Error processing image: {str(e)}")
             return ""
     
     @staticmethod
-    def chunk_text(text: str, max_chunk_size: int = 3000) -> List[str]:
+    def persist_processed(processed: Dict[str, Any], storage_dir: str) -> Dict[str, Any]:
         """
-        Split text into chunks for processing
+        Move extracted text to a gzip'd file so callers only keep metadata
         
         Args:
-            text: Text to chunk
-            max_chunk_size: Maximum size of each chunk
+            processed: Processed file data from process_single_file
+            storage_dir: Directory to write the text file into
             
         Returns:
-            List of text chunks
+            Processed file metadata with sha1 and text_path instead of content
         """
-        words = text.split()
-        chunks = []
-        current_chunk = []
-        current_size = 0
+        content = processed.get("content", "")
+        sha1 = hashlib.sha1(content.encode('utf-8')).hexdigest()
+        text_path = os.path.join(storage_dir, f"{sha1}.txt.gz")
         
-        for word in words:
-            word_size = len(word) + 1  # +1 for space
-            
-            if current_size + word_size > max_chunk_size:
-                chunks.append(" ".join(current_chunk))
-                current_chunk = [word]
-                current_size = word_size
-            else:
-                current_chunk.append(word)
-                current_size += word_size
+        # Files are content-addressed, so identical uploads (from any session)
+        # share one copy; reuse refreshes its age for prune_text_store
+        try:
+            os.utime(text_path)
+        except FileNotFoundError:
+            # Write under a unique name and rename, so a concurrent reader or
+            # writer of the same text never sees a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=storage_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as raw, gzip.open(raw, 'wt', encoding='utf-8') as f:
+                    f.write(content)
+                os.replace(tmp_path, text_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
         
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
+        metadata = {k: v for k, v in processed.items() if k != "content"}
+        metadata["sha1"] = sha1
+        metadata["text_path"] = text_path
+        return metadata
+    
+    @staticmethod
+    def prune_text_store(storage_dir: str, max_age_seconds: float) -> int:
+        """
+        Delete persisted texts not written or reused within max_age_seconds
         
-        return chunks
+        Args:
+            storage_dir: Directory passed to persist_processed
+            max_age_seconds: Age after which an unused text is deleted
+            
+        Returns:
+            Number of files deleted
+        """
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        try:
+            entries = list(os.scandir(storage_dir))
+        except FileNotFoundError:
+            return 0
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    removed += 1
+            except FileNotFoundError:
+                # Another process pruned it first
+                continue
+        return removed
+    
+    @staticmethod
+    def load_content(processed: Dict[str, Any]) -> str:
+        """Return a processed file's text, reading it from disk if persisted"""
+        if "content" in processed:
+            return processed["content"]
+        # Reads count as use, so prune_text_store keeps texts sessions still read
+        os.utime(processed["text_path"])
+        return _read_persisted_text(processed["text_path"])
+    
+    @staticmethod
+    def retain_persisted(processed_files: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Mark persisted texts as in use and keep the processed files whose text is still stored
+        
+        Args:
+            processed_files: Processed file metadata, as held by a session
+            
+        Returns:
+            The processed files that can still be loaded, in order
+        """
+        retained = []
+        for processed in processed_files:
+            if "content" not in processed:
+                try:
+                    os.utime(processed["text_path"])
+                except FileNotFoundError:
+                    # Pruned while the session was idle
+                    continue
+            retained.append(processed)
+        return retained
+    
+    @staticmethod
+    def iter_contents(processed_files: Iterable[Dict[str, Any]]) -> Iterator[str]:
+        """Lazily yield the text of each processed file"""
+        for processed in processed_files:
+            yield FileProcessor.load_content(processed)
+    
+    @staticmethod
+    def chunk_text(text: str, max_chunk_size: int = 3000) -> List[str]:
+        """Split text into chunks of at most max_chunk_size characters (see core.tokens.chunk_text)"""
+        return tokens.chunk_text(text, max_chunk_size)
+    
+    @staticmethod
+    def count_tokens(text: str) -> int:
+        """Count tokens in text (see core.tokens.count_tokens)"""
+        return tokens.count_tokens(text)
+    
+    @staticmethod
+    def truncate_tokens(text: str, max_tokens: int) -> str:
+        """Cut text to at most max_tokens tokens (see core.tokens.truncate_tokens)"""
+        return tokens.truncate_tokens(text, max_tokens)
+    
+    @staticmethod
+    def share_token_budget(total_tokens: int, count: int) -> int:
+        """Split a prompt's excerpt budget evenly (see core.tokens.share_token_budget)"""
+        return tokens.share_token_budget(total_tokens, count)
+    
+    @staticmethod
+    def chunkify(text: str, max_tokens: int = 4000) -> List[str]:
+        """Split text into windows of at most max_tokens tokens (see core.tokens.chunkify)"""
+        return tokens.chunkify(text, max_tokens)
     
     @staticmethod
     def validate_file(file) -> bool:
@@ -194,13 +427,175 @@ class FileProcessor:
         # Check file extension
         file_extension = file.name.split('.')[-1].lower()
         if file_extension not in Config.ALLOWED_FILE_TYPES:
-            st.error(f"File type .{file_extension} not allowed. Allowed types: {', '.join(Config.ALLOWED_FILE_TYPES)}")
+            st.error(f"File type .{file_extension} not allowed. Allowed types: {', '.join(sorted(Config.ALLOWED_FILE_TYPES))}")
             return False
         
         # Check file size
-        file_size_mb = file.size / (1024 * 1024)
-        if file_size_mb > Config.MAX_FILE_SIZE_MB:
-            st.error(f"File size {file_size_mb:.2f}MB exceeds maximum of {Config.MAX_FILE_SIZE_MB}MB")
+        if file.size > Config.MAX_FILE_SIZE_BYTES:
+            st.error(f"File size {file.size / (1024 * 1024):.2f}MB exceeds maximum of {Config.MAX_FILE_SIZE_MB}MB")
             return False
         
-        return True
\ No newline at end of file
+        return True
+
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60, max_entries=64)
+def _parse_file_bytes(file_bytes: bytes, filename: str) -> Optional[Dict[str, Any]]:
+    """Parse and count each unique upload once; Streamlit reruns reuse the cached result"""
+    file_extension = filename.split('.')[-1].lower()
+    # PDF text also persists on disk by content hash, so it survives restarts
+    disk_cache = _get_parse_cache() if file_extension == 'pdf' else None
+    if disk_cache is not None:
+        # The extractor tag keeps text from an older or different extractor from being served
+        key = f"{_pdf_extractor_tag()}:{hashlib.blake2b(file_bytes, digest_size=16).hexdigest()}"
+        text = disk_cache.get(key)
+        if text is not None:
+            return FileProcessor._with_counts(text, file_extension)
+    
+    parsed = _parse_uncached(file_bytes, filename)
+    if disk_cache is not None and parsed and parsed["content"]:
+        disk_cache.set(key, parsed["content"])
+    return parsed
+
+
+def _parse_uncached(file_bytes: bytes, filename: str) -> Optional[Dict[str, Any]]:
+    """Parse and count an upload, in the worker pool when one is available"""
+    pool = _get_parse_pool()
+    if pool is None:
+        return _parse_and_count(file_bytes, filename)
+    
+    # Parsing is CPU-bound, so it runs in a worker process while this thread waits
+    try:
+        if filename.split('.')[-1].lower() == 'pdf':
+            text = _extract_pdf_parallel(pool, file_bytes)
+            if text is not None:
+                return FileProcessor._with_counts(text, 'pdf')
+        parsed, errors = pool.submit(_parse_in_worker, file_bytes, filename).result()
+    except BrokenProcessPool:
+        # Workers could not start (e.g. __main__ is not importable); parse here instead
+        return _parse_and_count(file_bytes, filename)
+    for message in errors:
+        st.error(message)
+    return parsed
+
+
+def _parse_and_count(file_bytes: bytes, filename: str) -> Optional[Dict[str, Any]]:
+    """Extract content from raw file bytes and count its words and tokens"""
+    file_extension = filename.split('.')[-1].lower()
+    return FileProcessor._with_counts(FileProcessor._parse(file_bytes, filename), file_extension)
+
+
+def _parse_in_worker(file_bytes: bytes, filename: str):
+    """Parse one upload in a worker process; returns the result and any error messages"""
+    global _worker_errors
+    _worker_errors = []
+    try:
+        return _parse_and_count(file_bytes, filename), _worker_errors
+    finally:
+        _worker_errors = None
+
+
+def _extract_pdf_parallel(pool: ProcessPoolExecutor, file_bytes: bytes) -> Optional[str]:
+    """
+    Extract a long PDF's text with its pages split across the parse workers
+    
+    Args:
+        pool: Parse worker pool
+        file_bytes: Raw PDF contents
+        
+    Returns:
+        Extracted text, or None if the PDF is short (or unreadable) and should
+        be parsed as a whole
+    """
+    if _PYMUPDF_AVAILABLE:
+        # PyMuPDF takes milliseconds per page; shipping the file to every worker costs more
+        return None
+    from pypdf import PdfReader
+    try:
+        page_count = len(PdfReader(io.BytesIO(file_bytes)).pages)
+    except Exception:
+        # Leave the error to the regular path, which reports it
+        return None
+    if page_count < Config.PDF_PARALLEL_MIN_PAGES or Config.PARSE_PROCESSES < 2:
+        return None
+    
+    # One contiguous range per worker, so each re-opens the document only once
+    step = -(-page_count // Config.PARSE_PROCESSES)
+    futures = [
+        pool.submit(_extract_pdf_pages, file_bytes, start, min(start + step, page_count))
+        for start in range(0, page_count, step)
+    ]
+    try:
+        return "\n\n".join(future.result() for future in futures).strip()
+    except BrokenProcessPool:
+        raise
+    except Exception as e:
+        st.error(f"Error extracting PDF text: {str(e)}")
+        return ""
+
+
+def _extract_pdf_pages(file_bytes: bytes, start: int, stop: int) -> str:
+    """Extract the text of pages [start, stop) of a PDF in a worker process"""
+    from pypdf import PdfReader
+    return _extract_page_range(PdfReader(io.BytesIO(file_bytes)), start, stop)
+
+
+def _pymupdf_page_text(page) -> str:
+    """
+    Return a PyMuPDF page's text blocks in reading order
+    
+    Blocks starting in the left half of the page come first, then those in
+    the right half, each top to bottom, so two-column papers are not read
+    line by line across both columns. Image blocks are skipped.
+    """
+    middle = page.rect.width / 2
+    blocks = [block for block in page.get_text("blocks") if block[6] == 0]
+    blocks.sort(key=lambda block: (block[0] >= middle, block[1], block[0]))
+    return "\n".join(block[4].strip() for block in blocks)
+
+
+def _extract_page_range(pdf_reader, start: int, stop: int) -> str:
+    """Join the text of pages [start, stop), separated by blank lines"""
+    return "\n\n".join(pdf_reader.pages[i].extract_text() for i in range(start, stop))
+
+
+@st.cache_resource(show_spinner=False)
+def _get_parse_cache() -> Optional[DiskCache]:
+    """Open the persistent parse cache once per process, or None if it is disabled"""
+    if not Config.PARSE_CACHE_ENABLED:
+        return None
+    try:
+        return DiskCache(Config.PARSE_CACHE_PATH, ttl_seconds=Config.PARSE_CACHE_TTL)
+    except Exception as e:
+        # An unwritable cache path must not break uploads
+        logger.warning(f"Persistent parse cache disabled: {e}")
+        return None
+
+
+@lru_cache(maxsize=1)
+def _pdf_extractor_tag() -> str:
+    """Name, version and output revision of the PDF extractor in use, for parse cache keys"""
+    name = "pymupdf" if _PYMUPDF_AVAILABLE else "pypdf"
+    try:
+        version = importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+    return f"{name}-{version}-r{_PDF_TEXT_REVISION}"
+
+
+@st.cache_resource(show_spinner=False)
+def _get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """Create the process pool shared by all sessions, or None to parse in the calling thread"""
+    if Config.PARSE_PROCESSES <= 0:
+        return None
+    # Spawned workers do not inherit the locks of Streamlit's running threads
+    return ProcessPoolExecutor(
+        max_workers=Config.PARSE_PROCESSES,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+@st.cache_data(show_spinner=False, ttl=60 * 60, max_entries=64)
+def _read_persisted_text(text_path: str) -> str:
+    """Read a persisted text file once; paths are content-addressed so entries never go stale"""
+    with gzip.open(text_path, 'rt', encoding='utf-8') as f:
+        return f.read()
@@ -1,12 +1,50 @@
 """Citation management system for academic research"""
 
 import re
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
+try:
+    import re2
+    _RE2_AVAILABLE = True
+except ImportError:
+    _RE2_AVAILABLE = False
+
+# Capitalized words that precede a parenthesized year without naming an author,
+# e.g. "Table (2021)"; narrative matches starting with one are skipped
+_NON_AUTHOR_WORDS = frozenset({
+    'Table', 'Tables', 'Figure', 'Figures', 'Fig', 'Section', 'Sections', 'Eq',
+    'Equation', 'Equations', 'Chapter', 'Appendix', 'Page', 'Volume', 'Vol',
+    'Nature', 'Science', 'Journal', 'Proceedings', 'Conference', 'Workshop',
+    'In', 'See', 'The', 'Since', 'Until', 'From', 'After', 'Before'
+})
+
 class CitationManager:
     """Manage citations and bibliographies in various academic formats"""
     
+    # Compiled once at import so repeated extractions skip pattern compilation;
+    # one alternation matches parenthetical citations (Author, Year), narrative
+    # citations Author (Year) / Author et al. (Year) and numbered citations
+    # [1], [2], etc. in a single pass over the text. RE2, when installed,
+    # matches in linear time however adversarial the input (so no lookarounds
+    # or backreferences here)
+    CITATION_PATTERN = (re2 if _RE2_AVAILABLE else re).compile(
+        r'\((?P<authors>[A-Z][a-zA-Z\s&,]+),?\s*(?P<year>\d{4})\)'
+        r"|(?P<narrative_authors>[A-Z][a-zA-Z'-]+(?:\s+et al\.|\s+(?:and|&)\s+[A-Z][a-zA-Z'-]+)?)"
+        r'\s+\((?P<narrative_year>\d{4})\)'
+        r'|\[(?P<number>\d+)\]'
+    )
+    
+    # Formatter method for each citation style; unknown styles fall back to APA
+    FORMATTERS = {
+        "APA 7th": "_format_apa",
+        "MLA 9th": "_format_mla",
+        "Chicago 17th": "_format_chicago",
+        "IEEE": "_format_ieee",
+        "Harvard": "_format_harvard"
+    }
+    
     def __init__(self):
         self.citations = []
         
@@ -20,30 +58,40 @@ class CitationManager:
         Returns:
             List of extracted citations
         """
-        citations = []
-        
-        # Pattern for in-text citations (Author, Year)
-        pattern1 = r'\(([A-Z][a-zA-Z\s&,]+),?\s*(\d{4})\)'
-        matches1 = re.findall(pattern1, text)
-        
-        for match in matches1:
-            citations.append({
-                "authors": match[0].strip(),
-                "year": match[1],
-                "type": "in-text"
-            })
-        
-        # Pattern for numbered citations [1], [2], etc.
-        pattern2 = r'\[(\d+)\]'
-        matches2 = re.findall(pattern2, text)
-        
-        for match in matches2:
-            citations.append({
-                "number": match,
-                "type": "numbered"
-            })
-        
-        return citations
+        # Fresh dicts each call, so callers may modify them without touching the cache
+        return [dict(citation) for citation in self._scan_citations(text)]
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _scan_citations(text: str) -> Tuple[Dict[str, Any], ...]:
+        """Run the citation patterns over text once; reruns on the same text hit the cache"""
+        in_text = []
+        numbered = []
+        
+        for match in CitationManager.CITATION_PATTERN.finditer(text):
+            if match.group("number") is not None:
+                numbered.append({
+                    "number": match.group("number"),
+                    "type": "numbered"
+                })
+            elif match.group("narrative_year") is not None:
+                if match.group("narrative_authors").split()[0] in _NON_AUTHOR_WORDS:
+                    continue
+                in_text.append({
+                    "authors": match.group("narrative_authors"),
+                    "year": match.group("narrative_year"),
+                    "type": "in-text"
+                })
+            else:
+                in_text.append({
+                    # The author run may swallow the comma before the year
+                    "authors": match.group("authors").strip().rstrip(','),
+                    "year": match.group("year"),
+                    "type": "in-text"
+                })
+        
+        # In-text citations are listed ahead of numbered ones
+        return tuple(in_text + numbered)
     
     def format_citation(
         self,
@@ -74,15 +122,7 @@ class CitationManager:
         Returns:
             Formatted citation
         """
-        formatters = {
-            "APA 7th": self._format_apa,
-            "MLA 9th": self._format_mla,
-            "Chicago 17th": self._format_chicago,
-            "IEEE": self._format_ieee,
-            "Harvard": self._format_harvard
-        }
-        
-        formatter = formatters.get(style, self._format_apa)
+        formatter = getattr(self, self.FORMATTERS.get(style, "_format_apa"))
         return formatter(authors, year, title, journal, volume, issue, pages, doi)
     
     def _format_apa(
@@ -200,20 +240,7 @@ class CitationManager:
         doi: str
     ) -> str:
         """Format citation in IEEE style"""
-        # Format authors with initials
-        formatted_authors = []
-        for author in authors:
-            parts = author.split()
-            if len(parts) >= 2:
-                initials = ". ".join([p[0] for p in parts[:-1]]) + "."
-                formatted_authors.append(f"{initials} {parts[-1]}")
-            else:
-                formatted_authors.append(author)
-        
-        if len(formatted_authors) > 3:
-            author_str = f"{formatted_authors[0]} et al."
-        else:
-            author_str = ", ".join(formatted_authors)
+        author_str = _ieee_authors(tuple(authors))
         
         # Build citation
         citation = f'{author_str}, "{title},"'
@@ -279,10 +306,12 @@ class CitationManager:
         Returns:
             Formatted bibliography
         """
-        bibliography = []
+        # Sort alphabetically by first author, then year, on keys computed once
+        # per entry instead of comparing whole formatted citations
+        ordered = sorted(citations, key=self._bibliography_sort_key)
         
-        for citation in citations:
-            formatted = self.format_citation(
+        return "\n\n".join(
+            self.format_citation(
                 authors=citation.get("authors", []),
                 year=citation.get("year", ""),
                 title=citation.get("title", ""),
@@ -293,12 +322,18 @@ class CitationManager:
                 doi=citation.get("doi", ""),
                 style=style
             )
-            bibliography.append(formatted)
-        
-        # Sort alphabetically
-        bibliography.sort()
-        
-        return "\n\n".join(bibliography)
+            for citation in ordered
+        )
+    
+    @staticmethod
+    def _bibliography_sort_key(citation: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Order citations by first author, year and title, ignoring case"""
+        authors = citation.get("authors") or [""]
+        return (
+            str(authors[0]).casefold(),
+            str(citation.get("year", "")),
+            str(citation.get("title", "")).casefold()
+        )
     
     def validate_citation(self, citation: Dict[str, Any]) -> bool:
         """
@@ -324,4 +359,21 @@ class CitationManager:
         except:
             return False
         
-        return True
\ No newline at end of file
+        return True
+
+
+@lru_cache(maxsize=4096)
+def _ieee_authors(authors: Tuple[str, ...]) -> str:
+    """Format IEEE author names with initials; authors recur across a bibliography, so each list is formatted once"""
+    formatted_authors = []
+    for author in authors:
+        parts = author.split()
+        if len(parts) >= 2:
+            initials = ". ".join([p[0] for p in parts[:-1]]) + "."
+            formatted_authors.append(f"{initials} {parts[-1]}")
+        else:
+            formatted_authors.append(author)
+    
+    if len(formatted_authors) > 3:
+        return f"{formatted_authors[0]} et al."
+    return ", ".join(formatted_authors)
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Hypothesis generation module for research"""
 
+import asyncio
 from typing import List, Dict, Any, Optional
 from core.gpt5_client import GPT5Client
 import logging
@@ -52,6 +53,22 @@ class HypothesisGenerator:
         Returns:
             Refined hypothesis
         """
+        return self.client.complete(self._refine_hypothesis_request(hypothesis, feedback), "refined_hypothesis", action="refining hypothesis")
+    
+    async def arefine_hypothesis(
+        self,
+        hypothesis: str,
+        feedback: str
+    ) -> Dict[str, Any]:
+        """Async counterpart of refine_hypothesis"""
+        return await self.client.acomplete(self._refine_hypothesis_request(hypothesis, feedback), "refined_hypothesis", action="refining hypothesis")
+    
+    def _refine_hypothesis_request(
+        self,
+        hypothesis: str,
+        feedback: str
+    ) -> Dict[str, Any]:
+        """Build the chat completion request for refine_hypothesis"""
         prompt = f"""
         Original Hypothesis: {hypothesis}
         
@@ -66,27 +83,14 @@ class HypothesisGenerator:
         Provide the refined hypothesis with explanation of changes.
         """
         
-        try:
-            response = self.client.client.chat.completions.create(
-                model=self.client.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert research methodologist."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=1000
-            )
-            
-            return {
-                "success": True,
-                "refined_hypothesis": response.choices[0].message.content
-            }
-            
-        except Exception as e:
-            logger.error(f"Error refining hypothesis: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        return dict(
+            model=self.client.model,
+            messages=[
+                {"role": "system", "content": "You are an expert research methodologist."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=1000
+        )
     
     def generate_null_alternative(
         self,
@@ -101,6 +105,20 @@ class HypothesisGenerator:
         Returns:
             Null and alternative hypotheses
         """
+        return self.client.complete(self._generate_null_alternative_request(research_hypothesis), "hypotheses", action="generating null/alternative hypotheses")
+    
+    async def agenerate_null_alternative(
+        self,
+        research_hypothesis: str
+    ) -> Dict[str, Any]:
+        """Async counterpart of generate_null_alternative"""
+        return await self.client.acomplete(self._generate_null_alternative_request(research_hypothesis), "hypotheses", action="generating null/alternative hypotheses")
+    
+    def _generate_null_alternative_request(
+        self,
+        research_hypothesis: str
+    ) -> Dict[str, Any]:
+        """Build the chat completion request for generate_null_alternative"""
         prompt = f"""
         Research Hypothesis: {research_hypothesis}
         
@@ -112,27 +130,14 @@ class HypothesisGenerator:
         5. Potential Type I and Type II errors
         """
         
-        try:
-            response = self.client.client.chat.completions.create(
-                model=self.client.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert in research methodology and statistics."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=1500
-            )
-            
-            return {
-                "success": True,
-                "hypotheses": response.choices[0].message.content
-            }
-            
-        except Exception as e:
-            logger.error(f"Error generating null/alternative hypotheses: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        return dict(
+            model=self.client.model,
+            messages=[
+                {"role": "system", "content": "You are an expert in research methodology and statistics."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=1500
+        )
     
     def evaluate_hypothesis_quality(
         self,
@@ -149,6 +154,22 @@ class HypothesisGenerator:
         Returns:
             Quality evaluation with suggestions
         """
+        return self.client.complete(self._evaluate_hypothesis_quality_request(hypothesis, context), "evaluation", action="evaluating hypothesis")
+    
+    async def aevaluate_hypothesis_quality(
+        self,
+        hypothesis: str,
+        context: str = ""
+    ) -> Dict[str, Any]:
+        """Async counterpart of evaluate_hypothesis_quality"""
+        return await self.client.acomplete(self._evaluate_hypothesis_quality_request(hypothesis, context), "evaluation", action="evaluating hypothesis")
+    
+    def _evaluate_hypothesis_quality_request(
+        self,
+        hypothesis: str,
+        context: str = ""
+    ) -> Dict[str, Any]:
+        """Build the chat completion request for evaluate_hypothesis_quality"""
         prompt = f"""
         Evaluate the following research hypothesis:
         
@@ -169,27 +190,14 @@ class HypothesisGenerator:
         - Suggestions for improvement
         """
         
-        try:
-            response = self.client.client.chat.completions.create(
-                model=self.client.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert research methodologist and peer reviewer."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=1500
-            )
-            
-            return {
-                "success": True,
-                "evaluation": response.choices[0].message.content
-            }
-            
-        except Exception as e:
-            logger.error(f"Error evaluating hypothesis: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        return dict(
+            model=self.client.model,
+            messages=[
+                {"role": "system", "content": "You are an expert research methodologist and peer reviewer."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=1500
+        )
     
     def generate_research_questions(
         self,
@@ -206,6 +214,22 @@ class HypothesisGenerator:
         Returns:
             Research questions
         """
+        return self.client.complete(self._generate_research_questions_request(hypothesis, num_questions), "questions", action="generating research questions")
+    
+    async def agenerate_research_questions(
+        self,
+        hypothesis: str,
+        num_questions: int = 5
+    ) -> Dict[str, Any]:
+        """Async counterpart of generate_research_questions"""
+        return await self.client.acomplete(self._generate_research_questions_request(hypothesis, num_questions), "questions", action="generating research questions")
+    
+    def _generate_research_questions_request(
+        self,
+        hypothesis: str,
+        num_questions: int = 5
+    ) -> Dict[str, Any]:
+        """Build the chat completion request for generate_research_questions"""
         prompt = f"""
         Based on the following hypothesis, generate {num_questions} specific research questions:
         
@@ -218,24 +242,55 @@ class HypothesisGenerator:
         4. Potential methods for investigation
         """
         
-        try:
-            response = self.client.client.chat.completions.create(
-                model=self.client.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert in research design."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=2000
-            )
-            
-            return {
-                "success": True,
-                "questions": response.choices[0].message.content
-            }
+        return dict(
+            model=self.client.model,
+            messages=[
+                {"role": "system", "content": "You are an expert in research design."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=2000
+        )
+    
+    async def full_report(
+        self,
+        hypothesis: str,
+        context: str = "",
+        num_questions: int = 5,
+        feedback: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build every analysis of a hypothesis concurrently
+        
+        The requests are independent, so the report takes as long as the
+        slowest one rather than the sum of all of them.
+        
+        Args:
+            hypothesis: The hypothesis
+            context: Additional context for the quality evaluation
+            num_questions: Number of research questions to generate
+            feedback: Feedback for a refined hypothesis; no refinement if omitted
             
-        except Exception as e:
-            logger.error(f"Error generating research questions: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
\ No newline at end of file
+        Returns:
+            The result of each analysis under null_alternative, evaluation,
+            research_questions and, with feedback, refinement
+        """
+        analyses = {
+            "null_alternative": self.agenerate_null_alternative(hypothesis),
+            "evaluation": self.aevaluate_hypothesis_quality(hypothesis, context),
+            "research_questions": self.agenerate_research_questions(hypothesis, num_questions)
+        }
+        if feedback:
+            analyses["refinement"] = self.arefine_hypothesis(hypothesis, feedback)
+        
+        results = await asyncio.gather(*analyses.values())
+        return dict(zip(analyses, results))
+    
+    def full_report_sync(
+        self,
+        hypothesis: str,
+        context: str = "",
+        num_questions: int = 5,
+        feedback: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Synchronous facade over full_report for callers without an event loop"""
+        return asyncio.run(self.full_report(hypothesis, context, num_questions, feedback))
\ No newline at end of file
@@ -1,14 +1,53 @@
 """Literature review generation module"""
 
-from typing import List, Dict, Any, Optional
+import asyncio
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from core.gpt5_client import GPT5Client
+from core.gpt5_cache import LLMCache
+from config.settings import Config
 import streamlit as st
 
+# Aspects extracted from each paper before the multi-paper analyses are reduced
+_THEME_ASPECTS = ("Main themes", "Key findings", "Research focus")
+_GAP_ASPECTS = ("Key findings", "Methodology", "Limitations", "Suggested future work")
+# Every extraction covers at least these, so themes and gaps share one map step
+_BASE_ASPECTS = tuple(dict.fromkeys(_THEME_ASPECTS + _GAP_ASPECTS))
+
+# Review section markers, in the priority order used when a line names several
+_SECTION_MARKERS = (
+    ("executive summary", "executive_summary"),
+    ("key themes", "key_themes"),
+    ("methodolog", "methodologies"),
+    ("theoretical framework", "theoretical_frameworks"),
+    ("research gap", "research_gaps"),
+    ("future", "future_directions"),
+    ("conclusion", "conclusion")
+)
+
+# Matches at the start of a line that starts a section: the line contains a
+# marker and a heading cue ('#', ':' or a "1."-"7." list number). The lookahead
+# alternatives are tried in marker order and the named group reports which won.
+_SECTION_RE = re.compile(
+    r"^(?=.*(?:[#:]|[1-7]\.))(?:"
+    + "|".join(f"(?=.*(?P<{key}>{re.escape(marker)}))" for marker, key in _SECTION_MARKERS)
+    + ")",
+    re.IGNORECASE | re.MULTILINE
+)
+
 class LiteratureReviewGenerator:
     """Generate comprehensive literature reviews using GPT-5"""
 
     def __init__(self, gpt5_client: GPT5Client):
         self.client = gpt5_client
+        # Extracted per-paper features keyed on the paper set, least recently used
+        # first: (aspects covered, one JSON object per paper)
+        self._features_cache: "OrderedDict[str, Tuple[Tuple[str, ...], List[str]]]" = OrderedDict()
+        self._features_cache_size = 16
+        self._features_lock = threading.Lock()
 
     def generate_review(
         self,
@@ -22,7 +61,8 @@ class LiteratureReviewGenerator:
         Args:
             papers: List of paper data (content, metadata)
             research_question: The research question to focus on
-            review_settings: Settings for the review generation
+            review_settings: Settings for the review generation; set
+                "summarize_first" to False when papers are already summaries
 
         Returns:
             Generated literature review with sections
@@ -42,32 +82,85 @@ class LiteratureReviewGenerator:
             research_question=research_question,
             review_depth=review_settings.get("depth", "Comprehensive"),
             include_gaps=review_settings.get("include_gaps", True),
-            include_future=review_settings.get("include_future", True)
+            include_future=review_settings.get("include_future", True),
+            summarize_first=review_settings.get("summarize_first", True),
+            structured=Config.LLM_JSON_MODE
         )
 
         if result["success"]:
-            # Parse the review into sections
-            review_text = result.get("review", "")
+            return self.build_review_result(
+                result.get("review", ""), papers, research_question, review_settings, result.get("sections")
+            )
+        else:
+            return result
+
+    def stream_review(
+        self,
+        papers: List[Dict[str, Any]],
+        research_question: str,
+        review_settings: Dict[str, Any]
+    ) -> Iterator[str]:
+        """
+        Stream a literature review as it is generated
 
-            # Handle empty review
-            if not review_text:
-                review_text = "The literature review is being generated. Please try again if no content appears."
+        Args:
+            papers: List of paper data (content, metadata)
+            research_question: The research question to focus on
+            review_settings: Settings for the review generation
+
+        Yields:
+            Text fragments of the review; pass the joined text to build_review_result
+        """
+        paper_contents = [p.get("content", "") for p in papers if p.get("content")]
 
+        return self.client.stream_literature_review(
+            papers=paper_contents,
+            research_question=research_question,
+            review_depth=review_settings.get("depth", "Comprehensive"),
+            include_gaps=review_settings.get("include_gaps", True),
+            include_future=review_settings.get("include_future", True)
+        )
+
+    def build_review_result(
+        self,
+        review_text: str,
+        papers: List[Dict[str, Any]],
+        research_question: str,
+        review_settings: Dict[str, Any],
+        sections: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Parse a finished review into the result structure
+
+        Args:
+            review_text: Full review text
+            papers: List of paper data the review was generated from
+            research_question: The research question to focus on
+            review_settings: Settings for the review generation
+            sections: Sections already returned by a structured review; parsed
+                from review_text when omitted
+
+        Returns:
+            Literature review with sections and metadata
+        """
+        # Handle empty review
+        if not review_text:
+            review_text = "The literature review is being generated. Please try again if no content appears."
+
+        if sections is None:
             sections = self._parse_review_sections(review_text)
 
-            return {
-                "success": True,
-                "full_review": review_text,
-                "sections": sections,
-                "paper_count": len(papers),
-                "metadata": {
-                    "research_question": research_question,
-                    "review_depth": review_settings.get("depth", "Comprehensive"),
-                    "total_words": len(review_text.split()) if review_text else 0
-                }
+        return {
+            "success": True,
+            "full_review": review_text,
+            "sections": sections,
+            "paper_count": len(papers),
+            "metadata": {
+                "research_question": research_question,
+                "review_depth": review_settings.get("depth", "Comprehensive"),
+                "total_words": len(review_text.split()) if review_text else 0
             }
-        else:
-            return result
+        }
 
     def _parse_review_sections(self, review_text: str) -> Dict[str, str]:
         """
@@ -79,42 +172,16 @@ class LiteratureReviewGenerator:
         Returns:
             Dictionary of review sections
         """
-        sections = {
-            "executive_summary": "",
-            "key_themes": "",
-            "methodologies": "",
-            "theoretical_frameworks": "",
-            "research_gaps": "",
-            "future_directions": "",
-            "conclusion": ""
-        }
+        sections = {key: "" for _, key in _SECTION_MARKERS}
 
-        # Simple section parsing (can be improved with more sophisticated parsing)
-        current_section = None
-        lines = review_text.split('\n')
-
-        section_markers = {
-            "executive summary": "executive_summary",
-            "key themes": "key_themes",
-            "methodolog": "methodologies",
-            "theoretical framework": "theoretical_frameworks",
-            "research gap": "research_gaps",
-            "future": "future_directions",
-            "conclusion": "conclusion"
-        }
-
-        for line in lines:
-            line_lower = line.lower()
-
-            # Check if this line marks a new section
-            for marker, section_key in section_markers.items():
-                if marker in line_lower and any(c in line for c in ['#', ':', '1.', '2.', '3.', '4.', '5.', '6.', '7.']):
-                    current_section = section_key
-                    break
-
-            # Add content to current section
-            if current_section:
-                sections[current_section] += line + "\n"
+        # Each section runs from its marker line to the next marker line; text
+        # before the first marker belongs to no section
+        matches = list(_SECTION_RE.finditer(review_text))
+        for match, following in zip(matches, matches[1:] + [None]):
+            if following is None:
+                sections[match.lastgroup] += review_text[match.start():] + "\n"
+            else:
+                sections[match.lastgroup] += review_text[match.start():following.start()]
 
         return sections
 
@@ -133,7 +200,26 @@ class LiteratureReviewGenerator:
         Returns:
             Thematic analysis results
         """
-        paper_contents = [p.get("content", "")[:2000] for p in papers if p.get("content")]
+        features = self._paper_features(papers, _THEME_ASPECTS)
+        return self.client.complete(self._thematic_analysis_request(papers, num_themes, features), "themes", action="analyzing themes")
+
+    async def agenerate_thematic_analysis(
+        self,
+        papers: List[Dict[str, Any]],
+        num_themes: int = 5
+    ) -> Dict[str, Any]:
+        """Async counterpart of generate_thematic_analysis"""
+        features = await self._apaper_features(papers, _THEME_ASPECTS)
+        return await self.client.acomplete(self._thematic_analysis_request(papers, num_themes, features), "themes", action="analyzing themes")
+
+    def _thematic_analysis_request(
+        self,
+        papers: List[Dict[str, Any]],
+        num_themes: int,
+        features: List[str]
+    ) -> Dict[str, Any]:
+        """Build the chat completion request for generate_thematic_analysis"""
+        features_text = self._features_text(papers, features)
 
         prompt = f"""
         Perform a thematic analysis of the following {len(papers)} research papers.
@@ -145,36 +231,19 @@ class LiteratureReviewGenerator:
         3. Which papers discuss this theme
         4. Key insights related to this theme
 
-        Papers:
-        {"---PAPER SEPARATOR---".join(paper_contents)}
+        Papers (extracted features as JSON):
+        {features_text}
         """
 
-        try:
-            request_params = {
-                "model": self.client.model,
-                "messages": [
-                    {"role": "system", "content": "You are an expert in qualitative research and thematic analysis."},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": 3000  # Increased for reasoning + response
-            }
-
-            # Add reasoning_effort only if supported
-            if "aimlapi" in str(self.client.client.base_url).lower():
-                request_params["reasoning_effort"] = "high"
-
-            response = self.client.client.chat.completions.create(**request_params)
-
-            return {
-                "success": True,
-                "themes": response.choices[0].message.content
-            }
+        request_params = self.client.build_request(
+            [
+                {"role": "system", "content": "You are an expert in qualitative research and thematic analysis."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=3000  # Increased for reasoning + response
+        )
 
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        return request_params
 
     def identify_research_gaps(
         self,
@@ -191,7 +260,36 @@ class LiteratureReviewGenerator:
         Returns:
             Identified research gaps
         """
-        paper_contents = [p.get("content", "")[:2000] for p in papers if p.get("content")]
+        features = self._paper_features(papers, _GAP_ASPECTS)
+        request_params = self._research_gaps_request(papers, research_area, features)
+        return self.client.complete(
+            request_params, "gaps",
+            semantic=self._gaps_semantic(request_params, papers, research_area),
+            action="identifying research gaps"
+        )
+
+    async def aidentify_research_gaps(
+        self,
+        papers: List[Dict[str, Any]],
+        research_area: str
+    ) -> Dict[str, Any]:
+        """Async counterpart of identify_research_gaps"""
+        features = await self._apaper_features(papers, _GAP_ASPECTS)
+        request_params = self._research_gaps_request(papers, research_area, features)
+        return await self.client.acomplete(
+            request_params, "gaps",
+            semantic=self._gaps_semantic(request_params, papers, research_area),
+            action="identifying research gaps"
+        )
+
+    def _research_gaps_request(
+        self,
+        papers: List[Dict[str, Any]],
+        research_area: str,
+        features: List[str]
+    ) -> Dict[str, Any]:
+        """Build the chat completion request for identify_research_gaps"""
+        features_text = self._features_text(papers, features)
 
         prompt = f"""
         Based on the following {len(papers)} papers in {research_area}, identify research gaps.
@@ -203,36 +301,29 @@ class LiteratureReviewGenerator:
         4. Practical application gaps
         5. Recommendations for future research
 
-        Papers:
-        {"---PAPER SEPARATOR---".join(paper_contents)}
+        Papers (extracted features as JSON):
+        {features_text}
         """
 
-        try:
-            request_params = {
-                "model": self.client.model,
-                "messages": [
-                    {"role": "system", "content": "You are an expert research methodologist specializing in identifying research opportunities."},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": 2500  # Increased for reasoning + response
-            }
+        request_params = self.client.build_request(
+            [
+                {"role": "system", "content": "You are an expert research methodologist specializing in identifying research opportunities."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=2500  # Increased for reasoning + response
+        )
 
-            # Add reasoning_effort only if supported
-            if "aimlapi" in str(self.client.client.base_url).lower():
-                request_params["reasoning_effort"] = "high"
+        return request_params
 
-            response = self.client.client.chat.completions.create(**request_params)
-
-            return {
-                "success": True,
-                "gaps": response.choices[0].message.content
-            }
-
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
+    def _gaps_semantic(self, request_params: Dict[str, Any], papers: List[Dict[str, Any]], research_area: str):
+        """Scope gap answers to these papers so a reworded research area can reuse them"""
+        scope = LLMCache.make_key({
+            "kind": "research_gaps",
+            "model": self.client.model,
+            "papers": [p.get("content", "") for p in papers],
+            "reasoning_effort": request_params.get("reasoning_effort")
+        })
+        return scope, research_area
 
     def create_synthesis_matrix(
         self,
@@ -249,8 +340,33 @@ class LiteratureReviewGenerator:
         Returns:
             Synthesis matrix
         """
-        paper_titles = [p.get("filename", f"Paper {i+1}") for i, p in enumerate(papers)]
-        paper_contents = [p.get("content", "")[:1500] for p in papers if p.get("content")]
+        features = self._paper_features(papers, categories)
+        return self.client.complete(
+            self._synthesis_matrix_request(papers, categories, features), "matrix",
+            action="creating synthesis matrix", papers=self._paper_titles(papers), categories=categories
+        )
+
+    async def acreate_synthesis_matrix(
+        self,
+        papers: List[Dict[str, Any]],
+        categories: List[str]
+    ) -> Dict[str, Any]:
+        """Async counterpart of create_synthesis_matrix"""
+        features = await self._apaper_features(papers, categories)
+        return await self.client.acomplete(
+            self._synthesis_matrix_request(papers, categories, features), "matrix",
+            action="creating synthesis matrix", papers=self._paper_titles(papers), categories=categories
+        )
+
+    def _synthesis_matrix_request(
+        self,
+        papers: List[Dict[str, Any]],
+        categories: List[str],
+        features: List[str]
+    ) -> Dict[str, Any]:
+        """Build the chat completion request for create_synthesis_matrix"""
+        paper_titles = self._paper_titles(papers)
+        features_text = self._features_text(papers, features)
 
         prompt = f"""
         Create a synthesis matrix comparing these {len(papers)} papers across the following categories:
@@ -262,35 +378,175 @@ class LiteratureReviewGenerator:
         Papers:
         {chr(10).join([f"{i+1}. {title}" for i, title in enumerate(paper_titles)])}
 
-        Paper contents:
-        {"---PAPER SEPARATOR---".join(paper_contents)}
+        Paper features per category (JSON):
+        {features_text}
         """
 
-        try:
-            request_params = {
-                "model": self.client.model,
-                "messages": [
-                    {"role": "system", "content": "You are an expert at creating research synthesis matrices."},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": 3000  # Increased for reasoning + response
-            }
+        request_params = self.client.build_request(
+            [
+                {"role": "system", "content": "You are an expert at creating research synthesis matrices."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=3000,  # Increased for reasoning + response
+            reasoning_effort="medium"
+        )
 
-            # Add reasoning_effort only if supported
-            if "aimlapi" in str(self.client.client.base_url).lower():
-                request_params["reasoning_effort"] = "medium"
+        return request_params
 
-            response = self.client.client.chat.completions.create(**request_params)
+    @staticmethod
+    def _paper_titles(papers: List[Dict[str, Any]]) -> List[str]:
+        """Return each paper's filename, or a numbered placeholder"""
+        return [p.get("filename", f"Paper {i+1}") for i, p in enumerate(papers)]
 
-            return {
-                "success": True,
-                "matrix": response.choices[0].message.content,
-                "papers": paper_titles,
-                "categories": categories
+    def _paper_features(self, papers: List[Dict[str, Any]], aspects) -> List[str]:
+        """
+        Extract aspects from each paper concurrently (the map step)
+
+        The analyses then reduce these short per-paper JSON objects in one
+        request, instead of reading every paper's excerpt in a single prompt.
+        One extraction covers the themes and gaps aspects plus any requested
+        ones and is cached per paper set, so the analyses of the same papers
+        share it instead of each mapping every paper again.
+
+        Args:
+            papers: List of paper data
+            aspects: Aspects to extract from each paper
+
+        Returns:
+            One JSON object (as text) per paper with content, in order,
+            limited to the requested aspects
+        """
+        contents = [p["content"] for p in papers if p.get("content")]
+        if not contents:
+            return []
+        key, features, extract = self._cached_features(contents, aspects)
+        if features is None:
+            features = asyncio.run(self.client.aextract_aspects(contents, list(extract)))
+            self._store_features(key, extract, features)
+        return self._select_aspects(features, aspects)
+
+    async def _apaper_features(self, papers: List[Dict[str, Any]], aspects) -> List[str]:
+        """Async counterpart of _paper_features"""
+        contents = [p["content"] for p in papers if p.get("content")]
+        if not contents:
+            return []
+        key, features, extract = self._cached_features(contents, aspects)
+        if features is None:
+            features = await self.client.aextract_aspects(contents, list(extract))
+            self._store_features(key, extract, features)
+        return self._select_aspects(features, aspects)
+
+    def _cached_features(self, contents: List[str], aspects) -> Tuple[str, Optional[List[str]], Tuple[str, ...]]:
+        """
+        Look up the features of a paper set
+
+        Returns:
+            The cache key, the cached features if they cover aspects (else
+            None), and the aspects a fresh extraction should cover
+        """
+        key = LLMCache.make_key({"kind": "paper_features", "model": self.client.model, "papers": contents})
+        with self._features_lock:
+            entry = self._features_cache.get(key)
+            if entry is not None:
+                self._features_cache.move_to_end(key)
+                if set(aspects) <= set(entry[0]):
+                    return key, entry[1], entry[0]
+        # Keep what was covered before, so alternating analyses do not evict each other
+        covered = entry[0] if entry is not None else ()
+        return key, None, tuple(dict.fromkeys(_BASE_ASPECTS + covered + tuple(aspects)))
+
+    def _store_features(self, key: str, aspects: Tuple[str, ...], features: List[str]):
+        """Cache a paper set's features unless an extraction failed (fell back to raw text)"""
+        if not all(isinstance(_json_object(feature), dict) for feature in features):
+            return
+        with self._features_lock:
+            self._features_cache[key] = (aspects, features)
+            self._features_cache.move_to_end(key)
+            while len(self._features_cache) > self._features_cache_size:
+                self._features_cache.popitem(last=False)
+
+    @staticmethod
+    def _select_aspects(features: List[str], aspects) -> List[str]:
+        """Limit each paper's JSON features to the requested aspects (keys match case-insensitively)"""
+        wanted = {aspect.lower() for aspect in aspects}
+        selected = []
+        for feature in features:
+            parsed = _json_object(feature)
+            subset = {k: v for k, v in parsed.items() if k.lower() in wanted} if isinstance(parsed, dict) else None
+            # Keep text that is not JSON, or whose keys do not name the aspects, as it is
+            selected.append(json.dumps(subset, ensure_ascii=False) if subset else feature)
+        return selected
+
+    def _features_text(self, papers: List[Dict[str, Any]], features: List[str]) -> str:
+        """Label each paper's extracted features with its title for the reduce prompt"""
+        # Numbered like the paper list, skipping papers without content
+        labels = [
+            f"{i+1}. {title}"
+            for i, (p, title) in enumerate(zip(papers, self._paper_titles(papers)))
+            if p.get("content")
+        ]
+        return "\n\n".join(f"{label}: {feature}" for label, feature in zip(labels, features))
+
+    async def full_report(
+        self,
+        papers: List[Dict[str, Any]],
+        research_question: str,
+        review_settings: Dict[str, Any],
+        num_themes: int = 5,
+        categories: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate the review and every analysis of the papers concurrently
+
+        The analyses share one per-paper extraction, run once up front, and
+        then reduce concurrently alongside the review, so the report takes
+        about as long as the slowest path rather than the sum of all requests.
+
+        Args:
+            papers: List of paper data (content, metadata)
+            research_question: The research question, also used as the research area
+            review_settings: Settings for the review generation
+            num_themes: Number of themes to identify
+            categories: Synthesis matrix categories; no matrix if omitted
+
+        Returns:
+            The result of each part under review, themes, gaps and, with
+            categories, matrix
+        """
+        async def analyses():
+            # Map every paper once for all the analyses; each then hits the cache
+            await self._apaper_features(papers, _BASE_ASPECTS + tuple(categories or ()))
+            parts = {
+                "themes": self.agenerate_thematic_analysis(papers, num_themes),
+                "gaps": self.aidentify_research_gaps(papers, research_question)
             }
+            if categories:
+                parts["matrix"] = self.acreate_synthesis_matrix(papers, categories)
+            results = await asyncio.gather(*parts.values())
+            return dict(zip(parts, results))
+
+        # The review summarizes papers first through the sync client, so it runs in a thread
+        review, analysis_results = await asyncio.gather(
+            asyncio.to_thread(self.generate_review, papers, research_question, review_settings),
+            analyses()
+        )
+        return {"review": review, **analysis_results}
 
-        except Exception as e:
-            return {
-                "success": False,
-                "error": str(e)
-            }
\ No newline at end of file
+    def full_report_sync(
+        self,
+        papers: List[Dict[str, Any]],
+        research_question: str,
+        review_settings: Dict[str, Any],
+        num_themes: int = 5,
+        categories: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Synchronous facade over full_report for callers without an event loop"""
+        return asyncio.run(self.full_report(papers, research_question, review_settings, num_themes, categories))
+
+
+def _json_object(text: str) -> Any:
+    """Parse text as JSON, or return None if it is not JSON"""
+    try:
+        return json.loads(text)
+    except (TypeError, ValueError):
+        return None
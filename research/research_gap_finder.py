@@ -1,7 +1,11 @@
 """Research gap identification module"""
 
-from typing import List, Dict, Any, Optional
+import asyncio
+from itertools import islice
+from typing import List, Dict, Any, Optional, Tuple
 from core.gpt5_client import GPT5Client
+from core.gpt5_cache import LLMCache
+from core import tokens
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,7 +15,7 @@ class ResearchGapFinder:
     
     def __init__(self, gpt5_client: GPT5Client):
         self.client = gpt5_client
-        
+    
     def identify_gaps(
         self,
         papers: List[Dict[str, Any]],
@@ -25,10 +29,42 @@ class ResearchGapFinder:
             papers: List of paper data
             research_area: The research domain
             gap_types: Types of gaps to identify
-            
+        
         Returns:
             Identified research gaps
         """
+        request_params, scope = self._identify_gaps_request(papers, research_area, gap_types)
+        return self.client.complete(
+            request_params,
+            "gaps",
+            semantic=(scope, research_area),
+            action="identifying research gaps",
+            paper_count=len(papers)
+        )
+    
+    async def aidentify_gaps(
+        self,
+        papers: List[Dict[str, Any]],
+        research_area: str,
+        gap_types: List[str] = None
+    ) -> Dict[str, Any]:
+        """Async counterpart of identify_gaps"""
+        request_params, scope = self._identify_gaps_request(papers, research_area, gap_types)
+        return await self.client.acomplete(
+            request_params,
+            "gaps",
+            semantic=(scope, research_area),
+            action="identifying research gaps",
+            paper_count=len(papers)
+        )
+    
+    def _identify_gaps_request(
+        self,
+        papers: List[Dict[str, Any]],
+        research_area: str,
+        gap_types: Optional[List[str]]
+    ) -> Tuple[Dict[str, Any], str]:
+        """Build the chat completion request for identify_gaps and its semantic cache scope"""
         if gap_types is None:
             gap_types = [
                 "Methodological",
@@ -39,11 +75,13 @@ class ResearchGapFinder:
                 "Population"
             ]
         
-        # Prepare paper summaries
+        # Prepare summaries of the first 10 papers with content (limit for API)
+        selected = list(islice((paper for paper in papers if paper.get("content")), 10))
         paper_summaries = []
-        for paper in papers[:10]:  # Limit to 10 papers for API
+        budget = tokens.share_token_budget(1250, len(selected))
+        for paper in selected:
             summary = f"Title: {paper.get('title', 'Unknown')}\n"
-            summary += f"Content: {paper.get('content', '')[:500]}\n"
+            summary += f"Content: {tokens.truncate_tokens(paper.get('content', ''), budget)}\n"
             paper_summaries.append(summary)
         
         prompt = f"""
@@ -63,34 +101,23 @@ class ResearchGapFinder:
         5. Potential impact if addressed
         """
         
-        try:
-            request_params = {
-                "model": self.client.model,
-                "messages": [
-                    {"role": "system", "content": "You are an expert in research methodology and literature analysis."},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": 2000
-            }
-            
-            # Add reasoning_effort only if supported
-            if "aimlapi" in str(self.client.client.base_url).lower():
-                request_params["reasoning_effort"] = "high"
-            
-            response = self.client.client.chat.completions.create(**request_params)
-            
-            return {
-                "success": True,
-                "gaps": response.choices[0].message.content,
-                "paper_count": len(papers)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error identifying research gaps: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        request_params = self.client.build_request(
+            [
+                {"role": "system", "content": "You are an expert in research methodology and literature analysis."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=2000
+        )
+        
+        # Scope semantic matches to these papers and gap types so only the research area may vary
+        scope = LLMCache.make_key({
+            "kind": "identify_gaps",
+            "model": self.client.model,
+            "papers": paper_summaries,
+            "gap_types": gap_types,
+            "reasoning_effort": request_params.get("reasoning_effort")
+        })
+        return request_params, scope
     
     def prioritize_gaps(
         self,
@@ -103,10 +130,26 @@ class ResearchGapFinder:
         Args:
             gaps: List of identified gaps
             criteria: Prioritization criteria
-            
+        
         Returns:
             Prioritized gaps
         """
+        return self.client.complete(self._prioritize_gaps_request(gaps, criteria), "prioritized_gaps", action="prioritizing gaps")
+    
+    async def aprioritize_gaps(
+        self,
+        gaps: List[Dict[str, Any]],
+        criteria: List[str] = None
+    ) -> Dict[str, Any]:
+        """Async counterpart of prioritize_gaps"""
+        return await self.client.acomplete(self._prioritize_gaps_request(gaps, criteria), "prioritized_gaps", action="prioritizing gaps")
+    
+    def _prioritize_gaps_request(
+        self,
+        gaps: List[Dict[str, Any]],
+        criteria: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """Build the chat completion request for prioritize_gaps"""
         if criteria is None:
             criteria = [
                 "Impact potential",
@@ -133,27 +176,14 @@ class ResearchGapFinder:
         5. Recommended sequence for addressing gaps
         """
         
-        try:
-            response = self.client.client.chat.completions.create(
-                model=self.client.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert in research planning and prioritization."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=1500
-            )
-            
-            return {
-                "success": True,
-                "prioritized_gaps": response.choices[0].message.content
-            }
-            
-        except Exception as e:
-            logger.error(f"Error prioritizing gaps: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        return dict(
+            model=self.client.model,
+            messages=[
+                {"role": "system", "content": "You are an expert in research planning and prioritization."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=1500
+        )
     
     def generate_research_proposal(
         self,
@@ -166,10 +196,26 @@ class ResearchGapFinder:
         Args:
             gap: The research gap to address
             context: Additional context
-            
+        
         Returns:
             Research proposal outline
         """
+        return self.client.complete(self._research_proposal_request(gap, context), "proposal", action="generating research proposal")
+    
+    async def agenerate_research_proposal(
+        self,
+        gap: str,
+        context: str = ""
+    ) -> Dict[str, Any]:
+        """Async counterpart of generate_research_proposal"""
+        return await self.client.acomplete(self._research_proposal_request(gap, context), "proposal", action="generating research proposal")
+    
+    def _research_proposal_request(
+        self,
+        gap: str,
+        context: str
+    ) -> Dict[str, Any]:
+        """Build the chat completion request for generate_research_proposal"""
         prompt = f"""
         Research Gap: {gap}
         {"Context: " + context if context else ""}
@@ -192,33 +238,13 @@ class ResearchGapFinder:
         10. Significance and Impact
         """
         
-        try:
-            request_params = {
-                "model": self.client.model,
-                "messages": [
-                    {"role": "system", "content": "You are an expert in research proposal development."},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": 3000
-            }
-            
-            # Add reasoning_effort only if supported
-            if "aimlapi" in str(self.client.client.base_url).lower():
-                request_params["reasoning_effort"] = "high"
-            
-            response = self.client.client.chat.completions.create(**request_params)
-            
-            return {
-                "success": True,
-                "proposal": response.choices[0].message.content
-            }
-            
-        except Exception as e:
-            logger.error(f"Error generating research proposal: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        return self.client.build_request(
+            [
+                {"role": "system", "content": "You are an expert in research proposal development."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=3000
+        )
     
     def analyze_gap_trends(
         self,
@@ -231,10 +257,26 @@ class ResearchGapFinder:
         Args:
             gaps: List of research gaps
             time_period: Time period for analysis
-            
+        
         Returns:
             Trend analysis
         """
+        return self.client.complete(self._gap_trends_request(gaps, time_period), "trends", action="analyzing gap trends")
+    
+    async def aanalyze_gap_trends(
+        self,
+        gaps: List[str],
+        time_period: str = "5 years"
+    ) -> Dict[str, Any]:
+        """Async counterpart of analyze_gap_trends"""
+        return await self.client.acomplete(self._gap_trends_request(gaps, time_period), "trends", action="analyzing gap trends")
+    
+    def _gap_trends_request(
+        self,
+        gaps: List[str],
+        time_period: str
+    ) -> Dict[str, Any]:
+        """Build the chat completion request for analyze_gap_trends"""
         gaps_text = "\n".join([f"- {gap}" for gap in gaps])
         
         prompt = f"""
@@ -254,27 +296,14 @@ class ResearchGapFinder:
         Provide insights on how the research landscape is evolving.
         """
         
-        try:
-            response = self.client.client.chat.completions.create(
-                model=self.client.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert in research trends and forecasting."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=1500
-            )
-            
-            return {
-                "success": True,
-                "trends": response.choices[0].message.content
-            }
-            
-        except Exception as e:
-            logger.error(f"Error analyzing gap trends: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+        return dict(
+            model=self.client.model,
+            messages=[
+                {"role": "system", "content": "You are an expert in research trends and forecasting."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=1500
+        )
     
     def suggest_collaborations(
         self,
@@ -287,10 +316,26 @@ class ResearchGapFinder:
         Args:
             gap: The research gap
             expertise_needed: Types of expertise required
-            
+        
         Returns:
             Collaboration suggestions
         """
+        return self.client.complete(self._collaborations_request(gap, expertise_needed), "collaborations", action="suggesting collaborations")
+    
+    async def asuggest_collaborations(
+        self,
+        gap: str,
+        expertise_needed: List[str] = None
+    ) -> Dict[str, Any]:
+        """Async counterpart of suggest_collaborations"""
+        return await self.client.acomplete(self._collaborations_request(gap, expertise_needed), "collaborations", action="suggesting collaborations")
+    
+    def _collaborations_request(
+        self,
+        gap: str,
+        expertise_needed: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """Build the chat completion request for suggest_collaborations"""
         if expertise_needed is None:
             expertise_needed = []
         
@@ -308,24 +353,61 @@ class ResearchGapFinder:
         7. Potential challenges and solutions
         """
         
-        try:
-            response = self.client.client.chat.completions.create(
-                model=self.client.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert in research collaboration and interdisciplinary work."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=1500
-            )
-            
-            return {
-                "success": True,
-                "collaborations": response.choices[0].message.content
-            }
-            
-        except Exception as e:
-            logger.error(f"Error suggesting collaborations: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
\ No newline at end of file
+        return dict(
+            model=self.client.model,
+            messages=[
+                {"role": "system", "content": "You are an expert in research collaboration and interdisciplinary work."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=1500
+        )
+    
+    async def full_report(
+        self,
+        papers: List[Dict[str, Any]],
+        research_area: str,
+        gap_types: List[str] = None,
+        focus_gap: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Identify gaps, then run every analysis that depends on them concurrently
+        
+        Prioritization, trend analysis, the proposal and the collaboration
+        suggestions only need the identified gaps, not each other, so the
+        report takes as long as identification plus the slowest of them.
+        
+        Args:
+            papers: List of paper data
+            research_area: The research domain
+            gap_types: Types of gaps to identify
+            focus_gap: Gap the proposal and collaborations address; the
+                identified gaps if omitted
+        
+        Returns:
+            The result of each stage under gaps and, once gaps were found,
+            prioritized, trends, proposal and collaborations
+        """
+        gaps = await self.aidentify_gaps(papers, research_area, gap_types)
+        if not gaps["success"]:
+            return {"gaps": gaps}
+        
+        gap = focus_gap or gaps["gaps"]
+        analyses = {
+            "prioritized": self.aprioritize_gaps([gaps["gaps"]]),
+            "trends": self.aanalyze_gap_trends([gaps["gaps"]]),
+            "proposal": self.agenerate_research_proposal(gap, research_area),
+            "collaborations": self.asuggest_collaborations(gap)
+        }
+        
+        results = await asyncio.gather(*analyses.values())
+        return {"gaps": gaps, **dict(zip(analyses, results))}
+    
+    def full_report_sync(
+        self,
+        papers: List[Dict[str, Any]],
+        research_area: str,
+        gap_types: List[str] = None,
+        focus_gap: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Synchronous facade over full_report for callers without an event loop"""
+        return asyncio.run(self.full_report(papers, research_area, gap_types, focus_gap))
\ No newline at end of file
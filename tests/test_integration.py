@@ -1,25 +1,52 @@
 """Integration tests for IntelliDoc Research Pro"""
 
 import unittest
+import json
+import re
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.gpt5_client import GPT5Client
+from core.gpt5_client import GPT5Client, _retry
+from core.gpt5_cache import LLMCache
+from core.semantic_cache import SemanticCache
+from core.disk_cache import DiskCache
+from core.rate_limiter import RateLimiter
+from core.batch_dispatcher import BatchDispatcher
+from core.single_flight import SingleFlight
+import httpx
+import tempfile
+import io
+import hashlib
+from openai import APIConnectionError
+import threading
+import asyncio
+import time
+from types import SimpleNamespace
+import numpy as np
+from modules import file_processor
 from modules.file_processor import FileProcessor
+from modules.export_manager import ExportManager
+from research import citation_manager
 from research.citation_manager import CitationManager
 from research.literature_review import LiteratureReviewGenerator
 from research.hypothesis_generator import HypothesisGenerator
 from research.research_gap_finder import ResearchGapFinder
 from utils.validators import Validators
 from utils.helpers import Helpers
+from config.settings import Config
+
+# Large text inputs shared by several tests, built once
+_WORDS_1000 = " ".join(["word"] * 1000)
+_WORDS_250 = " ".join(["word"] * 250)
 
 class TestGPT5Client(unittest.TestCase):
     """Test GPT-5 client functionality"""
     
-    def setUp(self):
-        """Set up test client"""
-        self.client = GPT5Client()
+    @classmethod
+    def setUpClass(cls):
+        """Set up one test client for the whole class"""
+        cls.client = GPT5Client()
     
     def test_client_initialization(self):
         """Test client initialization"""
@@ -37,12 +64,323 @@ class TestGPT5Client(unittest.TestCase):
         if result["success"]:
             self.assertIn("analysis", result)
 
+    def test_build_request(self):
+        """Test request parameters carry reasoning_effort only where supported"""
+        messages = [{"role": "user", "content": "Hi"}]
+        request = self.client.build_request(messages, 100, "low", temperature=0.2)
+
+        self.assertEqual(request["model"], self.client.model)
+        self.assertEqual(request["temperature"], 0.2)
+        self.assertEqual("reasoning_effort" in request, self.client._supports_reasoning_effort)
+
+    def test_parse_citation_list(self):
+        """Test batch citations are matched to sources by index"""
+        content = '{"citations": [{"index": 2, "citation": "B"}, {"index": 1, "citation": "A"}, {"index": 7, "citation": "X"}]}'
+        self.assertEqual(GPT5Client._parse_citation_list(content, 3), {1: "A", 2: "B"})
+        
+        self.assertEqual(GPT5Client._parse_citation_list('Here: ["A", "B"]', 2), {1: "A", 2: "B"})
+        self.assertEqual(GPT5Client._parse_citation_list("not json", 2), {})
+    
+    def test_parse_review_json(self):
+        """Test structured reviews yield every section and other text yields None"""
+        sections = GPT5Client._parse_review_json('{"executive_summary": "Sum", "conclusion": " End "}')
+        self.assertEqual(sections["executive_summary"], "Sum")
+        self.assertEqual(sections["conclusion"], "End")
+        self.assertEqual(sections["research_gaps"], "")
+
+        self.assertIsNone(GPT5Client._parse_review_json("## Executive Summary\nText"))
+        self.assertIsNone(GPT5Client._parse_review_json('["not", "an", "object"]'))
+        
+        sections = GPT5Client._parse_review_json('{"key_themes": ["Scale", "Cost"], "research_gaps": {"Data": "Scarce"}}')
+        self.assertEqual(sections["key_themes"], "- Scale\n- Cost")
+        self.assertEqual(sections["research_gaps"], "**Data**: Scarce")
+    
+    def test_truncated_structured_review_falls_back_to_markdown(self):
+        """Test a structured review cut off at max_tokens is re-requested as markdown"""
+        client = GPT5Client()
+        requests = []
+        
+        def create(request_params):
+            requests.append(request_params)
+            if "response_format" in request_params:
+                choice = SimpleNamespace(finish_reason="length", message=SimpleNamespace(content='{"executive_summary": "Cut'))
+            else:
+                choice = SimpleNamespace(finish_reason="stop", message=SimpleNamespace(content="## Executive Summary\nFull"))
+            return SimpleNamespace(choices=[choice])
+        
+        client._create = create
+        result = client.generate_literature_review(["Paper text"], "Question?", structured=True)
+        
+        self.assertEqual(len(requests), 2)
+        self.assertNotIn("response_format", requests[1])
+        self.assertEqual(result["review"], "## Executive Summary\nFull")
+        self.assertNotIn("sections", result)
+
+    def test_retry_only_transient_errors(self):
+        """Test connection errors are retried and other errors fail fast"""
+        calls = []
+        
+        def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise APIConnectionError(request=httpx.Request("POST", "http://localhost"))
+            return "ok"
+        
+        self.assertEqual(_retry(flaky, attempts=2, base=0), "ok")
+        self.assertEqual(len(calls), 2)
+        
+        def broken():
+            calls.append(1)
+            raise ValueError("bad request")
+        
+        with self.assertRaises(ValueError):
+            _retry(broken, attempts=3, base=0)
+        self.assertEqual(len(calls), 3)
+    
+    def test_async_client_per_event_loop(self):
+        """Test concurrent event loops get their own async client, closed when the loop ends"""
+        barrier = threading.Barrier(2)
+        seen = []
+        
+        async def use_client():
+            first = await self.client._get_async_client()
+            await asyncio.get_running_loop().run_in_executor(None, barrier.wait)
+            # Another loop opening its client meanwhile must not replace this one
+            self.assertEqual(await self.client._get_async_client(), first)
+            seen.append(first)
+        
+        threads = [threading.Thread(target=asyncio.run, args=(use_client(),)) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len(seen), 2)
+        self.assertIsNot(seen[0][0], seen[1][0])
+        self.assertIsNot(seen[0][1], seen[1][1])
+        self.assertTrue(all(client.is_closed() for client, _ in seen))
+        self.assertEqual(len(self.client._aclients), 0)
+    
+    def test_complete_wraps_content_or_error(self):
+        """Test complete returns the content under result_key with extras, or the error"""
+        client = GPT5Client()
+        client._create = lambda request_params: SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="text"))]
+        )
+        self.assertEqual(
+            client.complete({"messages": []}, "themes", count=2),
+            {"success": True, "themes": "text", "count": 2}
+        )
+        
+        def fail(request_params):
+            raise RuntimeError("down")
+        
+        client._create = fail
+        self.assertEqual(client.complete({"messages": []}, "themes"), {"success": False, "error": "down"})
+    
+    def test_meta_analysis_validates_before_summarizing(self):
+        """Test invalid meta-analysis input fails without spending summary calls"""
+        client = GPT5Client()
+        summarized = []
+        client.summarize_papers = lambda papers, focus="": summarized.append(papers) or papers
+        
+        one_study = client.conduct_meta_analysis(["Study A", " "], "Does X work?", summarize_first=True)
+        no_question = client.conduct_meta_analysis(["Study A", "Study B"], " ", summarize_first=True)
+        self.assertFalse(one_study["success"])
+        self.assertFalse(no_question["success"])
+        self.assertEqual(summarized, [])
+    
+    def test_compare_documents_async_under_running_loop(self):
+        """Test documents can be compared from a coroutine, where asyncio.run would raise"""
+        client = GPT5Client()
+        requests = []
+        
+        async def aextract_aspects(documents, aspects):
+            return [f"{aspects[0]} of {doc}" for doc in documents]
+        
+        async def acreate(request_params):
+            requests.append(request_params)
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="table"))])
+        
+        client.aextract_aspects = aextract_aspects
+        client._acreate = acreate
+        
+        result = asyncio.run(client.acompare_documents(["A", "B"], ["Methodology"]))
+        self.assertEqual(result, {"success": True, "comparison": "table"})
+        self.assertIn("Methodology of B", requests[0]["messages"][1]["content"])
+
+class TestLLMCache(unittest.TestCase):
+    """Test response cache behaviour"""
+    
+    def test_key_is_order_independent(self):
+        """Test cache keys ignore parameter order"""
+        key1 = LLMCache.make_key({"model": "m", "temperature": 0.7})
+        key2 = LLMCache.make_key({"temperature": 0.7, "model": "m"})
+        
+        self.assertEqual(key1, key2)
+    
+    def test_hit_miss_and_eviction(self):
+        """Test hits, misses and LRU eviction"""
+        cache = LLMCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        
+        cache.set("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 1, "size": 2})
+    
+    def test_expiry(self):
+        """Test expired entries are not returned"""
+        cache = LLMCache(ttl_seconds=0)
+        cache.set("a", 1)
+        
+        self.assertIsNone(cache.get("a"))
+
+class TestDiskCache(unittest.TestCase):
+    """Test persistent cache behaviour"""
+    
+    def test_values_persist_and_expire(self):
+        """Test values survive reopening the cache and expire after the TTL"""
+        with tempfile.TemporaryDirectory() as directory:
+            DiskCache(directory).set("a", {"citation": "Smith (2023)"})
+            self.assertEqual(DiskCache(directory).get("a"), {"citation": "Smith (2023)"})
+            
+            cache = DiskCache(directory, ttl_seconds=0)
+            cache.set("b", "value")
+            self.assertIsNone(cache.get("b"))
+
+class TestSemanticCache(unittest.TestCase):
+    """Test semantic cache matching"""
+    
+    def test_similarity_threshold_and_scope(self):
+        """Test near-duplicates hit within a scope only"""
+        vectors = {
+            "key findings": np.array([1.0, 0.0], dtype=np.float32),
+            "main findings": np.array([0.96, 0.28], dtype=np.float32),
+            "methods used": np.array([0.0, 1.0], dtype=np.float32)
+        }
+        cache = SemanticCache(threshold=0.92, max_entries=2)
+        cache._embed = vectors.get
+        
+        cache.set("paper-a", "key findings", "answer")
+        self.assertEqual(cache.get("paper-a", "main findings"), "answer")
+        self.assertIsNone(cache.get("paper-a", "methods used"))
+        self.assertIsNone(cache.get("paper-b", "main findings"))
+        
+        cache.set("paper-a", "methods used", "m")
+        cache.set("paper-b", "main findings", "b")
+        self.assertEqual(cache.stats()["size"], 2)
+        self.assertIsNone(cache.get("paper-a", "key findings"))
+
+class TestRateLimiter(unittest.TestCase):
+    """Test client-side rate limiting"""
+    
+    def test_bucket_and_cooldown(self):
+        """Test requests wait once the bucket is empty or during a cooldown"""
+        limiter = RateLimiter(rpm=2)
+        self.assertEqual(limiter._reserve(), 0.0)
+        self.assertEqual(limiter._reserve(), 0.0)
+        self.assertGreater(limiter._reserve(), 0.0)
+        
+        limiter = RateLimiter(rpm=60)
+        limiter.cooldown(5)
+        self.assertGreater(limiter._reserve(), 4.0)
+
+class TestBatchDispatcher(unittest.TestCase):
+    """Test request coalescing"""
+    
+    def test_concurrent_items_share_one_call(self):
+        """Test items submitted together are sent in one batch"""
+        calls = []
+        
+        def send_batch(payload, items):
+            calls.append(list(items))
+            return [f"{payload}:{item}" for item in items]
+        
+        dispatcher = BatchDispatcher(send_batch, window_ms=200, max_batch=3)
+        results = {}
+        
+        def submit(item):
+            results[item] = dispatcher.submit("group", "ctx", item)
+        
+        threads = [threading.Thread(target=submit, args=(i,)) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, {i: f"ctx:{i}" for i in range(3)})
+
+class TestSingleFlight(unittest.TestCase):
+    """Test sharing of in-flight calls"""
+    
+    def test_concurrent_callers_share_one_call(self):
+        """Test callers of a key in flight get its result without calling again"""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        
+        def call():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "response"
+        
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("k", call)))
+        leader.start()
+        started.wait(5)
+        followers = [threading.Thread(target=lambda: results.append(flight.do("k", call))) for _ in range(2)]
+        for thread in followers:
+            thread.start()
+        time.sleep(0.2)  # let the followers join the call in flight
+        release.set()
+        for thread in [leader] + followers:
+            thread.join()
+        
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["response"] * 3)
+        self.assertEqual(flight.do("k", lambda: "fresh"), "fresh")
+    
+    def test_follower_takes_over_cancelled_call(self):
+        """Test a cancelled leader hands the call to a waiting caller instead of failing it"""
+        flight = SingleFlight()
+        calls = []
+        
+        async def scenario():
+            started = asyncio.Event()
+            
+            async def hang():
+                calls.append("leader")
+                started.set()
+                await asyncio.sleep(10)
+            
+            async def answer():
+                calls.append("follower")
+                return "response"
+            
+            leader = asyncio.create_task(flight.ado("k", hang))
+            await started.wait()
+            follower = asyncio.create_task(flight.ado("k", answer))
+            await asyncio.sleep(0)  # let the follower join the call in flight
+            leader.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await leader
+            return await follower
+        
+        self.assertEqual(asyncio.run(scenario()), "response")
+        self.assertEqual(calls, ["leader", "follower"])
+        self.assertEqual(flight._inflight, {})
+
 class TestFileProcessor(unittest.TestCase):
     """Test file processing functionality"""
     
     def test_chunk_text(self):
         """Test text chunking"""
-        text = " ".join(["word"] * 1000)
+        text = _WORDS_1000
         chunks = FileProcessor.chunk_text(text, max_chunk_size=100)
         
         self.assertIsInstance(chunks, list)
@@ -51,6 +389,126 @@ class TestFileProcessor(unittest.TestCase):
         for chunk in chunks:
             self.assertTrue(len(chunk) <= 100)
 
+    def test_truncate_tokens(self):
+        """Test token truncation keeps short text and cuts long text"""
+        self.assertEqual(FileProcessor.truncate_tokens("short text", 100), "short text")
+        
+        truncated = FileProcessor.truncate_tokens(_WORDS_1000, 50)
+        self.assertLessEqual(FileProcessor.count_tokens(truncated), 50)
+        self.assertTrue(len(truncated) > 0)
+
+        self.assertEqual(FileProcessor.share_token_budget(7500, 10), 750)
+        self.assertEqual(FileProcessor.share_token_budget(7500, 3), 2500)
+        self.assertEqual(FileProcessor.share_token_budget(7500, 0), 7500)
+    
+    def test_parse_cache_open_failure_is_tolerated(self):
+        """Test an unusable parse cache path disables the cache instead of failing"""
+        with tempfile.NamedTemporaryFile() as blocker:
+            original = Config.PARSE_CACHE_PATH
+            Config.PARSE_CACHE_PATH = os.path.join(blocker.name, "cache")
+            file_processor._get_parse_cache.clear()
+            try:
+                self.assertIsNone(file_processor._get_parse_cache())
+            finally:
+                Config.PARSE_CACHE_PATH = original
+                file_processor._get_parse_cache.clear()
+        
+        self.assertRegex(file_processor._pdf_extractor_tag(), r"^(pymupdf|pypdf)-.+-r\d+$")
+    
+    def test_text_store_shares_and_prunes(self):
+        """Test persisted texts are shared by content and pruned once unused"""
+        with tempfile.TemporaryDirectory() as directory:
+            first = FileProcessor.persist_processed({"name": "a.txt", "content": "same text"}, directory)
+            second = FileProcessor.persist_processed({"name": "b.txt", "content": "same text"}, directory)
+            self.assertEqual(first["text_path"], second["text_path"])
+            self.assertEqual(os.listdir(directory), [os.path.basename(first["text_path"])])
+            
+            self.assertEqual(FileProcessor.prune_text_store(directory, 3600), 0)
+            old = time.time() - 7200
+            os.utime(first["text_path"], (old, old))
+            # Reading a text marks it as in use
+            self.assertEqual(FileProcessor.load_content(first), "same text")
+            self.assertEqual(FileProcessor.prune_text_store(directory, 3600), 0)
+            
+            os.utime(first["text_path"], (old, old))
+            self.assertEqual(FileProcessor.prune_text_store(directory, 3600), 1)
+            self.assertEqual(os.listdir(directory), [])
+            inline = {"name": "c.txt", "content": "kept inline"}
+            self.assertEqual(FileProcessor.retain_persisted([first, inline]), [inline])
+    
+    @unittest.skipUnless(file_processor._PYMUPDF_AVAILABLE, "PyMuPDF not installed")
+    def test_pymupdf_two_column_order(self):
+        """Test PyMuPDF extraction reads the left column before the right one"""
+        import fitz
+        with fitz.open() as doc:
+            page = doc.new_page(width=600, height=800)
+            page.insert_text((50, 100), "Left top")
+            page.insert_text((350, 90), "Right top")
+            page.insert_text((50, 300), "Left bottom")
+            pdf_bytes = doc.tobytes()
+        
+        text = FileProcessor.extract_pdf_text(io.BytesIO(pdf_bytes))
+        self.assertEqual(text.split("\n"), ["Left top", "Left bottom", "Right top"])
+
+class TestExportManager(unittest.TestCase):
+    """Test export helpers"""
+    
+    def test_deleted_export_directory_is_recreated(self):
+        """Test a new manager re-creates an export directory deleted after first use"""
+        with tempfile.TemporaryDirectory() as directory:
+            export_path = os.path.join(directory, "exports")
+            ExportManager(export_path)
+            os.rmdir(export_path)
+            ExportManager(export_path)
+            self.assertTrue(os.path.isdir(export_path))
+    
+    def test_escape_latex(self):
+        """Test special characters are escaped once, including backslashes"""
+        with tempfile.TemporaryDirectory() as directory:
+            escaped = ExportManager(directory)._escape_latex("a\\b {c} 50% $x_1^2")
+        
+        self.assertEqual(escaped, "a\\textbackslash{}b \\{c\\} 50\\% \\$x\\_1\\textasciicircum{}2")
+    
+    def test_bibtex_entry_from_source(self):
+        """Test sources become structured BibTeX records"""
+        with tempfile.TemporaryDirectory() as directory:
+            entry = ExportManager(directory)._bibtex_entry("ref1", {
+                "type": "Journal Article",
+                "authors": "Smith, J., & Doe, A.",
+                "title": "Deep & Wide",
+                "year": "2023"
+            })
+        
+        self.assertTrue(entry.startswith("@article{ref1,"))
+        self.assertIn("author = {Smith, J. and Doe, A.}", entry)
+        self.assertIn("title = {Deep \\& Wide}", entry)
+        self.assertNotIn("2024", entry)
+
+    def test_iter_blocks(self):
+        """Test content is flattened into blocks in document order"""
+        with tempfile.TemporaryDirectory() as directory:
+            blocks = list(ExportManager(directory)._iter_blocks({
+                "title": "Review",
+                "metadata": {"Papers": 2},
+                "full_review": "First\nline\n\n\nSecond",
+                "sections": {"key_findings": "Found", "gaps": ""}
+            }))
+
+        self.assertEqual(
+            [(b.kind, b.text, b.level) for b in blocks],
+            [
+                ("heading", "Review", 0),
+                ("heading", "Document Information", 1),
+                ("meta", "2", 0),
+                ("heading", "Literature Review", 1),
+                ("paragraph", "First\nline", 0),
+                ("paragraph", "Second", 0),
+                ("heading", "Key Findings", 2),
+                ("paragraph", "Found", 0)
+            ]
+        )
+        self.assertEqual(blocks[2].label, "Papers")
+
 class TestCitationManager(unittest.TestCase):
     """Test citation management"""
     
@@ -81,6 +539,35 @@ class TestCitationManager(unittest.TestCase):
         
         self.assertIsInstance(citations, list)
         self.assertTrue(len(citations) >= 2)
+        self.assertEqual(
+            [(c["authors"], c["year"]) for c in citations],
+            [("Smith", "2023"), ("Jones et al.", "2022")]
+        )
+        
+        parenthetical = self.manager.extract_citations("Prior work (Smith & Jones, 2021) agrees.")
+        self.assertEqual(parenthetical[0]["authors"], "Smith & Jones")
+        
+        # Capitalized words that are not authors do not make narrative citations
+        for text in ("Published in Nature (2020). See Table (2021)",
+                     "Figure (2019), Section (2018) and Eq. (2017) differ"):
+            self.assertEqual(self.manager.extract_citations(text), [])
+    
+    @unittest.skipUnless(citation_manager._RE2_AVAILABLE, "google-re2 not installed")
+    def test_citation_pattern_re2(self):
+        """Test the RE2-compiled citation pattern matches what the re module would"""
+        pattern = CitationManager.CITATION_PATTERN
+        self.assertEqual(type(pattern).__module__, "re2")
+        
+        text = "Prior work (Smith & Jones, 2021) and (Lee 2019) agree [3], unlike [12] or Park et al. (2020)."
+        fallback = re.compile(pattern.pattern)
+        self.assertEqual(
+            [match.groupdict() for match in pattern.finditer(text)],
+            [match.groupdict() for match in fallback.finditer(text)]
+        )
+        self.assertEqual(
+            [citation["type"] for citation in self.manager.extract_citations(text)],
+            ["in-text", "in-text", "in-text", "numbered", "numbered"]
+        )
     
     def test_validate_citation(self):
         """Test citation validation"""
@@ -128,6 +615,19 @@ class TestValidators(unittest.TestCase):
         
         self.assertTrue(good_result["valid"])
         self.assertFalse(bad_result["valid"])
+        
+        # Contractions still count as question words without a question mark
+        contracted = Validators.validate_research_question("What's the effect of sleep on memory consolidation")
+        self.assertNotIn("Consider phrasing as a clear question", contracted["suggestions"])
+    
+    def test_validate_hypothesis(self):
+        """Test hypothesis validation matches whole words and inflections"""
+        testable = Validators.validate_hypothesis("Sleep deprivation increases reaction time between trials")
+        vague = Validators.validate_hypothesis("This analysis is about understanding sleep research")
+        
+        self.assertTrue(testable["valid"])
+        self.assertEqual(testable["suggestions"], [])
+        self.assertEqual(len(vague["suggestions"]), 2)
     
     def test_validate_email(self):
         """Test email validation"""
@@ -154,7 +654,7 @@ class TestHelpers(unittest.TestCase):
     
     def test_calculate_reading_time(self):
         """Test reading time calculation"""
-        text = " ".join(["word"] * 250)  # 250 words
+        text = _WORDS_250
         time = Helpers.calculate_reading_time(text)
         
         self.assertEqual(time, 1)
@@ -190,6 +690,13 @@ class TestHelpers(unittest.TestCase):
         authors2 = "Smith, J., Jones, K., & Williams, R."
         parsed2 = Helpers.parse_authors(authors2)
         self.assertEqual(len(parsed2), 3)
+        
+        self.assertEqual(Helpers.parse_authors("A. Smith, B. Jones, C. Lee"), ["A. Smith", "B. Jones", "C. Lee"])
+        self.assertEqual(Helpers.parse_authors("J. Smith, K. Jones"), ["J. Smith", "K. Jones"])
+        self.assertEqual(
+            Helpers.parse_authors("Smith, J. K., Jones, K.-L., and Lee, M."),
+            ["Smith, J. K.", "Jones, K.-L.", "Lee, M."]
+        )
     
     def test_calculate_similarity(self):
         """Test similarity calculation"""
@@ -203,21 +710,69 @@ class TestHelpers(unittest.TestCase):
         self.assertTrue(score1 > score2)
         self.assertTrue(0 <= score1 <= 1)
         self.assertTrue(0 <= score2 <= 1)
+        
+        matrix = Helpers.calculate_similarity_matrix([text1, text2, text3, ""])
+        self.assertEqual(matrix.shape, (4, 4))
+        self.assertAlmostEqual(float(matrix[0, 1]), score1, places=6)
+        self.assertAlmostEqual(float(matrix[2, 0]), score2, places=6)
+        np.testing.assert_array_equal(matrix, matrix.T)
+        np.testing.assert_array_equal(np.diag(matrix), [1, 1, 1, 0])
+        
+        cosine = Helpers.calculate_cosine_similarity_matrix(["data data model", "data model model", "other", ""])
+        self.assertAlmostEqual(float(cosine[0, 1]), 0.8, places=5)
+        self.assertEqual(float(cosine[0, 2]), 0.0)
+        np.testing.assert_allclose(np.diag(cosine), [1, 1, 1, 0], atol=1e-6)
+    
+    def test_calculate_file_hash(self):
+        """Test streamed file hashes match content hashes"""
+        content = "naïve " * 100_000
+        
+        self.assertEqual(len(Helpers.calculate_hash(content)), 64)
+        self.assertEqual(
+            Helpers.calculate_file_hash(io.BytesIO(content.encode('utf-8'))),
+            Helpers.calculate_hash(content)
+        )
+    
+    def test_unique_papers(self):
+        """Test processed metadata and loaded papers deduplicate by the same key"""
+        sha1 = hashlib.sha1("Paper text".encode('utf-8')).hexdigest()
+        papers = [
+            {"filename": "a.pdf", "sha1": sha1},
+            {"filename": "b.pdf", "content": "Paper text"},
+            {"filename": "c.pdf", "content": "Other text"},
+            {"filename": "c.pdf", "content": ""},
+            {"filename": "c.pdf", "content": "  "}
+        ]
+        
+        unique = Helpers.unique_papers(papers)
+        self.assertEqual([p["filename"] for p in unique], ["a.pdf", "c.pdf", "c.pdf"])
+        self.assertEqual(unique[1]["content"], "Other text")
 
 class TestResearchModules(unittest.TestCase):
     """Test research-specific modules"""
     
-    def setUp(self):
-        self.client = GPT5Client()
-        self.lit_review = LiteratureReviewGenerator(self.client)
-        self.hypothesis_gen = HypothesisGenerator(self.client)
-        self.gap_finder = ResearchGapFinder(self.client)
+    @classmethod
+    def setUpClass(cls):
+        cls.client = GPT5Client()
+        cls.lit_review = LiteratureReviewGenerator(cls.client)
+        cls.hypothesis_gen = HypothesisGenerator(cls.client)
+        cls.gap_finder = ResearchGapFinder(cls.client)
     
     def test_literature_review_initialization(self):
         """Test literature review generator initialization"""
         self.assertIsNotNone(self.lit_review)
         self.assertIsNotNone(self.lit_review.client)
-    
+
+    def test_parse_review_sections(self):
+        """Test review text is split at section marker lines"""
+        review = "Preamble\n## Executive Summary\nOverview\nFuture research gaps:\nGap text\n# Conclusion\nEnd"
+        sections = self.lit_review._parse_review_sections(review)
+
+        self.assertEqual(sections["executive_summary"], "## Executive Summary\nOverview\n")
+        self.assertEqual(sections["research_gaps"], "Future research gaps:\nGap text\n")
+        self.assertEqual(sections["conclusion"], "# Conclusion\nEnd\n")
+        self.assertEqual(sections["future_directions"], "")
+
     def test_hypothesis_generator_initialization(self):
         """Test hypothesis generator initialization"""
         self.assertIsNotNone(self.hypothesis_gen)
@@ -228,6 +783,66 @@ class TestResearchModules(unittest.TestCase):
         self.assertIsNotNone(self.gap_finder)
         self.assertIsNotNone(self.gap_finder.client)
 
+    def test_paper_features_shared_across_analyses(self):
+        """Test analyses of the same papers share one per-paper extraction"""
+        client = GPT5Client()
+        extractions = []
+
+        async def aextract_aspects(documents, aspects):
+            extractions.append(tuple(aspects))
+            return [json.dumps({aspect: f"{aspect} of {doc}" for aspect in aspects}) for doc in documents]
+
+        client.aextract_aspects = aextract_aspects
+        generator = LiteratureReviewGenerator(client)
+        papers = [{"content": "A"}, {"content": "B"}]
+
+        themes = generator._paper_features(papers, ("Main themes", "Key findings"))
+        generator._paper_features(papers, ("Limitations",))
+        self.assertEqual(len(extractions), 1)
+        self.assertEqual(json.loads(themes[1]), {"Main themes": "Main themes of B", "Key findings": "Key findings of B"})
+
+        # A new aspect extracts once more, keeping the ones covered so far
+        generator._paper_features(papers, ("Sample size",))
+        generator._paper_features(papers, ("Main themes", "Sample size"))
+        self.assertEqual(len(extractions), 2)
+        self.assertIn("Limitations", extractions[1])
+
+    def test_review_settings_control_summarizing(self):
+        """Test generate_review summarizes only when the settings ask for it"""
+        client = GPT5Client()
+        calls = []
+        
+        def generate_literature_review(**kwargs):
+            calls.append(kwargs["summarize_first"])
+            return {"success": False, "error": "stop"}
+        
+        client.generate_literature_review = generate_literature_review
+        generator = LiteratureReviewGenerator(client)
+        generator.generate_review([{"content": "Summary"}], "Does X work?", {"summarize_first": False})
+        generator.generate_review([{"content": "Full text"}], "Does X work?", {})
+        self.assertEqual(calls, [False, True])
+    
+    def test_gap_report_runs_stages_after_identification(self):
+        """Test the gap report feeds identified gaps to every later stage"""
+        client = GPT5Client()
+        prompts = []
+
+        async def acreate(request_params):
+            prompts.append(request_params["messages"][1]["content"])
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="analysis"))])
+
+        async def acreate_semantic(request_params, scope, text):
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="GAP-LIST"))])
+
+        client._acreate = acreate
+        client._acreate_semantic = acreate_semantic
+        report = ResearchGapFinder(client).full_report_sync([{"title": "T", "content": "Text"}], "AI")
+
+        self.assertEqual(report["gaps"]["gaps"], "GAP-LIST")
+        self.assertEqual(report["proposal"], {"success": True, "proposal": "analysis"})
+        self.assertEqual(len(prompts), 4)
+        self.assertTrue(all("GAP-LIST" in prompt for prompt in prompts))
+
 def run_tests():
     """Run all tests"""
     unittest.main(argv=[''], exit=False, verbosity=2)
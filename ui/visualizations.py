@@ -3,11 +3,64 @@
 import plotly.graph_objects as go
 import plotly.express as px
 from wordcloud import WordCloud
-import pandas as pd
+import numpy as np
 import networkx as nx
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 import streamlit as st
 
+@lru_cache(maxsize=32)
+def _spring_positions(nodes: tuple, edges: tuple) -> np.ndarray:
+    """
+    Lay out a graph once per node and edge set, as an (n, 2) array in node order
+
+    The fixed seed keeps the layout identical across reruns. For large graphs
+    spring_layout switches to its sparse scipy L-BFGS energy minimization.
+    """
+    G = nx.Graph()
+    G.add_nodes_from(nodes)
+    G.add_edges_from(edges)
+    pos = nx.spring_layout(G, seed=42)
+    
+    positions = np.array([pos[node] for node in nodes], dtype=np.float32).reshape(-1, 2)
+    positions.setflags(write=False)
+    return positions
+
+def _network_arrays(G: nx.Graph) -> Tuple[List[Any], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return a graph's nodes, their layout positions, edges as (m, 2) node
+    indices and node degrees, all in node order
+    """
+    nodes = list(G.nodes())
+    node_pos = _spring_positions(tuple(nodes), tuple(G.edges()))
+    
+    index = {node: i for i, node in enumerate(nodes)}
+    ends = np.array([(index[u], index[v]) for u, v in G.edges()], dtype=np.int32).reshape(-1, 2)
+    degrees = np.array([G.degree(node) for node in nodes], dtype=np.int32)
+    return nodes, node_pos, ends, degrees
+
+@lru_cache(maxsize=1)
+def _demo_network() -> Tuple[List[Any], np.ndarray, np.ndarray, np.ndarray]:
+    """Karate club demo network arrays, built and laid out on first use only"""
+    nodes, node_pos, ends, degrees = _network_arrays(nx.karate_club_graph())
+    ends.setflags(write=False)
+    degrees.setflags(write=False)
+    return nodes, node_pos, ends, degrees
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _word_cloud(text: str) -> WordCloud:
+    """Render a word cloud once per text; reruns get a copy of the cached one"""
+    # Single words only: scoring bigram collocations is most of the cost.
+    # Two-letter terms such as "AI" and "ML" are kept
+    return WordCloud(
+        width=800,
+        height=400,
+        background_color='white',
+        colormap='viridis',
+        max_words=100,
+        collocations=False
+    ).generate(text)
+
 class ResearchVisualizations:
     """Create various research-related visualizations"""
     
@@ -16,44 +69,42 @@ class ResearchVisualizations:
         """
         Create an interactive timeline of research papers
         
+        Drawn with WebGL (Scattergl) so reviews with hundreds of papers do not
+        build an SVG node per point; text labels and the customdata hover
+        template work the same as with SVG Scatter.
+        
         Args:
             papers: List of paper data with years
             
         Returns:
             Plotly figure
         """
-        # Extract years and titles
-        timeline_data = []
+        # Collect the columns in one pass; plain arrays avoid Plotly's slow
+        # coercion of pandas Series
+        years, titles, authors = [], [], []
         for paper in papers:
             if "year" in paper and "title" in paper:
-                timeline_data.append({
-                    "year": paper["year"],
-                    "title": paper["title"],
-                    "authors": paper.get("authors", "Unknown")
-                })
+                years.append(paper["year"])
+                titles.append(paper["title"])
+                authors.append(paper.get("authors", "Unknown"))
         
-        if not timeline_data:
+        if not years:
             # Create dummy data for demo
-            timeline_data = [
-                {"year": 2020, "title": "Paper 1", "authors": "Author A"},
-                {"year": 2021, "title": "Paper 2", "authors": "Author B"},
-                {"year": 2022, "title": "Paper 3", "authors": "Author C"},
-                {"year": 2023, "title": "Paper 4", "authors": "Author D"},
-            ]
-        
-        df = pd.DataFrame(timeline_data)
+            years = [2020, 2021, 2022, 2023]
+            titles = ["Paper 1", "Paper 2", "Paper 3", "Paper 4"]
+            authors = ["Author A", "Author B", "Author C", "Author D"]
         
         fig = go.Figure()
         
-        fig.add_trace(go.Scatter(
-            x=df['year'],
-            y=list(range(len(df))),
+        fig.add_trace(go.Scattergl(
+            x=np.asarray(years),
+            y=np.arange(len(years), dtype=np.int32),
             mode='markers+text',
             marker=dict(size=15, color='blue'),
-            text=df['title'],
+            text=np.array(titles, dtype=object),
             textposition="top center",
             hovertemplate='<b>%{text}</b><br>Year: %{x}<br>Authors: %{customdata}<extra></extra>',
-            customdata=df['authors']
+            customdata=np.array(authors, dtype=object)
         ))
         
         fig.update_layout(
@@ -91,7 +142,7 @@ class ResearchVisualizations:
         
         fig = go.Figure(data=[go.Pie(
             labels=list(themes.keys()),
-            values=list(themes.values()),
+            values=np.fromiter(themes.values(), dtype=np.int32, count=len(themes)),
             hole=0.3,
             marker=dict(colors=px.colors.qualitative.Set3)
         )])
@@ -116,39 +167,38 @@ class ResearchVisualizations:
         """
         # Create a simple demo network if no data
         if not citations:
-            G = nx.karate_club_graph()
+            nodes, node_pos, ends, degrees = _demo_network()
         else:
             G = nx.Graph()
             for citation in citations:
                 if "source" in citation and "target" in citation:
                     G.add_edge(citation["source"], citation["target"])
-        
-        # Get positions for nodes
-        pos = nx.spring_layout(G)
-        
-        # Create edge trace
-        edge_trace = []
-        for edge in G.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_trace.append(go.Scatter(
-                x=[x0, x1, None],
-                y=[y0, y1, None],
-                mode='lines',
-                line=dict(width=0.5, color='gray'),
-                hoverinfo='none'
-            ))
+            nodes, node_pos, ends, degrees = _network_arrays(G)
+        
+        # Create a single edge trace: each edge is two points followed by a
+        # NaN, which breaks the line, so the browser draws one trace not one per edge
+        edge_x = np.full(3 * len(ends), np.nan, dtype=np.float32)
+        edge_y = np.full(3 * len(ends), np.nan, dtype=np.float32)
+        edge_x[0::3], edge_x[1::3] = node_pos[ends[:, 0], 0], node_pos[ends[:, 1], 0]
+        edge_y[0::3], edge_y[1::3] = node_pos[ends[:, 0], 1], node_pos[ends[:, 1], 1]
+        edge_trace = go.Scatter(
+            x=edge_x,
+            y=edge_y,
+            mode='lines',
+            line=dict(width=0.5, color='gray'),
+            hoverinfo='none'
+        )
         
         # Create node trace
         node_trace = go.Scatter(
-            x=[pos[node][0] for node in G.nodes()],
-            y=[pos[node][1] for node in G.nodes()],
+            x=node_pos[:, 0],
+            y=node_pos[:, 1],
             mode='markers+text',
-            text=[str(node) for node in G.nodes()],
+            text=[str(node) for node in nodes],
             textposition="top center",
             marker=dict(
                 size=10,
-                color=[G.degree(node) for node in G.nodes()],
+                color=degrees,
                 colorscale='Viridis',
                 showscale=True,
                 colorbar=dict(title="Connections")
@@ -157,7 +207,7 @@ class ResearchVisualizations:
         )
         
         # Create figure
-        fig = go.Figure(data=edge_trace + [node_trace])
+        fig = go.Figure(data=[edge_trace, node_trace])
         
         fig.update_layout(
             title="Citation Network",
@@ -191,24 +241,20 @@ class ResearchVisualizations:
                 "Survey": ["Paper 11", "Paper 12", "Paper 13"]
             }
         
-        data = []
-        for method, papers in methodologies.items():
-            data.append({
-                "Methodology": method,
-                "Count": len(papers),
-                "Papers": ", ".join(papers[:3]) + ("..." if len(papers) > 3 else "")
-            })
-        
-        df = pd.DataFrame(data)
+        counts = np.fromiter((len(papers) for papers in methodologies.values()), dtype=np.int32, count=len(methodologies))
+        paper_lists = np.array(
+            [", ".join(papers[:3]) + ("..." if len(papers) > 3 else "") for papers in methodologies.values()],
+            dtype=object
+        )
         
         fig = go.Figure(data=[go.Bar(
-            x=df['Methodology'],
-            y=df['Count'],
-            text=df['Count'],
+            x=np.array(list(methodologies), dtype=object),
+            y=counts,
+            text=counts,
             textposition='auto',
             marker_color='lightblue',
             hovertemplate='<b>%{x}</b><br>Papers: %{customdata}<br>Count: %{y}<extra></extra>',
-            customdata=df['Papers']
+            customdata=paper_lists
         )])
         
         fig.update_layout(
@@ -234,15 +280,7 @@ class ResearchVisualizations:
         if not text:
             text = "research analysis literature review methodology qualitative quantitative data science machine learning artificial intelligence"
         
-        wordcloud = WordCloud(
-            width=800,
-            height=400,
-            background_color='white',
-            colormap='viridis',
-            max_words=100
-        ).generate(text)
-        
-        return wordcloud
+        return _word_cloud(text)
     
     @staticmethod
     def create_statistics_summary(stats: Dict[str, Any]) -> go.Figure:
@@ -310,19 +348,20 @@ class ResearchVisualizations:
                 {"gap": "Theory development needed", "importance": 8}
             ]
         
-        df = pd.DataFrame(gaps)
+        labels = np.array([gap["gap"] for gap in gaps], dtype=object)
+        importance = np.array([gap["importance"] for gap in gaps])
         
         fig = go.Figure(data=[go.Bar(
-            y=df['gap'],
-            x=df['importance'],
+            y=labels,
+            x=importance,
             orientation='h',
             marker=dict(
-                color=df['importance'],
+                color=importance,
                 colorscale='Reds',
                 showscale=True,
                 colorbar=dict(title="Importance")
             ),
-            text=df['importance'],
+            text=importance,
             textposition='outside'
         )])
         
@@ -2,11 +2,50 @@
 
 import hashlib
 import json
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, FrozenSet, List, Optional
 import re
-import string
-import random
+import secrets
+import time
+
+import numpy as np
+
+try:
+    from scipy import sparse
+    _SCIPY_AVAILABLE = True
+except ImportError:
+    _SCIPY_AVAILABLE = False
+
+# Runs of letters/digits long enough to count as keywords; punctuation and
+# underscores separate words
+_KEYWORD_RE = re.compile(r"[^\W_]{3,}")
+
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'must', 'can', 'this',
+    'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
+})
+
+# C0/C1 control characters; whitespace among them is collapsed before this is applied
+_CONTROL_CHARS = dict.fromkeys([*range(0x20), *range(0x7f, 0xa0)])
+
+_CURLY_QUOTES = str.maketrans({'\u201c': '"', '\u201d': '"', '\u2018': "'", '\u2019': "'"})
+
+# Author separators: ';', '&' or 'and' (optionally after a comma), or a bare
+# comma unless it joins a surname to its own initials, as in
+# "Smith, J., Jones, K.-L., & Williams, R."; a comma before an initial-first
+# name ("A. Smith, B. Jones") still separates
+_AUTHOR_SEPARATOR_RE = re.compile(
+    r'\s*(?:;|,?\s*&|,?\s+and\s|,(?!\s*[A-Z]\.(?:[\s-]*[A-Z]\.)*\s*(?:[,;&]|and\b|$)))\s*'
+)
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
 
 class Helpers:
     """General helper utilities"""
@@ -22,9 +61,8 @@ class Helpers:
         Returns:
             Unique ID string
         """
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        random_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
-        return f"{prefix}_{timestamp}_{random_str}"
+        timestamp_ms = time.time_ns() // 1_000_000
+        return f"{prefix}_{timestamp_ms:013x}_{secrets.token_hex(3)}"
     
     @staticmethod
     def calculate_reading_time(text: str, wpm: int = 250) -> int:
@@ -71,30 +109,9 @@ class Helpers:
         Returns:
             List of keywords
         """
-        # Remove punctuation and convert to lowercase
-        text_clean = text.lower()
-        for char in string.punctuation:
-            text_clean = text_clean.replace(char, ' ')
-        
-        # Split into words
-        words = text_clean.split()
-        
-        # Remove common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-                     'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-                     'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-                     'could', 'should', 'may', 'might', 'must', 'can', 'could', 'this',
-                     'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'}
-        
-        # Count word frequency
-        word_freq = {}
-        for word in words:
-            if word not in stop_words and len(word) > 2:
-                word_freq[word] = word_freq.get(word, 0) + 1
-        
-        # Sort by frequency and return top keywords
-        sorted_keywords = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, _ in sorted_keywords[:num_keywords]]
+        words = _KEYWORD_RE.findall(text.lower())
+        counts = Counter(word for word in words if word not in _STOP_WORDS)
+        return [word for word, _ in counts.most_common(num_keywords)]
     
     @staticmethod
     def format_file_size(size_bytes: int) -> str:
@@ -107,11 +124,11 @@ class Helpers:
         Returns:
             Formatted size string
         """
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} TB"
+        # Each unit is 2**10 of the previous one, so the unit index is the
+        # binary exponent divided by 10
+        exponent = max(int(size_bytes).bit_length() - 1, 0) // 10
+        exponent = min(exponent, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (10 * exponent)):.2f} {_SIZE_UNITS[exponent]}"
     
     @staticmethod
     def clean_text(text: str) -> str:
@@ -127,19 +144,21 @@ class Helpers:
         # Remove extra whitespace
         text = ' '.join(text.split())
         
-        # Remove control characters
-        text = ''.join(char for char in text if char.isprintable() or char.isspace())
+        # Remove control characters, checking per character only if other
+        # non-printable characters remain
+        text = text.translate(_CONTROL_CHARS)
+        if not text.isprintable():
+            text = ''.join(char for char in text if char.isprintable() or char.isspace())
         
         # Normalize quotes
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace(''', "'").replace(''', "'")
+        text = text.translate(_CURLY_QUOTES)
         
         return text.strip()
     
     @staticmethod
     def calculate_hash(content: str) -> str:
         """
-        Calculate SHA256 hash of content
+        Calculate a 256-bit BLAKE2b hash of content
         
         Args:
             content: Content to hash
@@ -147,7 +166,56 @@ class Helpers:
         Returns:
             Hash string
         """
-        return hashlib.sha256(content.encode()).hexdigest()
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=32).hexdigest()
+    
+    @staticmethod
+    def calculate_file_hash(file_obj: BinaryIO) -> str:
+        """
+        Calculate the calculate_hash digest of a binary file without reading it into memory
+        
+        Args:
+            file_obj: File opened in binary mode, positioned at the start
+            
+        Returns:
+            Hash string
+        """
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: reads and hashes in C
+            return hashlib.file_digest(file_obj, lambda: hashlib.blake2b(digest_size=32)).hexdigest()
+        
+        digest = hashlib.blake2b(digest_size=32)
+        for chunk in iter(lambda: file_obj.read(1 << 18), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+    
+    @staticmethod
+    def unique_papers(papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Drop papers whose text repeats an earlier one, keeping the first occurrence
+        
+        Papers are identified by the SHA-1 of their text, the same key
+        FileProcessor.persist_processed stores as "sha1", so processed file
+        metadata and papers with loaded content deduplicate alike. Papers
+        without text fall back to their filename.
+        
+        Args:
+            papers: Paper dictionaries with "sha1" or "content" (and "filename")
+            
+        Returns:
+            The papers without repeats, in their original order
+        """
+        seen = set()
+        unique = []
+        for paper in papers:
+            key = paper.get('sha1')
+            if not key:
+                content = paper.get('content') or ''
+                identity = content if content.strip() else paper.get('filename', '')
+                key = hashlib.sha1(identity.encode('utf-8')).hexdigest()
+            if key not in seen:
+                seen.add(key)
+                unique.append(paper)
+        return unique
     
     @staticmethod
     def parse_authors(authors_str: str) -> List[str]:
@@ -160,18 +228,7 @@ class Helpers:
         Returns:
             List of author names
         """
-        # Handle different formats
-        if ';' in authors_str:
-            authors = authors_str.split(';')
-        elif ',' in authors_str and '&' in authors_str:
-            # Format: "Smith, J., Jones, K., & Williams, R."
-            authors = re.split(r',\s*&\s*|,\s*', authors_str)
-        elif ',' in authors_str:
-            authors = authors_str.split(',')
-        elif ' and ' in authors_str:
-            authors = authors_str.split(' and ')
-        else:
-            authors = [authors_str]
+        authors = _AUTHOR_SEPARATOR_RE.split(authors_str)
         
         # Clean up each author
         return [author.strip() for author in authors if author.strip()]
@@ -268,8 +325,7 @@ class Helpers:
         Returns:
             List of URLs
         """
-        url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-        return re.findall(url_pattern, text)
+        return _URL_RE.findall(text)
     
     @staticmethod
     def calculate_similarity_score(text1: str, text2: str) -> float:
@@ -283,17 +339,40 @@ class Helpers:
         Returns:
             Similarity score (0-1)
         """
-        # Simple word overlap calculation
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        
-        if not words1 or not words2:
-            return 0.0
+        return _jaccard(_word_set(text1), _word_set(text2))
+    
+    @staticmethod
+    def calculate_similarity_matrix(texts: List[str]) -> np.ndarray:
+        """
+        Calculate pairwise similarity scores for a batch of texts
         
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
+        Args:
+            texts: Texts to compare
+            
+        Returns:
+            Symmetric (n, n) float32 matrix of calculate_similarity_score values
+        """
+        # Word-presence rows: X @ X.T counts shared words for every pair at once
+        shared = _gram_matrix(_term_matrix(texts, binary=True))
+        sizes = np.diag(shared)
+        union = sizes[:, None] + sizes[None, :] - shared
+        return np.divide(shared, union, out=np.zeros_like(shared), where=union > 0)
+    
+    @staticmethod
+    def calculate_cosine_similarity_matrix(texts: List[str]) -> np.ndarray:
+        """
+        Calculate pairwise cosine similarity of word-count vectors for a batch of texts
         
-        return len(intersection) / len(union) if union else 0.0
+        Args:
+            texts: Texts to compare
+            
+        Returns:
+            Symmetric (n, n) float32 matrix of scores (0-1); 0 for empty texts
+        """
+        dots = _gram_matrix(_term_matrix(texts, binary=False))
+        norms = np.sqrt(np.diag(dots))
+        scale = np.outer(norms, norms)
+        return np.divide(dots, scale, out=np.zeros_like(dots), where=scale > 0)
     
     @staticmethod
     def format_number(num: float, decimals: int = 2) -> str:
@@ -312,4 +391,50 @@ class Helpers:
         elif num >= 1_000:
             return f"{num/1_000:.{decimals}f}K"
         else:
-            return f"{num:.{decimals}f}"
\ No newline at end of file
+            return f"{num:.{decimals}f}"
+
+
+@lru_cache(maxsize=4096)
+def _word_set(text: str) -> FrozenSet[str]:
+    """Lowercased word set of text; texts recur across pairwise comparisons, so each is split once"""
+    return frozenset(text.lower().split())
+
+
+def _jaccard(words1: FrozenSet[str], words2: FrozenSet[str]) -> float:
+    """Word overlap (Jaccard index) of two word sets; 0.0 if either is empty"""
+    if not words1 or not words2:
+        return 0.0
+    return len(words1 & words2) / len(words1 | words2)
+
+
+def _term_matrix(texts: List[str], binary: bool):
+    """
+    Texts as rows of lowercased word counts (or 1 for present words if binary)
+    
+    Returns a float32 scipy CSR matrix, or a dense array without scipy.
+    """
+    vocabulary: Dict[str, int] = {}
+    indptr, indices, counts = [0], [], []
+    for text in texts:
+        words = dict.fromkeys(_word_set(text), 1) if binary else Counter(text.lower().split())
+        for word, count in words.items():
+            indices.append(vocabulary.setdefault(word, len(vocabulary)))
+            counts.append(count)
+        indptr.append(len(indices))
+    
+    shape = (len(texts), len(vocabulary))
+    counts = np.asarray(counts, dtype=np.float32)
+    if _SCIPY_AVAILABLE:
+        return sparse.csr_matrix((counts, indices, indptr), shape=shape)
+    
+    matrix = np.zeros(shape, dtype=np.float32)
+    matrix[np.repeat(np.arange(len(texts)), np.diff(indptr)), indices] = counts
+    return matrix
+
+
+def _gram_matrix(matrix) -> np.ndarray:
+    """Dense float32 row-by-row dot products (matrix @ matrix.T)"""
+    product = matrix @ matrix.T
+    if _SCIPY_AVAILABLE:
+        product = product.toarray()
+    return np.asarray(product, dtype=np.float32)
@@ -1,10 +1,33 @@
 """Input validation utilities"""
 
+import numbers
 import re
 from typing import Any, List, Optional, Dict
 import os
 from config.settings import Config
 
+# Alphanumeric with possible dashes/underscores
+_API_KEY_RE = re.compile(r'^[a-zA-Z0-9_-]{20,}$')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# DOI pattern: 10.xxxx/xxxxx
+_DOI_RE = re.compile(r'^10\.\d{4,}\/[-._;()\/:a-zA-Z0-9]+$', re.ASCII)
+
+_INVALID_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"|?*\\/\r\n', '_'))
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+_QUESTION_WORDS = frozenset({
+    'what', 'how', 'why', 'when', 'where', 'who', 'which', 'does', 'do', 'is', 'are',
+    'can', 'could', 'would', 'should'
+})
+
+# Word stems so inflections ("increases", "caused") count; phrases must appear verbatim
+_TESTABLE_RE = re.compile(
+    r"\b(?:will|should|increas|decreas|affect|influenc|correlat|predict|caus|lead to|result in)"
+)
+
+_VARIABLE_WORDS = frozenset({'and', 'between'})
+
 class Validators:
     """Validation utilities for input data"""
     
@@ -26,9 +49,7 @@ class Validators:
         if api_key == "your_api_key_here_replace_this":
             return False
         
-        # Basic validation - should be alphanumeric with possible dashes/underscores
-        pattern = r'^[a-zA-Z0-9_-]{20,}$'
-        return bool(re.match(pattern, api_key))
+        return bool(_API_KEY_RE.match(api_key))
     
     @staticmethod
     def validate_file_type(filename: str) -> bool:
@@ -58,8 +79,7 @@ class Validators:
         Returns:
             True if file size is within limit
         """
-        max_size_bytes = Config.MAX_FILE_SIZE_MB * 1024 * 1024
-        return 0 < file_size_bytes <= max_size_bytes
+        return 0 < file_size_bytes <= Config.MAX_FILE_SIZE_BYTES
     
     @staticmethod
     def validate_research_question(question: str) -> Dict[str, Any]:
@@ -95,8 +115,8 @@ class Validators:
             result["suggestions"].append("Consider breaking into multiple sub-questions")
         
         # Check if it's actually a question
-        question_words = ['what', 'how', 'why', 'when', 'where', 'who', 'which', 'does', 'do', 'is', 'are', 'can', 'could', 'would', 'should']
-        if not any(word in question.lower() for word in question_words) and '?' not in question:
+        words = set(_WORD_RE.findall(question.lower()))
+        if words.isdisjoint(_QUESTION_WORDS) and '?' not in question:
             result["suggestions"].append("Consider phrasing as a clear question")
         
         return result
@@ -125,8 +145,7 @@ class Validators:
         Returns:
             True if valid email format
         """
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(_EMAIL_RE.match(email))
     
     @staticmethod
     def validate_year(year: Any) -> bool:
@@ -139,6 +158,14 @@ class Validators:
         Returns:
             True if valid year
         """
+        # Check the common types directly so dirty metadata does not raise
+        if isinstance(year, numbers.Real):
+            # Compares as int(year) would truncate; NaN and inf fail both bounds
+            return 1900 <= year < 2031
+        if isinstance(year, str):
+            year = year.strip()
+            return len(year) == 4 and year.isdecimal() and 1900 <= int(year) <= 2030
+        
         try:
             year_int = int(year)
             return 1900 <= year_int <= 2030
@@ -156,9 +183,7 @@ class Validators:
         Returns:
             True if valid DOI format
         """
-        # DOI pattern: 10.xxxx/xxxxx
-        pattern = r'^10\.\d{4,}\/[-._;()\/:a-zA-Z0-9]+$'
-        return bool(re.match(pattern, doi))
+        return bool(_DOI_RE.match(doi))
     
     @staticmethod
     def validate_hypothesis(hypothesis: str) -> Dict[str, Any]:
@@ -188,12 +213,12 @@ class Validators:
             result["issues"].append("Hypothesis is too short")
         
         # Check for testable components
-        testable_keywords = ['will', 'should', 'increase', 'decrease', 'affect', 'influence', 'correlate', 'predict', 'cause', 'lead to', 'result in']
-        if not any(keyword in hypothesis.lower() for keyword in testable_keywords):
+        hypothesis_lower = hypothesis.lower()
+        if not _TESTABLE_RE.search(hypothesis_lower):
             result["suggestions"].append("Ensure hypothesis is testable with clear predictions")
         
         # Check for variables
-        if 'and' not in hypothesis.lower() and 'between' not in hypothesis.lower():
+        if _VARIABLE_WORDS.isdisjoint(_WORD_RE.findall(hypothesis_lower)):
             result["suggestions"].append("Consider clearly stating the variables being tested")
         
         return result
@@ -213,9 +238,7 @@ class Validators:
         filename = os.path.basename(filename)
         
         # Replace problematic characters
-        invalid_chars = '<>:"|?*\\/\r\n'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
+        filename = filename.translate(_INVALID_FILENAME_CHARS)
         
         # Limit length
         name, ext = os.path.splitext(filename)